@@ -1,964 +1,81 @@
+import os
+
+import bingus_stats
+from bingus_catalog import PERFECT_SCORE
+from bingus_index import SongIndex
+
 version = "1.0 Siamese Scarlett"
 
-songs = [
-    {"title": "Midnight City", "artist": "M83", "genre": "indie", "tempo": "fast", "mood": "energetic", "style": "vintage"},
-    {"title": "Electric Feel", "artist": "MGMT", "genre": "indie", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Take Me To Church", "artist": "Hozier", "genre": "rock", "tempo": "slow", "mood": "sad", "style": "acoustic"},
-    {"title": "Some Nights", "artist": "fun.", "genre": "pop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Adventure of a Lifetime", "artist": "Coldplay", "genre": "pop", "tempo": "fast", "mood": "happy", "style": "funky"},
-    {"title": "Clocks", "artist": "Coldplay", "genre": "pop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Let It Go", "artist": "Idina Menzel", "genre": "pop", "tempo": "fast", "mood": "empowered", "style": "normal"},
-    {"title": "My Universe", "artist": "Coldplay x BTS", "genre": "pop", "tempo": "fast", "mood": "happy", "style": "funky"},
-    {"title": "Easy On Me", "artist": "Adele", "genre": "pop", "tempo": "slow", "mood": "sad", "style": "acoustic"},
-    {"title": "Perfect", "artist": "Ed Sheeran", "genre": "pop", "tempo": "slow", "mood": "romantic", "style": "acoustic"},
-    {"title": "Shape of You", "artist": "Ed Sheeran", "genre": "pop", "tempo": "fast", "mood": "happy", "style": "normal"},
-    {"title": "Castle on the Hill", "artist": "Ed Sheeran", "genre": "pop", "tempo": "fast", "mood": "nostalgic", "style": "normal"},
-    {"title": "Photograph", "artist": "Ed Sheeran", "genre": "pop", "tempo": "slow", "mood": "sad", "style": "acoustic"},
-    {"title": "Closer", "artist": "The Chainsmokers", "genre": "edm", "tempo": "fast", "mood": "happy", "style": "normal"},
-    {"title": "Don't Start Now", "artist": "Dua Lipa", "genre": "pop", "tempo": "fast", "mood": "empowered", "style": "funky"},
-    {"title": "New Rules", "artist": "Dua Lipa", "genre": "pop", "tempo": "fast", "mood": "confident", "style": "normal"},
-    {"title": "Break My Heart", "artist": "Dua Lipa", "genre": "pop", "tempo": "fast", "mood": "emotional", "style": "funky"},
-    {"title": "Waiting on a War", "artist": "Foo Fighters", "genre": "rock", "tempo": "medium", "mood": "reflective", "style": "vintage"},
-    {"title": "The Less I Know The Better", "artist": "Tame Impala", "genre": "indie", "tempo": "medium", "mood": "melancholy", "style": "funky"},
-    {"title": "Borderline", "artist": "Tame Impala", "genre": "indie", "tempo": "medium", "mood": "calm", "style": "vintage"},
-    {"title": "Lonely", "artist": "Justin Bieber", "genre": "pop", "tempo": "slow", "mood": "sad", "style": "acoustic"},
-    {"title": "Intentions", "artist": "Justin Bieber", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Ghost Town", "artist": "Benson Boone", "genre": "pop", "tempo": "slow", "mood": "sad", "style": "acoustic"},
-    {"title": "abcdefu", "artist": "GAYLE", "genre": "pop", "tempo": "fast", "mood": "angry", "style": "normal"},
-    {"title": "Numb Little Bug", "artist": "Em Beihold", "genre": "pop", "tempo": "medium", "mood": "sad", "style": "funky"},
-    {"title": "You Right", "artist": "Doja Cat", "genre": "r&b", "tempo": "medium", "mood": "chill", "style": "normal"},
-    {"title": "Vegas", "artist": "Doja Cat", "genre": "rap", "tempo": "fast", "mood": "confident", "style": "funky"},
-    {"title": "Woman", "artist": "Doja Cat", "genre": "pop", "tempo": "fast", "mood": "happy", "style": "funky"},
-    {"title": "Mood", "artist": "24kGoldn", "genre": "hip-hop", "tempo": "fast", "mood": "happy", "style": "normal"},
-    {"title": "Rockstar", "artist": "DaBaby", "genre": "hip-hop", "tempo": "fast", "mood": "angry", "style": "normal"},
-    {"title": "Goosebumps", "artist": "Travis Scott", "genre": "hip-hop", "tempo": "slow", "mood": "moody", "style": "vintage"},
-    {"title": "SICKO MODE", "artist": "Travis Scott", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Praise God", "artist": "Kanye West", "genre": "hip-hop", "tempo": "medium", "mood": "dark", "style": "vintage"},
-    {"title": "Flashing Lights", "artist": "Kanye West", "genre": "hip-hop", "tempo": "medium", "mood": "cool", "style": "vintage"},
-    {"title": "Good Morning", "artist": "Kanye West", "genre": "hip-hop", "tempo": "medium", "mood": "uplifting", "style": "vintage"},
-    {"title": "Fast Car", "artist": "Tracy Chapman", "genre": "folk", "tempo": "medium", "mood": "sad", "style": "acoustic"},
-    {"title": "Riptide", "artist": "Vance Joy", "genre": "indie", "tempo": "medium", "mood": "happy", "style": "acoustic"},
-    {"title": "Budapest", "artist": "George Ezra", "genre": "folk", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Take It All", "artist": "Adele", "genre": "soul", "tempo": "slow", "mood": "emotional", "style": "acoustic"},
-    {"title": "When I Was Your Man", "artist": "Bruno Mars", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "acoustic"},
-    {"title": "Grenade", "artist": "Bruno Mars", "genre": "pop", "tempo": "medium", "mood": "angry", "style": "normal"},
-    {"title": "Treasure", "artist": "Bruno Mars", "genre": "funk", "tempo": "fast", "mood": "happy", "style": "funky"},
-    {"title": "Mirror", "artist": "Lil Wayne", "genre": "rap", "tempo": "slow", "mood": "reflective", "style": "vintage"},
-    {"title": "Lucid Dreams", "artist": "Juice WRLD", "genre": "hip-hop", "tempo": "slow", "mood": "sad", "style": "vintage"},
-    {"title": "Come & Go", "artist": "Juice WRLD", "genre": "pop", "tempo": "fast", "mood": "emotional", "style": "normal"},
-    {"title": "Happier", "artist": "Marshmello", "genre": "edm", "tempo": "fast", "mood": "sad", "style": "normal"},
-    {"title": "Silence", "artist": "Marshmello", "genre": "edm", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Faded", "artist": "Alan Walker", "genre": "edm", "tempo": "fast", "mood": "melancholy", "style": "vintage"},
-    {"title": "Alone", "artist": "Alan Walker", "genre": "edm", "tempo": "fast", "mood": "uplifting", "style": "normal"},
-    {"title": "Runaway", "artist": "Aurora", "genre": "indie", "tempo": "slow", "mood": "dreamy", "style": "acoustic"}
-]
+# BINGUS_CATALOG=spotify_tracks.csv python bingusRUNR.py recommends from a Spotify export
+# instead of the built-in song list
+CATALOG = os.environ.get("BINGUS_CATALOG")
+
+# Nothing heavy happens at import: the catalog and index are built on first use
+_songs = None
+_index = None
+_facets = None
+_search = None
+
 
-# Part 2 (added via songs += [...])
-songs += [
-    {"title": "Playing Games", "artist": "Summer Walker", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Rottweiler", "artist": "Babycheifdoit", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Let It Happen", "artist": "Tame Impala", "genre": "indie", "tempo": "fast", "mood": "happy", "style": "vintage"},
-    {"title": "Whim Whamiee", "artist": "Pluto (feat . YK niece)", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "All I need", "artist": "Radiohead", "genre": "alternative", "tempo": "slow", "mood": "sad", "style": "vintage"},
-    {"title": "TRX", "artist": "Bloodhound Lil Jeff", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "I Bet on Losing Dogs", "artist": "Mitski", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Bobby Bitch", "artist": "Bobby Shmurda", "genre": "hip-hop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Exotic", "artist": "Bloodhound Lil Jeff x Lil Scoom89", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Episode 2", "artist": "Queen Key", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Red Leather", "artist": "Future, Metro Boomin, J.Cole", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "LoLo Félix", "artist": "Arsenal Efectivo", "genre": "alternative", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "On D Gas", "artist": "LEGADO 7", "genre": "alternative", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "life force", "artist": "ptasinski, RJ Pasin", "genre": "edm", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "Te Quer\u00eda Ver", "artist": "Alem\u00e1n & Newton Vega", "genre": "alternative", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "I-10 Baby", "artist": "YoungBoy Never Broke Again", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Seven Nation Army", "artist": "The White Stripes", "genre": "rock", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "\ub9c8\ub9ac\uc544 (Maria)", "artist": "Hwasa", "genre": "k-pop", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Spread Thin", "artist": "Mariah the Scientist", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "10s", "artist": "Pantera", "genre": "rock", "tempo": "slow", "mood": "energetic", "style": "acoustic"},
-    {"title": "G.H.I.F", "artist": "Rylo Rodriguez", "genre": "hip-hop", "tempo": "fast", "mood": "calm", "style": "normal"},
-    {"title": "Like Him", "artist": "Tyler, The Creator", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Shooting stars", "artist": "Bag raiders", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Im so sick", "artist": "Flyleaf", "genre": "alternative", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "WILDFLOWER", "artist": "Billie Eilish", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Making love", "artist": "Treety", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Risk", "artist": "Deftones", "genre": "alternative", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "The Cut That Always Bleeds", "artist": "Conan Gray", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "This love", "artist": "Pantera", "genre": "rock", "tempo": "slow", "mood": "calm", "style": "acoustic"},
-    {"title": "Cherry Scented", "artist": "Jack Off Jill", "genre": "alternative", "tempo": "fast", "mood": "energetic", "style": "vintage"},
-    {"title": "Nobody", "artist": "Mitski", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Peace Hardly", "artist": "YoungBoy Never Broke Again", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "The Distance", "artist": "NoCap", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Panoramic", "artist": "YoungBoy Never Broke Again", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Street Runner", "artist": "Rod Wave", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Floods", "artist": "Pantera", "genre": "rock", "tempo": "slow", "mood": "calm", "style": "acoustic"},
-    {"title": "TONYA", "artist": "BROCKHAMPTON", "genre": "hip-hop", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "On My Side", "artist": "YoungBoy Never Broke Again", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Okay", "artist": "YoungBoy Never Broke Again", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "RIp Lil Phat", "artist": "YoungBoy Never Broke Again", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Bring 'Em Out", "artist": "YoungBoy Never Broke Again", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Chanel", "artist": "Frank Ocean", "genre": "r&b", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Light Shower", "artist": "Melanie Martienez", "genre": "alternative", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "The law of recognition", "artist": "KYSLINGO", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Being Honest", "artist": "Kay Flock", "genre": "hip-hop", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Creep", "artist": "Radiohead", "genre": "alternative", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "before I close my eyes", "artist": "xxxtentacion", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Nun", "artist": "FullyChop/w Quan Get'Em Gone", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "SEE YU UP", "artist": "BABY MEL", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "skinny", "artist": "billie eilish", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "The game goes on", "artist": "DJ screw", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Breezeblocks", "artist": "Alt-J", "genre": "alternative", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Wavelength", "artist": "Whirr", "genre": "alternative", "tempo": "slow", "mood": "happy", "style": "normal"},
-    {"title": "Lose Control", "artist": "Teddy Swims", "genre": "pop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Grand Opening", "artist": "laila", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Thug Motivation", "artist": "Rod Wave", "genre": "hip-hop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "HAY LUPITA", "artist": "Lomiiel", "genre": "pop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Violent Crimes", "artist": "Kanye West", "genre": "hip-hop", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Birds Of A Feather", "artist": "Billie Eilish", "genre": "pop", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Way Less Sad", "artist": "AJR", "genre": "pop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Chest pain", "artist": "Malcom Todd", "genre": "alternative", "tempo": "slow", "mood": "sad", "style": "acoustic"},
-    {"title": "come see me", "artist": "Jill scott", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "acoustic"},
-    {"title": "Pride", "artist": "Kendrick Lamar", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Brent fiyaz", "artist": "The weekend", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Bk the rula", "artist": "Tink", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "MVB", "artist": "Diamond The Body", "genre": "r&b", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Greece or Sweden", "artist": "Nocap", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "not allowed", "artist": "Tv girls", "genre": "alternative", "tempo": "fast", "mood": "sad", "style": "vintage"},
-    {"title": "Infatuation", "artist": "Jamie Foxx", "genre": "r&b", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "El Apag\u00f3n", "artist": "Bad Bunny", "genre": "latin", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Snapback", "artist": "4 count", "genre": "hip-hop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Blueberry Faygo", "artist": "Lil Mosey", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "acoustic"},
-    {"title": "Judge the jury", "artist": "NoCap", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "say yes", "artist": "floetry", "genre": "soul", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Wassup", "artist": "Laila!", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Want 2", "artist": "Laila!", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Keep Me Waiting", "artist": "NoCap", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "on & on", "artist": "Erykah Badu", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Some of your love", "artist": "PartyNextDoor", "genre": "r&b", "tempo": "slow", "mood": "happy", "style": "normal"},
-    {"title": "Gemini Love", "artist": "LUCKI", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Rolling in the Deep", "artist": "Adele", "genre": "pop", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Cupid's Chokehold / Breakfast in America", "artist": "Gym Class Heroes", "genre": "alternative", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Sneaking", "artist": "Youngboy", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Ascension (Don't Ever Wonder)", "artist": "Maxwell", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "oscar winning tears", "artist": "RAYE", "genre": "pop", "tempo": "fast", "mood": "energetic", "style": "vintage"},
-    {"title": "No Cup", "artist": "Ivori Babu", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "No ordinary love", "artist": "Sade", "genre": "r&b", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Don't Threaten Me With a Good TIme", "artist": "Panic! At The Disco", "genre": "alternative", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "ready for love", "artist": "india.Arie", "genre": "soul", "tempo": "slow", "mood": "calm", "style": "acoustic"},
-    {"title": "Drug Addiction", "artist": "YoungBoy Never Broke Again", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Next To You", "artist": "Bryson Tiller", "genre": "r&b", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Gonna Love Me", "artist": "Teyana Taylor", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Catch A B", "artist": "MAF Teeski", "genre": "r&b", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "Joy", "artist": "black street", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Swept", "artist": "ST6 JodyBoof", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "acoustic"},
-    {"title": "Lotus Flower Bomb", "artist": "Wale ft. Miguel", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Sorry not sorry", "artist": "Bryson Tiller", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "We Should", "artist": "Lil baby", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "crush", "artist": "Yuna ft. Usher", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "How bout now", "artist": "Bryson tiller", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Heavy", "artist": "The Marias", "genre": "alternative", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Other Side of the Game", "artist": "Erykah Badu", "genre": "soul", "tempo": "slow", "mood": "calm", "style": "funky"},
-    {"title": "Helena", "artist": "My Chemical Romance", "genre": "alternative", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "30 For 30", "artist": "SZA and Kendrick Lamar", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Pretty Wings", "artist": "Maxwell", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "vintage"},
-    {"title": "Everybody Talks", "artist": "Neon Trees", "genre": "indie", "tempo": "fast", "mood": "happy", "style": "funky"},
-    {"title": "The way", "artist": "Jill scott", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Don't", "artist": "Bryson Tiller", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Baddie Slide", "artist": "tink", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Lady", "artist": "D'Angelo", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Exchange", "artist": "Bryson Tiller", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Saturn", "artist": "SZA", "genre": "r&b", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Mi Nube city", "artist": "Jauria Santa", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Golden", "artist": "Jill scott", "genre": "soul", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "nuts", "artist": "lil peep", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "vintage"},
-    {"title": "Get It Together", "artist": "India.Arie", "genre": "soul", "tempo": "slow", "mood": "calm", "style": "acoustic"},
-    {"title": "I cant help it", "artist": "Michael Jackson", "genre": "r&b", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "R U Mine?", "artist": "Arctic Monkeys", "genre": "rock", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Brown skin", "artist": "India.Arie", "genre": "soul", "tempo": "slow", "mood": "calm", "style": "acoustic"},
-    {"title": "Nobody Gets Me", "artist": "SZA", "genre": "rock", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "drive ME crazy!", "artist": "Lil Yachty", "genre": "alternative", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Sweet love", "artist": "Anita Baker", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Can't Leave Drank Alone", "artist": "Z-Ro", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Line it up", "artist": "diamond the body", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Nite and Day", "artist": "AI B. Sure!", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Iron Man", "artist": "Black Sabbath", "genre": "rock", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Load up", "artist": "Raq baby", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Flower bomb", "artist": "Wale ft. Miguel", "genre": "r&b", "tempo": "fast", "mood": "happy", "style": "normal"},
-    {"title": "Cherish the day", "artist": "Sade", "genre": "r&b", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "War", "artist": "Chief Keef", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Eyes Without a Face", "artist": "Billy Idol", "genre": "rock", "tempo": "medium", "mood": "sad", "style": "vintage"},
-    {"title": "jugaste y sufri", "artist": "DannyLux", "genre": "soul", "tempo": "fast", "mood": "sad", "style": "vintage"},
-    {"title": "Mind of a Souljah", "artist": "Bone Thugs-n-Harmony", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Thinkin Bout You", "artist": "Frank Ocean", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Pink + White", "artist": "Frank Ocean", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "acoustic"},
-    {"title": "We all try", "artist": "Frank Ocean", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Wake n' Bake", "artist": "Kodak Black", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Bad Religion", "artist": "Frank Ocean", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Save me", "artist": "Bak jay", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "acoustic"},
-    {"title": "Sierra Leone", "artist": "Frank Ocean", "genre": "soul", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Vienna", "artist": "Billy Joel", "genre": "rock", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Neverita", "artist": "Bad Bunny", "genre": "latin", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Godspeed", "artist": "Frank Ocean", "genre": "soul", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "what tink do?", "artist": "tink", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Pilot Jones", "artist": "Frank Ocean", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "30", "artist": "Jaeychino", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "acoustic"},
-    {"title": "Gooey", "artist": "Glass Animals", "genre": "alternative", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "whim whamiee", "artist": "big pluto", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Helmet", "artist": "Steve Lacy", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "ILBB2", "artist": "Jorjiana", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Tatuajes", "artist": "Ivan Cornejo", "genre": "latin", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Mia Khalifa", "artist": "iLOVEFRiDAY", "genre": "alternative", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Is It Really You", "artist": "Loathe", "genre": "rock", "tempo": "medium", "mood": "sad", "style": "funky"},
-    {"title": "Lost", "artist": "Frank Ocean", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Best part", "artist": "Daniel Caesar", "genre": "soul", "tempo": "slow", "mood": "happy", "style": "normal"},
-    {"title": "crains in the sky", "artist": "solange knowles", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "White Ferrari", "artist": "Frank Ocean", "genre": "soul", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Eres Mia", "artist": "Romeo Santos", "genre": "latin", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Self Control", "artist": "Frank Ocean", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "i love freak", "artist": "lil tjay", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "acoustic"},
-    {"title": "Cake", "artist": "Melanie Martinez", "genre": "alternative", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Eres Mia", "artist": "Romeo Santos", "genre": "latin", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Ivy", "artist": "Frank Ocean", "genre": "soul", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Nights", "artist": "Frank Ocean", "genre": "soul", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "No Me Queda Mas", "artist": "Selena", "genre": "latin", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Novacane", "artist": "Frank Ocean", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Swim Good", "artist": "Frank Ocean", "genre": "soul", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Super Rich Kids", "artist": "Frank Ocean", "genre": "soul", "tempo": "slow", "mood": "energetic", "style": "normal"},
-    {"title": "Cayendo", "artist": "Frank Ocean", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "acoustic"},
-    {"title": "Since U Been Gone", "artist": "Kelly Clarkson", "genre": "pop", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "You're the Only Good Thing in My Life", "artist": "Cigarettes After Sex", "genre": "alternative", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Safe With Me", "artist": "Gryffin", "genre": "pop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "August 10", "artist": "Julie Doiron", "genre": "alternative", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Animal I Have Become", "artist": "Three Days Grace", "genre": "alternative", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Baby Please", "artist": "Ivan Cornejo", "genre": "latin", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Who's That Chick", "artist": "Rihanna", "genre": "pop", "tempo": "fast", "mood": "happy", "style": "normal"},
-    {"title": "Sober Up", "artist": "AJR", "genre": "pop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "The Monster", "artist": "Rihanna", "genre": "hip-hop", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "no chill", "artist": "PARTYNEXTDOOR", "genre": "r&b", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "LA CANCION", "artist": "J Balvin & Bad Bunny", "genre": "latin", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Lollipop (Candyman)", "artist": "Aqua", "genre": "pop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Like a Boy", "artist": "Ciara", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Vete", "artist": "Bad Bunny", "genre": "latin", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Strange", "artist": "LP", "genre": "indie", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "deja vu", "artist": "olivia rodrigo", "genre": "pop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Like A Stone", "artist": "Audioslave", "genre": "alternative", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "La-La Means I Love You", "artist": "The Delfonics", "genre": "soul", "tempo": "slow", "mood": "happy", "style": "acoustic"},
-    {"title": "Here With Me", "artist": "Marshmello", "genre": "edm", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Wishing On a Star", "artist": "Rose Royce", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "BFF", "artist": "Slayyyter", "genre": "pop", "tempo": "fast", "mood": "happy", "style": "normal"},
-    {"title": "Sleep Well", "artist": "D4vd", "genre": "alternative", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Fancy", "artist": "TWICE", "genre": "k-pop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "SHOOTING STAR", "artist": "XG", "genre": "k-pop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Muse", "artist": "PARTYNEXTDOOR", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Expensive Pain", "artist": "Screwly G", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "White ferrari", "artist": "Frank Ocean", "genre": "r&b", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Sometimes", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "fast", "mood": "sad", "style": "normal"},
-    {"title": "Playing games", "artist": "Summer walker", "genre": "r&b", "tempo": "fast", "mood": "calm", "style": "normal"},
-    {"title": "Gang Over Luv", "artist": "Brent Faiyaz", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Empty Out Your Pockets", "artist": "Juice Wrld", "genre": "edm", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Knocked Off", "artist": "Youngboy Never Broke Again", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Prblms", "artist": "6LACK", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Portabella", "artist": "Young Nudy", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "bout it", "artist": "liv.e", "genre": "r&b", "tempo": "slow", "mood": "calm", "style": "funky"},
-    {"title": "Back To the South", "artist": "Zillionare Doe", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Sorry Not Sorry", "artist": "Tyler the creator", "genre": "pop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Lovely", "artist": "Sonder", "genre": "r&b", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Already Dead", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Barbarian", "artist": "Juice Wrld", "genre": "edm", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "48 laws power", "artist": "Hunxo", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Complicated", "artist": "Nivea", "genre": "r&b", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Pink + White", "artist": "Frank Ocean", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "2 MILLION UP", "artist": "PEEZY", "genre": "hip-hop", "tempo": "slow", "mood": "energetic", "style": "normal"},
-    {"title": "Let you", "artist": "Iann Dior", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Party By Myself", "artist": "Juice Wrld", "genre": "edm", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Robbery", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Never finsh", "artist": "Daeyo", "genre": "hip-hop", "tempo": "slow", "mood": "energetic", "style": "acoustic"},
-    {"title": "Make Believe", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "fast", "mood": "calm", "style": "normal"},
-    {"title": "No Good", "artist": "Juice Wrld", "genre": "edm", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Thousand Miles", "artist": "The Kid Laroi", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Bad Energy", "artist": "Juice Wrld", "genre": "edm", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Maze", "artist": "Juice Wrld", "genre": "edm", "tempo": "fast", "mood": "sad", "style": "normal"},
-    {"title": "Respect My Cryppn", "artist": "Blueface", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Used To", "artist": "Juice Wrld", "genre": "edm", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Stay", "artist": "The Kid Laroi", "genre": "pop", "tempo": "medium", "mood": "energetic", "style": "acoustic"},
-    {"title": "1400/999 Freestyle", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Pyramids", "artist": "Blonded", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Wishing Well", "artist": "Juice Wrld", "genre": "edm", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Adore You", "artist": "Juice Wrld", "genre": "edm", "tempo": "slow", "mood": "happy", "style": "normal"},
-    {"title": "End Of The Road", "artist": "Juice Wrld", "genre": "edm", "tempo": "fast", "mood": "sad", "style": "normal"},
-    {"title": "Dark Red", "artist": "Steve Lacy", "genre": "r&b", "tempo": "medium", "mood": "sad", "style": "funky"},
-    {"title": "Fast", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Matt Hardy 999", "artist": "Trippie Red", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "My Ordinary Life", "artist": "The Living Tombstones", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "505", "artist": "Arctic Monkeys", "genre": "indie", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "The Light", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "All Girls Are The Same", "artist": "Juice Wrld", "genre": "edm", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Sticky", "artist": "Drake", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "No Wind Resistance!", "artist": "Kinneret", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "My X was Poison", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Notion", "artist": "The Rare Occasions", "genre": "alternative", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "On Hold", "artist": "The xx", "genre": "alternative", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Bandit", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Jumbotron Shit Poppin", "artist": "Drake", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "In my head", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Euphoria", "artist": "Kendrick Lamar", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "Fine China", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Sunflower (Spiderman: Into the Spider-Verse)", "artist": "Post Malone & Swae Lee", "genre": "hip-hop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Dark thoughts", "artist": "Lil Tecca", "genre": "hip-hop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "KTM Drip", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Cuffed", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "Sweater Weather", "artist": "The Neighborhood", "genre": "alternative", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Went deaf", "artist": "Nocap", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Celebrate", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Oxycodone", "artist": "Juice Wrld", "genre": "edm", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Ransom", "artist": "Lil tecca", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Love Letter", "artist": "Juice Wrld", "genre": "edm", "tempo": "fast", "mood": "happy", "style": "normal"},
-    {"title": "Riot", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "One more summer", "artist": "Nocap", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Come and Go", "artist": "Juice Wrld", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "World Tour (Aquafina)", "artist": "Juice Wrld", "genre": "edm", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Sweet Thing (feat. Chaka Khan)", "artist": "Rufus", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "I Wanna Be Yours", "artist": "Arctic Monkeys", "genre": "pop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Burn", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Banking On Me", "artist": "Gunna", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Lucid Dreams", "artist": "Juice Wrld", "genre": "edm", "tempo": "fast", "mood": "sad", "style": "normal"},
-    {"title": "Righteous", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Better Off", "artist": "Yeat", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "All the stars", "artist": "Kendrick Lamar", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "No More Talk", "artist": "Yeat", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "SMH", "artist": "Young dolph", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Heart To Heart", "artist": "Mac DeMarco", "genre": "indie", "tempo": "slow", "mood": "happy", "style": "normal"},
-    {"title": "I Want It", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Timeless", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Stay", "artist": "Rihanna", "genre": "r&b", "tempo": "slow", "mood": "sad", "style": "acoustic"},
-    {"title": "End of the road", "artist": "Rylo Rodriguez", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Smile", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Preach", "artist": "Young dolph", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Hereditary", "artist": "JID", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "funky"},
-    {"title": "After Hours", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Timeless", "artist": "Playboicarti", "genre": "soul", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "After Dark", "artist": "Mr. Kitty", "genre": "pop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Ghetto Angels", "artist": "NoCap", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Perk talk", "artist": "Lil Double 0", "genre": "hip-hop", "tempo": "fast", "mood": "happy", "style": "normal"},
-    {"title": "Toronto 2014(with Mustafa)", "artist": "Daniel Caesar", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "acoustic"},
-    {"title": "Documentary", "artist": "YFN Lucci", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Blinding Light", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Bad Vibes Forever", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Legends", "artist": "Juice Wrld", "genre": "edm", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Die For You", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Rockstar satus", "artist": "Lil Double 0", "genre": "hip-hop", "tempo": "fast", "mood": "happy", "style": "funky"},
-    {"title": "SS", "artist": "Ken Carson", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "RUSSIAN ROULETTE(I ADORE U)", "artist": "millkzy", "genre": "hip-hop", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Freaks", "artist": "Surf Freaks", "genre": "pop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Gasoline", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Black & White", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "fast", "mood": "happy", "style": "normal"},
-    {"title": "Pipe Down", "artist": "Drake", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Dancing in the Flames", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Dream Girl", "artist": "8percent", "genre": "pop", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Blew My High", "artist": "Chief Keef", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "Dirty thug", "artist": "NBA youngboy", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Bad Boy", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "The Hills", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Burn", "artist": "Juice Wrld", "genre": "soul", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Chamber of Reflection", "artist": "Mac DeMarco", "genre": "indie", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "WHO U LOVE", "artist": "Babyxsosa", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "Less Than Zero", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "calm", "style": "acoustic"},
-    {"title": "Jaded", "artist": "Drake", "genre": "r&b", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Carter son", "artist": "NBA youngboy", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Cardigan", "artist": "Don Toliver", "genre": "pop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Look At Me", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Kickstand", "artist": "NBA youngboy", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Hurricane", "artist": "The Weeknd", "genre": "pop", "tempo": "slow", "mood": "calm", "style": "acoustic"},
-    {"title": "Young", "artist": "Vacations", "genre": "indie", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Sky Walker", "artist": "Miguel", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "All Eyes On Me", "artist": "Tu Pac", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Riptide", "artist": "Vance Joy", "genre": "indie", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Hide", "artist": "Juice Wrld", "genre": "edm", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Always Forever", "artist": "Cults", "genre": "indie", "tempo": "slow", "mood": "happy", "style": "normal"},
-    {"title": "Sport mode", "artist": "NBA youngboy", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Blue Hair", "artist": "TV Girl", "genre": "indie", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "No More Talk", "artist": "Yeat", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Man Of The Year", "artist": "Juice Wrld", "genre": "edm", "tempo": "fast", "mood": "happy", "style": "normal"},
-    {"title": "Heavy on my heart", "artist": "Lucki", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Time out", "artist": "NBA youngboy", "genre": "pop", "tempo": "fast", "mood": "calm", "style": "normal"},
-    {"title": "Never", "artist": "XXXTENTACION", "genre": "soul", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Heartless", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Chaka Khan", "artist": "TiaCorine", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "Money", "artist": "The Drums", "genre": "rock", "tempo": "fast", "mood": "happy", "style": "funky"},
-    {"title": "So What?", "artist": "Anycia", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Valentine", "artist": "XXXTENTACION", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Can't Feel My Face", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "For the First Time", "artist": "Mac DeMarco", "genre": "pop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "What You Need", "artist": "Don Toliver", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Scared Of Love", "artist": "Juice Wrld", "genre": "edm", "tempo": "fast", "mood": "sad", "style": "normal"},
-    {"title": "Ice Hotel", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Sacrifice", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "I don't wanna do this anymore", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Roses", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "TATTI", "artist": "Bktherula", "genre": "alternative", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Something About You", "artist": "Eyedress & Dent May", "genre": "hip-hop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "SAD", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "BAD", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "We Still Don't Trust You", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Fine shit", "artist": "Nocap (Feat.Rob49)", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Wasted", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Rom-Com Gone Wrong", "artist": "Matt Maltese", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Condone it", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Fready vs Jason", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "fast", "mood": "calm", "style": "normal"},
-    {"title": "Is There Someone Else?", "artist": "The Weeknd", "genre": "pop", "tempo": "slow", "mood": "calm", "style": "funky"},
-    {"title": "From The Start", "artist": "Laufey", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Radar", "artist": "Nocap", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Mess", "artist": "Lil Wayne", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "False Alarm", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Soulfood", "artist": "redveil", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "acoustic"},
-    {"title": "Blind lights", "artist": "Nocap", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "I'll Be Fine", "artist": "Juice Wrld", "genre": "edm", "tempo": "fast", "mood": "calm", "style": "normal"},
-    {"title": "The Remedy", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Stressed Out", "artist": "twenty one pilots", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Never Quit", "artist": "Yeat", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Easter pink", "artist": "Nocap (Feat.Lo shimmy)", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Feel Alone", "artist": "Juice Wrld", "genre": "edm", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Too Late", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Safe route", "artist": "Lo shimmy", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Come & Go", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "fast", "mood": "calm", "style": "normal"},
-    {"title": "Wake Up", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Get it Right", "artist": "Keshawn Willams", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Faith", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Die For It", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Floral & Fading", "artist": "Pierce The Veil", "genre": "rock", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Maybach Curtains", "artist": "Lo shimmy", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Dancin", "artist": "Aaron Smith & Krono", "genre": "pop", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "King For A Day", "artist": "Pierce The Veil", "genre": "rock", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Bad Habbit", "artist": "Steve Lacy", "genre": "r&b", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Circus Maximus", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "golden hour", "artist": "JVKE", "genre": "pop", "tempo": "fast", "mood": "happy", "style": "normal"},
-    {"title": "All my life", "artist": "Lo shimmy", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Creepin", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Bass Santana", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Leave in", "artist": "Lo shimmy", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Hold On Till May", "artist": "Pierce The Veil", "genre": "rock", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Cry For Me", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Off The Wall", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "I\u00b4m Still Standing", "artist": "Elton John", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Out Of Time", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "King Of the Dead", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "Counting Stars", "artist": "OneRepublic", "genre": "pop", "tempo": "fast", "mood": "happy", "style": "funky"},
-    {"title": "Teenagers", "artist": "My Chemical Romance", "genre": "rock", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Alone Again", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Thank You for the Venom", "artist": "My Chemical Romance", "genre": "rock", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Rip Roach", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Brick!", "artist": "gucci mane", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "I Feelin Coming", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "King", "artist": "XXXTENTACION", "genre": "rock", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Bling-Bang-Bang-Born", "artist": "Creepy Nuts", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "In Your Eyes", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Selfish", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Best Friends", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Cemetery Drive", "artist": "My Chemical Romance", "genre": "rock", "tempo": "fast", "mood": "sad", "style": "normal"},
-    {"title": "Selfish", "artist": "Pbn rock", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Reminder", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "I Never Told You What I Do for a Living", "artist": "My chemical Romance", "genre": "rock", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "It\u00b4s Going Down Now", "artist": "Azumi Takahashi , Lotus Juice & ATLUS Sound Team", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "Love Your Self", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Scared To Live", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Difference", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Helena", "artist": "My Chemical Romance", "genre": "rock", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Changes", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Basics in Behaviour", "artist": "The Living Tombstone", "genre": "indie", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "I'm Not Okay (I Promise)", "artist": "My Chemical Romance", "genre": "rock", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "How Do I Make You Love Me?", "artist": "The Weeknd", "genre": "r&b", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "Do you Know the Way", "artist": "XXXTENTACION", "genre": "soul", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Alone Part 3", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Sunroof", "artist": "Nicky Youre & hey daisy", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "funky"},
-    {"title": "Pookie Lean", "artist": "42 brook", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "Very Rare Freestyle", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Until I Bleed Out", "artist": "The Weeknd", "genre": "r&b", "tempo": "fast", "mood": "calm", "style": "funky"},
-    {"title": "Messages from the Stars", "artist": "The Rah Band", "genre": "pop", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "Tears In The Rain", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Sinners", "artist": "Rod Wave", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Secrets", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Lost In Love", "artist": "Rod Wave", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Rockin", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Mike", "artist": "Rod Wave", "genre": "soul", "tempo": "slow", "mood": "happy", "style": "normal"},
-    {"title": "Elaphant", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "No Mercy (feat. BlackGryph0n & LittleJayneyCakes", "artist": "The Living Tombstone", "genre": "pop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "It's over", "artist": "Lil Double 0", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "OK shawty", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Angel With An Attitude", "artist": "Rod Wave", "genre": "soul", "tempo": "slow", "mood": "happy", "style": "normal"},
-    {"title": "RUN UP", "artist": "XXXTENATCION", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Westside Connection", "artist": "Rod wave", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Woah", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "WanderLust", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Jocleyn Floreas", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "BLASTED", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Party Monster", "artist": "The Weeknd", "genre": "pop", "tempo": "slow", "mood": "calm", "style": "funky"},
-    {"title": "Love For You", "artist": "LOVELI LORI & ovg!", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Floor It", "artist": "Juice Wrld", "genre": "edm", "tempo": "medium", "mood": "calm", "style": "normal"},
-    {"title": "Train Food", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Doom", "artist": "Juice Wrld", "genre": "edm", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "The Hill (Remix)", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Human", "artist": "Rag'n'Bone Man", "genre": "soul", "tempo": "medium", "mood": "energetic", "style": "funky"},
-    {"title": "Relocate", "artist": "Juice Wrld", "genre": "edm", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "777", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "The Morning", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "H2O", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Empty", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Love Me Harder", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Double Life", "artist": "Pharrel Williams", "genre": "hip-hop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Earned It", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Legendary", "artist": "rio da yung og", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Hate The Other Side", "artist": "Juice Wrld", "genre": "hip-hop", "tempo": "fast", "mood": "calm", "style": "normal"},
-    {"title": "Prayed For Me", "artist": "The Weeknd", "genre": "pop", "tempo": "medium", "mood": "happy", "style": "acoustic"},
-    {"title": "Str8 Shot", "artist": "XXXTENTACION", "genre": "hip-hop", "tempo": "slow", "mood": "calm", "style": "normal"},
-    {"title": "I Am the Grinch (feat. Fletcher Jones)", "artist": "Tyler, The Creator", "genre": "hip-hop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Live For", "artist": "The Weeknd", "genre": "r&b", "tempo": "medium", "mood": "calm", "style": "funky"},
-    {"title": "Revenge", "artist": "XXXTENTACION", "genre": "r&b", "tempo": "medium", "mood": "sad", "style": "normal"},
-    {"title": "Talkin crazy", "artist": "rio da yung og", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Rio Free", "artist": "rio da yung og", "genre": "hip-hop", "tempo": "fast", "mood": "happy", "style": "normal"}
-]
+def get_songs():
+    """Song catalog, imported and cleaned up the first time it is needed"""
+    global _songs
+    if _songs is None:
+        with bingus_stats.timer("load"):
+            from bingus_clean import clean_songs
+            if CATALOG:
+                from bingus_csv import iter_csv_songs
+                # Streamed row by row, and the export already carries each song's popularity
+                _songs = list(clean_songs(iter_csv_songs(CATALOG)))
+            else:
+                from bingus_popularity import attach_popularity
+                from bingus_songs import songs
+                # Fold artist spellings and drop repeated songs so they don't fill the top 10 twice
+                _songs = list(clean_songs(songs))
+                # Spotify popularity decides between songs with the same score (0 if Spotify doesn't know it)
+                attach_popularity(_songs)
+    return _songs
 
-# Part 3 (the songs list assigned to variable 'songs')
-songs += [
-    {"title": "Save Your Tears", "artist": "The Weeknd", "genre": "pop", "tempo": "fast", "mood": "sad", "style": "normal"},
-    {"title": "Blinding Lights", "artist": "The Weeknd", "genre": "pop", "tempo": "fast", "mood": "happy", "style": "vintage"},
-    {"title": "Someone Like You", "artist": "Adele", "genre": "pop", "tempo": "slow", "mood": "sad", "style": "acoustic"},
-    {"title": "Uptown Funk", "artist": "Bruno Mars", "genre": "funk", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "drivers license", "artist": "Olivia Rodrigo", "genre": "pop", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Shake It Off", "artist": "Taylor Swift", "genre": "pop", "tempo": "fast", "mood": "happy", "style": "normal"},
-    {"title": "Circles", "artist": "Post Malone", "genre": "hip-hop", "tempo": "medium", "mood": "calm", "style": "acoustic"},
-    {"title": "Levitating", "artist": "Dua Lipa", "genre": "pop", "tempo": "fast", "mood": "energetic", "style": "funky"},
-    {"title": "bad guy", "artist": "Billie Eilish", "genre": "pop", "tempo": "medium", "mood": "sad", "style": "vintage"},
-    {"title": "Sunflower", "artist": "Post Malone", "genre": "hip-hop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Let It Happen", "artist": "Tame Impala", "genre": "indie", "tempo": "fast", "mood": "happy", "style": "vintage"},
-    {"title": "Rottweiler", "artist": "Babycheifdoit", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Let It Happen", "artist": "Tame Impala", "genre": "indie", "tempo": "fast", "mood": "happy", "style": "vintage"},
-    {"title": "Whim Whamiee", "artist": "Pluto (feat . YK niece)", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "All I need", "artist": "Radiohead", "genre": "alternative", "tempo": "slow", "mood": "sad", "style": "vintage"},
-    {"title": "TRX", "artist": "Bloodhound Lil Jeff", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "I Bet on Losing Dogs ", "artist": "Mitski", "genre": "soul", "tempo": "slow", "mood": "sad", "style": "normal"},
-    {"title": "Bobby Bitch", "artist": "Bobby Shmurda", "genre": "hip-hop", "tempo": "medium", "mood": "happy", "style": "normal"},
-    {"title": "Exotic", "artist": "Bloodhound Lil Jeff x Lil Scoom89", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "Episode 2", "artist": "Queen Key", "genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"},
-    {"title": "Red Leather", "artist": "Future, Metro Boomin, J.Cole", "genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
-    {"title": "LoLo F\u00e9lix", "artist": "Arsenal Efectivo", "genre": "alternative", "tempo": "fast", "mood": "energetic", "style": "normal"}
-]
 
-# Additional Pop
-songs += [
-    {'title': 'As It Was', 'artist': 'Harry Styles', 'genre': 'pop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Shivers', 'artist': 'Ed Sheeran', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Watermelon Sugar', 'artist': 'Harry Styles', 'genre': 'pop', 'tempo': 'slow', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'Positions', 'artist': 'Ariana Grande', 'genre': 'pop', 'tempo': 'slow', 'mood': 'happy', 'style': 'vintage'},
-    {'title': 'Peaches', 'artist': 'Justin Bieber', 'genre': 'pop', 'tempo': 'medium', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Good 4 U', 'artist': 'Olivia Rodrigo', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': "Don't Start Now", 'artist': 'Dua Lipa', 'genre': 'pop', 'tempo': 'fast', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'MONTERO (Call Me By Your Name)', 'artist': 'Lil Nas X', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Save Your Tears', 'artist': 'The Weeknd', 'genre': 'pop', 'tempo': 'medium', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'About Damn Time', 'artist': 'Lizzo', 'genre': 'pop', 'tempo': 'fast', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'Stay', 'artist': 'The Kid LAROI & Justin Bieber', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Break My Soul', 'artist': 'Beyoncé', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Flowers', 'artist': 'Miley Cyrus', 'genre': 'pop', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Anti-Hero', 'artist': 'Taylor Swift', 'genre': 'pop', 'tempo': 'medium', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Bad Habit', 'artist': 'Steve Lacy', 'genre': 'pop', 'tempo': 'slow', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'Heat Waves', 'artist': 'Glass Animals', 'genre': 'pop', 'tempo': 'slow', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Kiss Me More', 'artist': 'Doja Cat', 'genre': 'pop', 'tempo': 'medium', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'Drivers License', 'artist': 'Olivia Rodrigo', 'genre': 'pop', 'tempo': 'slow', 'mood': 'sad', 'style': 'acoustic'},
-    {'title': 'Unholy', 'artist': 'Sam Smith & Kim Petras', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Ghost', 'artist': 'Justin Bieber', 'genre': 'pop', 'tempo': 'medium', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'Easy On Me', 'artist': 'Adele', 'genre': 'pop', 'tempo': 'slow', 'mood': 'sad', 'style': 'acoustic'},
-    {'title': "That's What I Want", 'artist': 'Lil Nas X', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Boyfriend', 'artist': 'Dove Cameron', 'genre': 'pop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Vampire', 'artist': 'Olivia Rodrigo', 'genre': 'pop', 'tempo': 'slow', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'Deja Vu', 'artist': 'Olivia Rodrigo', 'genre': 'pop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Stuck with U', 'artist': 'Ariana Grande & Justin Bieber', 'genre': 'pop', 'tempo': 'slow', 'mood': 'happy', 'style': 'acoustic'},
-    {'title': 'Intentions', 'artist': 'Justin Bieber', 'genre': 'pop', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Circles', 'artist': 'Post Malone', 'genre': 'pop', 'tempo': 'medium', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Sunroof', 'artist': 'Nicky Youre & dazy', 'genre': 'pop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'abcdefu', 'artist': 'GAYLE', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'My Universe', 'artist': 'Coldplay & BTS', 'genre': 'pop', 'tempo': 'fast', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'Say So', 'artist': 'Doja Cat', 'genre': 'pop', 'tempo': 'medium', 'mood': 'funky', 'style': 'normal'},
-    {'title': 'No Tears Left To Cry', 'artist': 'Ariana Grande', 'genre': 'pop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Adore You', 'artist': 'Harry Styles', 'genre': 'pop', 'tempo': 'slow', 'mood': 'happy', 'style': 'acoustic'},
-    {'title': 'Señorita', 'artist': 'Shawn Mendes & Camila Cabello', 'genre': 'pop', 'tempo': 'slow', 'mood': 'happy', 'style': 'vintage'},
-    {'title': 'Dance The Night', 'artist': 'Dua Lipa', 'genre': 'pop', 'tempo': 'fast', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'Victoria’s Secret', 'artist': 'Jax', 'genre': 'pop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Bejeweled', 'artist': 'Taylor Swift', 'genre': 'pop', 'tempo': 'medium', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'Love Again', 'artist': 'Dua Lipa', 'genre': 'pop', 'tempo': 'medium', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Good Time', 'artist': 'Owl City & Carly Rae Jepsen', 'genre': 'pop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Shut Up and Dance', 'artist': 'WALK THE MOON', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Call Me Maybe', 'artist': 'Carly Rae Jepsen', 'genre': 'pop', 'tempo': 'fast', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'Cool for the Summer', 'artist': 'Demi Lovato', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Glitter', 'artist': 'Benee', 'genre': 'pop', 'tempo': 'slow', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'Never Really Over', 'artist': 'Katy Perry', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Sweet But Psycho', 'artist': 'Ava Max', 'genre': 'pop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'This Is What You Came For', 'artist': 'Calvin Harris ft. Rihanna', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'How Do You Sleep?', 'artist': 'Sam Smith', 'genre': 'pop', 'tempo': 'medium', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'Attention', 'artist': 'Charlie Puth', 'genre': 'pop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Closer', 'artist': 'The Chainsmokers ft. Halsey', 'genre': 'pop', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Shake It Off', 'artist': 'Taylor Swift', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Love Me Like You Do', 'artist': 'Ellie Goulding', 'genre': 'pop', 'tempo': 'medium', 'mood': 'calm', 'style': 'vintage'},
-]
+def get_index():
+    """Posting-list index over the catalog, built once"""
+    global _index
+    if _index is None:
+        songs = get_songs()
+        with bingus_stats.timer("index"):
+            _index = SongIndex(songs, by_popularity=True)
+    return _index
 
-# Additional Hip-Hop
-songs += [
-    {'title': 'Money Trees', 'artist': 'Kendrick Lamar', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'Laugh Now Cry Later', 'artist': 'Drake ft. Lil Durk', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'HUMBLE.', 'artist': 'Kendrick Lamar', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'Life Goes On', 'artist': 'Lil Baby', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'sad', 'style': 'acoustic'},
-    {'title': 'Nonstop', 'artist': 'Drake', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Hot', 'artist': 'Young Thug ft. Gunna', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'happy', 'style': 'vintage'},
-    {'title': 'Way 2 Sexy', 'artist': 'Drake ft. Future & Young Thug', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'For the Night', 'artist': 'Pop Smoke ft. Lil Baby & DaBaby', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'Lemonade', 'artist': 'Internet Money ft. Don Toliver, Gunna & NAV', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'vintage'},
-    {'title': 'Whats Poppin', 'artist': 'Jack Harlow', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Rockstar', 'artist': 'DaBaby ft. Roddy Ricch', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'The Box', 'artist': 'Roddy Ricch', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Goosebumps', 'artist': 'Travis Scott', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Life Is Good', 'artist': 'Future ft. Drake', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Mask Off', 'artist': 'Future', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Ballin’', 'artist': 'Mustard ft. Roddy Ricch', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Bank Account', 'artist': '21 Savage', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'sad', 'style': 'acoustic'},
-    {'title': 'Freestyle', 'artist': 'Lil Baby', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Wants and Needs', 'artist': 'Drake ft. Lil Baby', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Knife Talk', 'artist': 'Drake ft. 21 Savage', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'Highest in the Room', 'artist': 'Travis Scott', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'ZEZE', 'artist': 'Kodak Black ft. Travis Scott & Offset', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Super Gremlin', 'artist': 'Kodak Black', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'Back in Blood', 'artist': 'Pooh Shiesty ft. Lil Durk', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Who Want Smoke??', 'artist': 'Nardo Wick ft. G Herbo, Lil Durk & 21 Savage', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Bubbly', 'artist': 'Young Thug ft. Drake & Travis Scott', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Magnolia', 'artist': 'Playboi Carti', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Drip Too Hard', 'artist': 'Lil Baby & Gunna', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Yes Indeed', 'artist': 'Lil Baby & Drake', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'RAPSTAR', 'artist': 'Polo G', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'sad', 'style': 'acoustic'},
-    {'title': 'Mood Swings', 'artist': 'Pop Smoke ft. Lil Tjay', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'No Role Modelz', 'artist': 'J. Cole', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'MIDDLE CHILD', 'artist': 'J. Cole', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'a lot', 'artist': '21 Savage ft. J. Cole', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'Industry Baby', 'artist': 'Lil Nas X & Jack Harlow', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Runnin', 'artist': '21 Savage & Metro Boomin', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'X', 'artist': '21 Savage & Future', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Jimmy Cooks', 'artist': 'Drake ft. 21 Savage', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Talk About Me', 'artist': 'Dot Da Genius ft. Kid Cudi, Denzel Curry & JID', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Surround Sound', 'artist': 'JID ft. 21 Savage & Baby Tate', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Big Energy (Remix)', 'artist': 'Latto ft. Mariah Carey & DJ Khaled', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'Tomorrow 2', 'artist': 'GloRilla & Cardi B', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Put On', 'artist': 'Young Jeezy ft. Kanye West', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Power', 'artist': 'Kanye West', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Famous', 'artist': 'Kanye West', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Praise God', 'artist': 'Kanye West ft. Travis Scott & Baby Keem', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'Family Ties', 'artist': 'Baby Keem & Kendrick Lamar', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Die Hard', 'artist': 'Kendrick Lamar ft. Blxst & Amanda Reifer', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'Lifestyle', 'artist': 'Rich Gang ft. Young Thug & Rich Homie Quan', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'Big Bank', 'artist': 'YG ft. 2 Chainz, Big Sean & Nicki Minaj', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Love Sosa', 'artist': 'Chief Keef', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-]
 
+def get_facets():
+    """Bitmap facet index over the catalog, built once (needs numpy, so it's imported here)"""
+    global _facets
+    if _facets is None:
+        songs = get_songs()
+        with bingus_stats.timer("facets_index"):
+            from bingus_facets import BitmapIndex
+            _facets = BitmapIndex(songs)
+    return _facets
 
-songs += [
-    {'title': 'Lord Of Chaos', 'artist': 'Ken Carson', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Xposed', 'artist': 'Ken Carson', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Feels Good', 'artist': 'Eatmyflesh', 'genre': 'alternative', 'tempo': 'slow', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': "Rollin' (Air Raid Vehicle)", 'artist': 'Limp Bizkit', 'genre': 'rock', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Die With A Smile', 'artist': 'Lady Gaga, Bruno Mars', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'F**k Sum', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Zodiac', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'yeyeezytunechiweezy', 'artist': 'BabyChiefDoit', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Prove it', 'artist': '21 Savage, Summer Walker', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Ginos', 'artist': 'B6', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'bustdown rollie avalanche', 'artist': 'Kai cenat', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Wants and Needs', 'artist': 'Drake, Lil Baby', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Swamp', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'You Broke My Heart', 'artist': 'Drake', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'Standing Next to You', 'artist': 'Jungkook (JK)', 'genre': 'pop', 'tempo': 'slow', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'One Dance', 'artist': 'Drake', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': '505', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Backdoor', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Hardest to love', 'artist': 'The Weeknd', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Bad Man', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Meeting In My Bedroom', 'artist': 'Silk', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Delusional', 'artist': 'Ken Carson', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'acoustic'},
-    {'title': 'Decoy', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Them Thing Deh\xa0', 'artist': 'Ini Kamoze', 'genre': 'reggae', 'tempo': 'slow', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'I Choose Violence', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Abandon', 'artist': 'Rod Wave', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'You Don’t Love Me\xa0', 'artist': 'Dawn Penn', 'genre': 'reggae', 'tempo': 'slow', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'MDMA', 'artist': 'Ken Carson, Destroy Lonely', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Paranoid', 'artist': 'Ken Carson', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Take It Up With God', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Outfit Feat 21 Savage', 'artist': 'Lil Baby', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Young Girl', 'artist': 'Don Carlos & Gold', 'genre': 'reggae', 'tempo': 'slow', 'mood': 'calm', 'style': 'vintage'},
-    {'title': '500 lbs', 'artist': 'Lil Tecca', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Excitement', 'artist': 'Trippie Redd', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Love Me', 'artist': 'Lil Tecca', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': "Mystikal Draco's (Psychotic)", 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'keep steady', 'artist': 'sosacamo', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'TURN RED', 'artist': 'M dot R', 'genre': 'reggae', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'LOT OF ME', 'artist': 'Lil Tecca', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Gypsy Woman', 'artist': 'Crystal Waters', 'genre': 'r&b', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': '10 Freaky Girls', 'artist': 'Metro Boomin', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Last Airbender', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Oh U Went', 'artist': 'Young Thug', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'HAHA', 'artist': 'YTB Fatt', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Dont\xa0', 'artist': 'Bryson Tiller\xa0', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'overseas', 'artist': 'Ken Carson', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Siesta Freestyle\xa0', 'artist': 'Lewis OfMan', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Insomnia', 'artist': 'Jaydes', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'sad', 'style': 'funky'},
-    {'title': 'Overtime', 'artist': 'Ken Carson', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'I need u', 'artist': 'Ken Carson', 'genre': 'r&b', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'South', 'artist': 'Jaydes', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'funky'},
-    {'title': 'Freestyle 2', 'artist': 'Ken Carson', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Pimp tha pen\xa0', 'artist': 'DJ Screw & Lil Keke', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'pixxa', 'artist': 'Jaydes', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'calm', 'style': 'funky'},
-    {'title': 'the perfect pair', 'artist': 'beebadoobee', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Placas De Papel', 'artist': 'Los Desvelados', 'genre': 'latin', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Sunny Day', 'artist': 'DJ Screw', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Enter Sandman', 'artist': 'Metallica', 'genre': 'rock', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Reggae Shark', 'artist': 'The Key of Awesome\xa0', 'genre': 'reggae', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'bbysit', 'artist': 'Protect', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'MURDERMAN', 'artist': 'Trippie Redd', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'June 27th', 'artist': 'Big Moe', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Wanna Be a Baller\xa0', 'artist': 'Lil Troy', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Russian Cream', 'artist': 'Key Glock', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'film', 'artist': '1oneam', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'I Had Some Help', 'artist': 'Post Malone', 'genre': 'country', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': '"What They Told Me"', 'artist': 'Raq Baby', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Alicia Keys', 'artist': '1oneam', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Can’t Tell Me Nothing', 'artist': 'Kanye West\xa0', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Promise(feat.Romeo Santos)', 'artist': 'Romeo Santos', 'genre': 'latin', 'tempo': 'medium', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'Life is a Highway', 'artist': 'Rascal Flatts', 'genre': 'country', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': '24', 'artist': 'Chief Keef\xa0', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Snoh Aalegra', 'artist': 'IN YOUR EYES', 'genre': 'pop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Ball Hog Summer', 'artist': 'Protect', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'I Want You Around', 'artist': 'Snoh Aalegra', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Grannys\xa0', 'artist': 'Chief Keef', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Room 156', 'artist': 'Osamason', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Cartel', 'artist': 'Osamason', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'cts-v', 'artist': 'Osamason', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Florida Boy', 'artist': 'Luh Tyler', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'acoustic'},
-    {'title': 'Wondering Why', 'artist': 'The Red Clay Strays', 'genre': 'country', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Trenches', 'artist': 'Osamason', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Nonstop', 'artist': 'Drake', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'My Own Summer(Shove It)', 'artist': 'Deftones\xa0', 'genre': 'rock', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Movie', 'artist': 'Osamason', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Succubus', 'artist': 'Ken Carson', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Look After You', 'artist': 'The Fray', 'genre': 'religious', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Pushing My Max', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Purple', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'No More ?s', 'artist': 'Eazy E', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'vintage'},
-    {'title': 'We Want Eazy', 'artist': 'Eazy E', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': '6ix times 2Day', 'artist': 'BabyChiefDoit', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Still Young Pablo', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Snooze You Lose', 'artist': 'BabyChiefDoit', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Getting It\xa0', 'artist': 'Too $hort', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Yess', 'artist': 'Glokk40Spaz', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Country Girl', 'artist': 'Luke Bryan', 'genre': 'country', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Too Slow', 'artist': 'BabyChiefDoit, STAR BANDZ', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'ANDO', 'artist': 'Jere Klein', 'genre': 'latin', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Drowned', 'artist': 'BabyChiefDoit', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'In My Room', 'artist': 'Insane Clown Posse', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'Party In The U.S.A', 'artist': 'Miley Cyrus', 'genre': 'pop', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'outfit', 'artist': 'Lil baby', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Creep\xa0', 'artist': 'Stone Temple Pilots', 'genre': 'rock', 'tempo': 'fast', 'mood': 'energetic', 'style': 'vintage'},
-    {'title': 'No Guidance', 'artist': 'Drake, Chris Brown', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Yeah Yeah', 'artist': 'Young Nudy', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Broken Boi Boi', 'artist': 'Flight', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'funky'},
-    {'title': 'Summertime Sadness', 'artist': 'Lana Del Ray', 'genre': 'pop', 'tempo': 'fast', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'Champain\xa0', 'artist': 'NoCap', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'No One Noticed', 'artist': 'The Marias', 'genre': 'indie', 'tempo': 'slow', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'Dreamer', 'artist': 'Laufey', 'genre': 'pop', 'tempo': 'medium', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'ME JALO', 'artist': 'Feurza Regida, Grupo Frontera', 'genre': 'latin', 'tempo': 'slow', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'This December', 'artist': 'Ricky Montgomery', 'genre': 'pop', 'tempo': 'fast', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'Moonlight', 'artist': 'Kali Uchis', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'ONLY', 'artist': 'LeeHi', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'Telepatia', 'artist': 'Kali Uchis', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'like JENNIE', 'artist': 'Jennie Kim', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Grown Woman', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Bored', 'artist': 'Laufey', 'genre': 'pop', 'tempo': 'medium', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'KING OF CALIFORNIA', 'artist': 'Lil Darkie', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Options', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': '1942', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'fast', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Falling Behind', 'artist': 'Laufey', 'genre': 'pop', 'tempo': 'fast', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'Temptations', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Wild Bitches', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Cheat code', 'artist': 'Lukas Graham', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'AGATS2', 'artist': 'Juice WRLD', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'hey there', 'artist': 'dej loaf', 'genre': 'soul', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Chica Atractiva', 'artist': 'FloyyMenor', 'genre': 'reggae', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'A Night To Remember', 'artist': 'beabadoobee & Laufey', 'genre': 'pop', 'tempo': 'medium', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'F o r C e r t a i n\xa0', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Mona lisa', 'artist': 'j-hope', 'genre': 'k-pop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Sex on the Beach', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Stir Fry', 'artist': 'Migos', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'LET"S GET MARRIED', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Promise', 'artist': 'Laufey', 'genre': 'pop', 'tempo': 'slow', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'No Chill', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Lovesick', 'artist': 'Laufey', 'genre': 'pop', 'tempo': 'medium', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'Ordinary', 'artist': 'Alex Warren', 'genre': 'soul', 'tempo': 'slow', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Your Favorite Dress', 'artist': 'Lil Peep', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'sad', 'style': 'acoustic'},
-    {'title': "Don't Run", 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Tempted', 'artist': 'Young Filly', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Say Yes To Heaven', 'artist': 'Lana Del Ray', 'genre': 'pop', 'tempo': 'slow', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'loyal', 'artist': 'Chris brown (ft. Lil Wayn and Tyga)\xa0', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Dangerously In Love', 'artist': 'YNW Melly', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Wednesday Night Interlude\xa0', 'artist': 'Drake', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Burning down', 'artist': 'Alex Warren', 'genre': 'soul', 'tempo': 'slow', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'White Iverson', 'artist': 'Post Malone', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Dare U', 'artist': 'NLE Choppa', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'The Adults Are Talking', 'artist': 'The Strokes', 'genre': 'indie', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'THINGS & SUCH', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Brown Skin', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'TBH', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'East Liberty', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Right Now', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'fast', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Last Chance', 'artist': 'Shotgun Willy', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Compass', 'artist': 'Mili', 'genre': 'pop', 'tempo': 'medium', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'Candy Rain\xa0', 'artist': 'Soul For Real', 'genre': 'soul', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Give you the moon', 'artist': 'Lil Peep', 'genre': 'alternative', 'tempo': 'medium', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'Sway to My Beat in Cosmos', 'artist': 'Chevy', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Hero', 'artist': 'Mili', 'genre': 'pop', 'tempo': 'medium', 'mood': 'sad', 'style': 'vintage'},
-    {'title': "Don't Know How\xa0", 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': "You've Been Missed\xa0", 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'SHOWING YOU', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Voodoo', 'artist': 'Julio Foolio', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Welcome to the Party', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'This Is What Autumn Feels Like', 'artist': 'JVKE', 'genre': 'indie', 'tempo': 'medium', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'Her Old Friends', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Bout it', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'CONTROL', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Her', 'artist': 'JVKE', 'genre': 'indie', 'tempo': 'slow', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'JUS KNOW', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Ballin', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': "Don't", 'artist': 'Bryson Tiller', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Relax with me\xa0', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'fast', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Hope Is the Thing With Feathers', 'artist': 'Chevy', 'genre': 'pop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Rendezvous', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Peace Of Mind\xa0', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Amor', 'artist': 'Alta Elegancia, DannyLux', 'genre': 'latin', 'tempo': 'medium', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'Grenade', 'artist': 'Bruno Mars', 'genre': 'pop', 'tempo': 'medium', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'Very Rare Forever', 'artist': 'XXXTENTACION', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'calm', 'style': 'acoustic'},
-    {'title': 'CANDY', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Nobody', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Over Here', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Make a Mil', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Thirsty', 'artist': 'PARTYNEXTDOOR', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Do It', 'artist': 'Chloe X Halle', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'National Anthem', 'artist': 'Lana Del Rey', 'genre': 'alternative', 'tempo': 'medium', 'mood': 'energetic', 'style': 'vintage'},
-    {'title': "Can't help but wait", 'artist': 'Trey Songz', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'exposed', 'artist': 'queen key', 'genre': 'pop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Candy Rain\xa0', 'artist': 'Soul for Real', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Chicago', 'artist': 'Michael Jackson', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Adorn', 'artist': 'Miguel', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Sunset Driver', 'artist': 'Michael Jackson', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'A Place With No Name', 'artist': 'Michael Jackson', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Every Little Step', 'artist': 'Bobby Brown', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Next Lifetime', 'artist': 'Erykah Badu', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Whatever You Want', 'artist': 'Tony! Toni! Tone!', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Before I let you go', 'artist': 'Blackstreet', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Do for Love', 'artist': '2Pac', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Computer Love', 'artist': 'Zapp & Roger', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Vixen', 'artist': 'Miguel', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'I get around', 'artist': '2Pac', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Luv U better', 'artist': 'LL COOL J', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Rolling down my face', 'artist': 'Amerie', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Amerie', 'artist': 'Why dont we fall in love', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'feel it', 'artist': 'jacquees', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'oui', 'artist': 'jeremih', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'OD', 'artist': 'Young Thug', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Feel It\xa0', 'artist': 'Young Thug', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'i didnt change my number', 'artist': 'billie Elish', 'genre': 'soul', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Raw', 'artist': 'Young Thug', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Brokey', 'artist': 'Latto', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'RiRi', 'artist': 'Young Thug', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Vvs Switch', 'artist': 'Pressure', 'genre': 'latin', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'lover , you shouldve come\xa0', 'artist': 'jeff Buckley', 'genre': 'soul', 'tempo': 'slow', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'Episode 3', 'artist': 'Queen Key', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Already', 'artist': 'Kodak Bla', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Queen Key- Episode 2', 'artist': 'Queen Key', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'smile\xa0', 'artist': 'Beatking\xa0', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Go Crazy\xa0', 'artist': 'Young Thug & Chris Brown', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Hot\xa0', 'artist': 'Young Thug & Gunna', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'F**k tha police\xa0', 'artist': 'N.W.A', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'vintage'},
-    {'title': 'bigsarr', 'artist': 'frozone', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Gang Up\xa0', 'artist': 'Young Thug', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Dark is the Night', 'artist': 'Temnaya noch', 'genre': 'pop', 'tempo': 'slow', 'mood': 'sad', 'style': 'vintage'},
-    {'title': 'Mafia', 'artist': 'Rod Wave', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'Bout it', 'artist': 'PARTYNEXTDOOR', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Candy', 'artist': 'Plan b', 'genre': 'latin', 'tempo': 'fast', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Miss it', 'artist': 'bigYBA', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Hood Rich', 'artist': 'TrueBleeda x TG KOMMAS', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Missing You', 'artist': 'YFN Lucci', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Sola', 'artist': 'Lary Over\xa0', 'genre': 'latin', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'I THINK', 'artist': 'Tyler, The Creator', 'genre': 'alternative', 'tempo': 'slow', 'mood': 'happy', 'style': 'funky'},
-    {'title': "It's Mine\xa0", 'artist': 'Loe Shimmy\xa0', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Good Luck Babe!', 'artist': 'Chappell Roan', 'genre': 'pop', 'tempo': 'medium', 'mood': 'happy', 'style': 'funky'},
-    {'title': 'Cash', 'artist': 'Lil Baby', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Right Foot Creep', 'artist': 'Nba Youngboy', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'ELA É SENSACIONAL', 'artist': 'MC MENOR MT', 'genre': 'alternative', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'I Swear To God\xa0', 'artist': 'Rob49', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'How I Been', 'artist': 'Nba Young Boy', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Se Você Quiser', 'artist': 'MC Kaio', 'genre': 'pop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Cardigan', 'artist': 'Taylor Swift', 'genre': 'pop', 'tempo': 'slow', 'mood': 'calm', 'style': 'vintage'},
-    {'title': 'Thirsty- PartyNextDoor', 'artist': 'PartyNextDoor\xa0', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'IM THE QUEEN', 'artist': 'Jamelia Queen', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'La Forma En Que Me Miras', 'artist': 'Super Yei x Myke Towers x Sammy x Lenny Tavarez x Rafa Pabon x Jone Quest', 'genre': 'latin', 'tempo': 'medium', 'mood': 'calm', 'style': 'funky'},
-    {'title': 'Find your wings', 'artist': 'tyler the creator\xa0', 'genre': 'indie', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'El Del Palenque', 'artist': 'Los Alegres Del Barranco', 'genre': 'alternative', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Run', 'artist': 'Tyler the creator', 'genre': 'indie', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Rushes', 'artist': 'Frank Ocean', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Pretty Girl Rock', 'artist': 'Keri Hilson', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': "Not Gon' Cry", 'artist': 'Mary J Blige', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Nights- Frank Ocean', 'artist': 'Frank Ocean\xa0', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'calm', 'style': 'normal'},
-    {'title': "Come On Let's Go", 'artist': 'Screwly G', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'somos', 'artist': 'Majo y Dan', 'genre': 'k-pop', 'tempo': 'slow', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Pluto Belt To Ass', 'artist': 'PLUTO', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Expensive Pain', 'artist': 'Screwly G', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'COMO CAPO', 'artist': 'Clave Especial', 'genre': 'alternative', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Look like\xa0', 'artist': 'Chicken P\xa0', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Own It', 'artist': 'Drake', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Just the Two of Us (feat. Bill Withers)', 'artist': 'Grover Washington, Jr. - Topic', 'genre': 'soul', 'tempo': 'slow', 'mood': 'happy', 'style': 'vintage'},
-    {'title': 'Say So- Doja Cat', 'artist': 'Doja Cat', 'genre': 'pop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Blasian', 'artist': 'Youngboy Never Broke Again', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Dead and Gone\xa0', 'artist': 'T.I', 'genre': 'soul', 'tempo': 'medium', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'House of balloons / glass table girls', 'artist': 'The weeknd', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'BONESAW', 'artist': 'GHOSTEMANE\xa0', 'genre': 'alternative', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Damaged thoughts', 'artist': 'screwly g', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Mercy Said No', 'artist': 'CeCe Winans\xa0', 'genre': 'religious', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'coming down', 'artist': 'The weeknd', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'We Poppin', 'artist': 'Youngboy Never Broke Again', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Breakin dishes', 'artist': 'Rihanna', 'genre': 'pop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'vintage'},
-    {'title': 'Gunna - on one tonight [Official Visualizer]', 'artist': 'Gunna', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'Hear My Call', 'artist': 'TG Kommas\xa0', 'genre': 'hip-hop', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'the party & the after party\xa0', 'artist': 'the weeknd', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'san lucas', 'artist': 'Kevin kaarl', 'genre': 'folk', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'Migos - Stir Fry (Official Audio)', 'artist': 'The Migos', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'hood princess', 'artist': 'pretty liyah mello buckzz', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Genie', 'artist': 'Youngboy Never Broke Again', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'Kittie', 'artist': 'Brackish\xa0', 'genre': 'rock', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'D.D', 'artist': 'The weeknd', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'funky'},
-    {'title': 'Ella Va Caminando', 'artist': 'Jauria Santa', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'sad', 'style': 'normal'},
-    {'title': 'Young Stoner Life, Young Thug & Gunna - Ski [Official Audio]', 'artist': 'Young Thug', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'happy', 'style': 'normal'},
-    {'title': 'montreal', 'artist': 'the weeknd', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'snakes', 'artist': 'MMMstackz', 'genre': 'hip-hop', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'outside', 'artist': 'Theweeknd', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'energetic', 'style': 'funky'},
-    {'title': '5 AM', 'artist': 'LIL baby', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'xo / the host\xa0', 'artist': 'theweeknd', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'initiation\xa0', 'artist': 'the weeknd', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'BALLIN', 'artist': 'TG KOMMAS\xa0', 'genre': 'hip-hop', 'tempo': 'fast', 'mood': 'calm', 'style': 'normal'},
-    {'title': 'same old song', 'artist': 'the weeknd', 'genre': 'r&b', 'tempo': 'medium', 'mood': 'energetic', 'style': 'normal'},
-    {'title': 'Easy On Me', 'artist': 'Adele', 'genre': 'r&b', 'tempo': 'slow', 'mood': 'sad', 'style': 'normal'},
-]
 
-print(f'Welcome to recommendR')
-print(f'Powered by BINGUS backend backshakeR')
-print(f'Version No: {version}, running on {len(songs)} songs')
+def get_search():
+    """Fuzzy title/artist search index, loaded from disk if the catalog hasn't changed"""
+    global _search
+    if _search is None:
+        songs = get_songs()
+        with bingus_stats.timer("search_index"):
+            from bingus_search import SEARCH_FILE, index_path, open_search_index
+            # Each catalog keeps its own index file, so switching back and forth doesn't rebuild
+            _search = open_search_index(songs, index_path(CATALOG) if CATALOG else SEARCH_FILE)
+    return _search
 
-print("")
-user_request = {
-    "genre": input("Choose: pop, hip-hop, soul, r&b, country, indie, rock, folk, edm, k-pop, religious, latin: ").strip().lower(),
-    "tempo": input("Enter tempo (slow, medium, fast): ").strip().lower(),
-    "mood": input("Enter mood (calm, sad, happy, energetic): ").strip().lower(),
-    "style": input("Enter style (normal, funky, acoustic, vintage): ").strip().lower()
-}
+
+def search(query, k=10):
+    """Best k (song, similarity) pairs whose title or artist looks like query"""
+    index = get_search()
+    bingus_stats.count("searches")
+    with bingus_stats.timer("search"):
+        return index.search(query, get_songs(), k)
 
 
 def get_match_score(song, request):
@@ -971,29 +88,65 @@ def get_match_score(song, request):
         score += 1.3
     if song["style"] == request["style"]:
         score += 1
-    if score == 5.3:
+    return score
+
+
+def recommend(request, k=10):
+    """Best k (song, score) pairs for a genre/tempo/mood/style request"""
+    index = get_index()
+    bingus_stats.count("requests")
+    with bingus_stats.timer("recommend"):
+        return index.top_k(request, k)
+
+
+def ask_request():
+    """Prompt for the four attributes"""
+    return {
+        "genre": input("Choose: pop, hip-hop, soul, r&b, country, indie, rock, folk, edm, k-pop, religious, latin: ").strip().lower(),
+        "tempo": input("Enter tempo (slow, medium, fast): ").strip().lower(),
+        "mood": input("Enter mood (calm, sad, happy, energetic): ").strip().lower(),
+        "style": input("Enter style (normal, funky, acoustic, vintage): ").strip().lower()
+    }
+
+
+def main():
+    print(f'Welcome to recommendR')
+    print(f'Powered by BINGUS backend backshakeR')
+    print(f'Version No: {version}, running on {len(get_songs())} songs')
+
+    print("")
+    user_request = ask_request()
+
+    # Score only the songs that share an attribute with the request
+    top_songs = recommend(user_request, 10)
+    if any(score == PERFECT_SCORE for song, score in top_songs):
         print(" ")
         print("You have a Perfect match!")
-    return score
+    print("  ")
+
+    # Show top 10
+    with bingus_stats.timer("format"):
+        lines = ["****************************",
+                 "  🎧Top Recommendations 🎧  ",
+                 "****************************",
+                 " "]
+        for song, score in top_songs:
+            if score == PERFECT_SCORE:
+                lines.append(f"{song['title']} by {song['artist']} — {score} match points ***Perfect Match***")
+            else:
+                lines.append(f"{song['title']} by {song['artist']} — {score} match points")
+        lines.append(" ")
+        lines.append(f"You chose a(n) {song['genre']} song, with {song['tempo']} tempo, "
+                     f"that is {song['mood']}, and {song['style']}! ")
 
-# Add scores
-for song in songs:
-    song["score"] = get_match_score(song, user_request)
+    with bingus_stats.timer("print"):
+        print("\n".join(lines))
 
-# Sort by best match
-songs.sort(key=lambda x: x["score"], reverse=True)
-print("  ")
+    # BINGUS_STATS=1 python bingusRUNR.py shows where the time went
+    if bingus_stats.enabled:
+        print("")
+        print(bingus_stats.summary())
 
-# Show top 3
-print("****************************")
-print("  🎧Top Recommendations 🎧  ")
-print("****************************")
-print(" ")
-for song in songs[:10]:
-  if song["score"] == 5.3:
-    print(f"{song['title']} by {song['artist']} — {song['score']} match points ***Perfect Match***")
-  else:
-    print(f"{song['title']} by {song['artist']} — {song['score']} match points")
-print(" ")
-print(f'You chose a(n) {song["genre"]} song, with {song['tempo']} tempo, that is {song['mood']}, and {song['style']}! ')
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import numpy as np
+
+
+def _sq_dists(points, centroids, centroid_norms):
+    """Squared distance from every point to every centroid via one matmul"""
+    return (points ** 2).sum(axis=1)[:, None] - 2 * points @ centroids.T + centroid_norms[None, :]
+
+
+def _nearest_centroid(points, centroids, chunk=65_536):
+    norms = (centroids ** 2).sum(axis=1)
+    labels = np.empty(len(points), dtype=np.int32)
+    for start in range(0, len(points), chunk):
+        labels[start:start + chunk] = _sq_dists(points[start:start + chunk], centroids, norms).argmin(axis=1)
+    return labels
+
+
+def kmeans(points, k, iters=10, seed=0):
+    """Lloyd's k-means; empty clusters get reseeded from random points"""
+    rng = np.random.default_rng(seed)
+    centroids = points[rng.choice(len(points), k, replace=False)].copy()
+    for _ in range(iters):
+        labels = _nearest_centroid(points, centroids)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(centroids, dtype=np.float64)
+        np.add.at(sums, labels, points)
+        empty = counts == 0
+        centroids[~empty] = (sums[~empty] / counts[~empty, None]).astype(points.dtype)
+        centroids[empty] = points[rng.choice(len(points), int(empty.sum()), replace=False)]
+    return centroids
+
+
+class IVFIndex:
+    """Inverted-file ANN index: k-means cells, and a query only scans the n_probe closest cells
+
+    Knobs: n_lists (more cells = smaller scans, needs more probes for the same recall)
+    and n_probe (more probes = higher recall@10, slower queries).
+    """
+
+    def __init__(self, matrix=None, n_lists=None, n_probe=8, iters=10, seed=0):
+        self.n_probe = n_probe
+        if matrix is None:
+            return
+
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        if n_lists is None:
+            n_lists = max(1, int(np.sqrt(len(matrix))))
+        n_lists = min(n_lists, len(matrix))
+
+        # Training on a sample is plenty for a coarse quantizer
+        rng = np.random.default_rng(seed)
+        sample = matrix[rng.choice(len(matrix), min(len(matrix), 64 * n_lists), replace=False)]
+        self.centroids = kmeans(sample, n_lists, iters, seed)
+
+        labels = _nearest_centroid(matrix, self.centroids)
+        # Store rows grouped by cell so every cell is one contiguous slice
+        self.ids = np.argsort(labels, kind="stable").astype(np.int64)
+        self.vectors = matrix[self.ids]
+        self.offsets = np.concatenate(([0], np.cumsum(np.bincount(labels, minlength=n_lists))))
+        self._prepare()
+
+    def _prepare(self):
+        self.centroid_norms = (self.centroids ** 2).sum(axis=1)
+        self.vector_norms = (self.vectors ** 2).sum(axis=1)
+
+    def search(self, q, k=10, n_probe=None):
+        """(squared distance, row) of the approximate k nearest rows, nearest first"""
+        q = np.asarray(q, dtype=np.float32)
+        n_probe = min(n_probe or self.n_probe, len(self.centroids))
+
+        cell_dists = self.centroid_norms - 2 * (self.centroids @ q)
+        cells = np.argpartition(cell_dists, n_probe - 1)[:n_probe]
+        slices = [np.arange(self.offsets[c], self.offsets[c + 1]) for c in cells]
+        candidates = np.concatenate(slices)
+        if len(candidates) == 0:
+            return []
+
+        dists = self.vector_norms[candidates] - 2 * (self.vectors[candidates] @ q) + float(q @ q)
+        k = min(k, len(candidates))
+        top = np.argpartition(dists, k - 1)[:k]
+        top = top[np.argsort(dists[top], kind="stable")]
+        return [(max(float(dists[i]), 0.0), int(self.ids[candidates[i]])) for i in top]
+
+    def save(self, path):
+        np.savez(path, centroids=self.centroids, ids=self.ids, vectors=self.vectors,
+                 offsets=self.offsets, n_probe=self.n_probe)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            index = cls(n_probe=int(data["n_probe"]))
+            index.centroids = data["centroids"]
+            index.ids = data["ids"]
+            index.vectors = data["vectors"]
+            index.offsets = data["offsets"]
+        index._prepare()
+        return index
+
+
+if __name__ == "__main__":
+    import time
+
+    from bingus_similar import SimilarTracks, load_features
+
+    tracks, features = load_features()
+    rng = np.random.default_rng(0)
+    n = 1_000_000
+    fake = features[rng.integers(0, len(features), n)]
+    fake = fake + rng.normal(0, 0.25, fake.shape).astype(np.float32) * features.std(axis=0)
+    exact = SimilarTracks(tracks, fake, use_tree=False)
+
+    start = time.perf_counter()
+    index = IVFIndex(exact.matrix)
+    print(f"Built IVF index over {n} tracks with {len(index.centroids)} lists in {time.perf_counter() - start:.1f}s")
+    index.save("bingus_ann.npz")
+    index = IVFIndex.load("bingus_ann.npz")
+
+    queries = exact.matrix[rng.integers(0, n, 300)]
+    truth = [{i for _, i in exact.brute_force(q, 10)} for q in queries]
+
+    start = time.perf_counter()
+    for q in queries:
+        exact.brute_force(q, 10)
+    print(f"exact scan: {(time.perf_counter() - start) / len(queries) * 1000:.2f}ms per query\n")
+
+    print("n_probe   recall@10   p50       p99")
+    for n_probe in (1, 2, 4, 8, 16, 32):
+        times = []
+        hits = 0
+        for q, expected in zip(queries, truth):
+            start = time.perf_counter()
+            got = index.search(q, 10, n_probe)
+            times.append(time.perf_counter() - start)
+            hits += len(expected & {i for _, i in got})
+        p50, p99 = np.percentile(times, [50, 99]) * 1000
+        print(f"{n_probe:<9} {hits / (10 * len(queries)):9.3f}   {p50:5.2f}ms   {p99:5.2f}ms")
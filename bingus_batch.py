@@ -0,0 +1,68 @@
+import numpy as np
+
+from bingus_catalog import ATTRIBUTES, WEIGHTS, load_songs
+from bingus_numpy import VectorScorer
+
+# Cap on request x song cells scored at once (~128MB of float64)
+CHUNK_CELLS = 16_000_000
+
+
+def request_key(request):
+    """The (genre, tempo, mood, style) tuple a request is scored by"""
+    return tuple(request.get(attr) for attr in ATTRIBUTES)
+
+
+def recommend_batch(requests, k=10, scorer=None):
+    """Top k (song, score) pairs for every request, in the same order as requests"""
+    if scorer is None:
+        scorer = VectorScorer(load_songs())
+
+    # Only a few hundred attribute combinations exist, so score each one once
+    groups = {}
+    for pos, request in enumerate(requests):
+        groups.setdefault(request_key(request), []).append(pos)
+    keys = list(groups)
+
+    codes = np.array([[scorer.vocab[attr].get(value, -1) for attr, value in zip(ATTRIBUTES, key)]
+                      for key in keys], dtype=np.int64).reshape(-1, len(ATTRIBUTES))
+
+    results = [None] * len(requests)
+    n = len(scorer.songs)
+    rows = max(1, CHUNK_CELLS // max(n, 1))
+    for start in range(0, len(keys), rows):
+        block = codes[start:start + rows]
+
+        # One request x song matrix per chunk, built column by column
+        scores = np.zeros((len(block), n))
+        for j, attr in enumerate(ATTRIBUTES):
+            scores += (scorer.columns[attr][None, :] == block[:, j, None]) * float(WEIGHTS[attr])
+
+        for row, key in zip(scores, keys[start:start + rows]):
+            top = [(scorer.songs[i], float(row[i])) for i in scorer.top_indices(row, k, scorer.rank)]
+            for pos in groups[key]:
+                results[pos] = list(top)
+    return results
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    songs = load_songs()
+    scorer = VectorScorer(songs)
+    values = {attr: sorted({song[attr] for song in songs}) for attr in ATTRIBUTES}
+
+    rng = random.Random(0)
+    requests = [{attr: rng.choice(values[attr]) for attr in ATTRIBUTES} for _ in range(20_000)]
+
+    start = time.perf_counter()
+    one_by_one = [scorer.top_k(request) for request in requests]
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = recommend_batch(requests, scorer=scorer)
+    batch_time = time.perf_counter() - start
+
+    assert batched == one_by_one
+    print(f"{len(requests)} requests ({len(set(map(request_key, requests)))} distinct) on {len(songs)} songs")
+    print(f"one at a time: {single_time * 1000:.1f}ms, batched: {batch_time * 1000:.1f}ms")
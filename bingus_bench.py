@@ -0,0 +1,201 @@
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import bingusRUNR
+from bingus_batch import recommend_batch
+from bingus_catalog import ATTRIBUTES, load_songs
+from bingus_csv import UNKNOWN, iter_songs
+from bingus_index import SongIndex
+from bingus_numpy import VectorScorer
+
+
+def attribute_rows():
+    """Real (genre, tempo, mood, style) rows from the built-in catalog and the Spotify CSVs"""
+    rows = [tuple(song[attr] for attr in ATTRIBUTES) for song in load_songs()]
+    for song in iter_songs():
+        row = tuple(song[attr] for attr in ATTRIBUTES)
+        if UNKNOWN not in row:
+            rows.append(row)
+    return rows
+
+
+def realistic_songs(n, rows, seed=0):
+    """n songs whose attribute combinations are drawn from real rows, so the skew is kept"""
+    rng = random.Random(seed)
+    songs = []
+    for i in range(n):
+        song = {"title": f"Song {i}", "artist": f"Artist {i % 5000}"}
+        song.update(zip(ATTRIBUTES, rng.choice(rows)))
+        songs.append(song)
+    return songs
+
+
+def realistic_requests(count, rows, seed=1, random_share=0.1):
+    """Mostly popular combinations, plus some requests for arbitrary mixes"""
+    rng = random.Random(seed)
+    values = [sorted({row[j] for row in rows}) for j in range(len(ATTRIBUTES))]
+    requests = []
+    for _ in range(count):
+        if rng.random() < random_share:
+            row = [rng.choice(column) for column in values]
+        else:
+            row = rng.choice(rows)
+        requests.append(dict(zip(ATTRIBUTES, row)))
+    return requests
+
+
+# The loop scorer needs a full pass and sort per query, so it gets fewer queries
+LOOP_QUERIES = 200
+
+
+class LoopScorer:
+    """The original recommender: get_match_score on every song, then songs.sort by score"""
+
+    def __init__(self, songs):
+        self.songs = songs
+
+    def top_k(self, request, k=10):
+        # Scores go in a key function rather than song["score"], so threads don't share them
+        ranked = sorted(self.songs, key=lambda song: bingusRUNR.get_match_score(song, request), reverse=True)
+        return [(song, bingusRUNR.get_match_score(song, request)) for song in ranked[:k]]
+
+
+def summarize(workload, engine, n, latencies, elapsed):
+    ordered = sorted(latencies)
+    return {
+        "workload": workload,
+        "engine": engine,
+        "songs": n,
+        "queries": len(latencies),
+        "qps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 4),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 4),
+    }
+
+
+def run_single(engine, scorer, requests, n):
+    latencies = []
+    start = time.perf_counter()
+    for request in requests:
+        t = time.perf_counter()
+        scorer.top_k(request, 10)
+        latencies.append(time.perf_counter() - t)
+    return summarize("single", engine, n, latencies, time.perf_counter() - start)
+
+
+def run_batch(scorer, requests, n, batch_size=1000):
+    latencies = []
+    start = time.perf_counter()
+    for i in range(0, len(requests), batch_size):
+        chunk = requests[i:i + batch_size]
+        t = time.perf_counter()
+        recommend_batch(chunk, 10, scorer=scorer)
+        # Spread the batch time over its requests so numbers compare with single queries
+        latencies += [(time.perf_counter() - t) / len(chunk)] * len(chunk)
+    return summarize("batch", "numpy", n, latencies, time.perf_counter() - start)
+
+
+def run_concurrent(engine, scorer, requests, n, threads=8):
+    def timed(request):
+        t = time.perf_counter()
+        scorer.top_k(request, 10)
+        return time.perf_counter() - t
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        latencies = list(pool.map(timed, requests))
+    return summarize(f"concurrent-{threads}", engine, n, latencies, time.perf_counter() - start)
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_all(sizes, queries):
+    rows = attribute_rows()
+    requests = realistic_requests(queries, rows)
+    results = []
+    for n in sizes:
+        songs = realistic_songs(n, rows)
+        # "loop" is the code the others replaced, so the gate also shows how far ahead they are
+        engines = {"loop": LoopScorer(songs), "index": SongIndex(songs), "numpy": VectorScorer(songs)}
+        first = len(results)
+        for engine, scorer in engines.items():
+            workload = requests[:LOOP_QUERIES] if engine == "loop" else requests
+            results.append(run_single(engine, scorer, workload, n))
+            results.append(run_concurrent(engine, scorer, workload, n))
+        results.append(run_batch(engines["numpy"], requests, n))
+        for result in results[first:]:
+            print(f"{result['songs']:>9} {result['workload']:<14} {result['engine']:<6} "
+                  f"{result['qps']:>10.1f} q/s  p50 {result['p50_ms']:8.3f}ms  p99 {result['p99_ms']:8.3f}ms")
+    return {
+        "version": bingusRUNR.version,
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "results": results,
+    }
+
+
+def slower_than_loop(current):
+    """(result, loop result) pairs where an engine lost to the original loop in the same run"""
+    loops = {(r["workload"], r["songs"]): r for r in current["results"] if r["engine"] == "loop"}
+    return [(r, loops[r["workload"], r["songs"]]) for r in current["results"]
+            if r["engine"] != "loop" and (r["workload"], r["songs"]) in loops
+            and r["p50_ms"] > loops[r["workload"], r["songs"]]["p50_ms"]]
+
+
+def compare(current, baseline, tolerance):
+    """Regressions where p50 got more than tolerance (0.2 = 20%) slower than the baseline"""
+    old = {(r["workload"], r["engine"], r["songs"]): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        before = old.get((result["workload"], result["engine"], result["songs"]))
+        if before and result["p50_ms"] > before["p50_ms"] * (1 + tolerance):
+            regressions.append((result, before))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the recommendR scorers")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--out", default="bench_results.json", help="where to write the JSON results")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p50 slowdown, 0.2 = 20%%")
+    args = parser.parse_args()
+
+    current = run_all(args.sizes, args.queries)
+    with open(args.out, "w") as f:
+        json.dump(current, f, indent=2)
+    print(f"Results written to {args.out}")
+
+    behind = slower_than_loop(current)
+    for result, loop in behind:
+        print(f"❌ {result['workload']}/{result['engine']} at {result['songs']} songs is slower than the original loop: "
+              f"p50 {result['p50_ms']:.3f}ms vs {loop['p50_ms']:.3f}ms")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.tolerance)
+        for result, before in regressions:
+            print(f"❌ {result['workload']}/{result['engine']} at {result['songs']} songs: "
+                  f"p50 {before['p50_ms']:.3f}ms -> {result['p50_ms']:.3f}ms")
+        if regressions:
+            sys.exit(1)
+        print(f"✅ No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    if behind:
+        sys.exit(1)
@@ -0,0 +1,188 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+import numpy as np
+
+from bingus_catalog import ATTRIBUTES
+from bingus_numpy import VectorScorer
+
+# File layout (all little-endian):
+#   b"BNGS" | version u32 | song count u32 | header length u32 | JSON header | sections...
+# The JSON header holds the vocab of each attribute and where every section starts.
+# Sections are 8-byte aligned: one code column per attribute, string offsets
+# (u32, 2 * count + 1 entries: title then artist of each song) and the UTF-8 heap.
+MAGIC = b"BNGS"
+VERSION = 1
+PREFIX = struct.Struct("<4sIII")
+
+
+def _code_type(vocab_size):
+    """Smallest array typecode that fits every code"""
+    if vocab_size <= 1 << 8:
+        return "B"
+    if vocab_size <= 1 << 16:
+        return "H"
+    return "I"
+
+
+def _little_endian(arr):
+    if sys.byteorder != "little":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr
+
+
+def write_catalog(songs, path):
+    """Write songs (any iterable, e.g. a CSV stream) as a binary catalog, return the count"""
+    vocab = {attr: {} for attr in ATTRIBUTES}
+    codes = {attr: array("I") for attr in ATTRIBUTES}
+    offsets = array("I", [0])
+    heap = bytearray()
+
+    count = 0
+    for song in songs:
+        for attr in ATTRIBUTES:
+            values = vocab[attr]
+            codes[attr].append(values.setdefault(song[attr], len(values)))
+        for field in ("title", "artist"):
+            heap += song[field].encode("utf-8")
+            offsets.append(len(heap))
+        count += 1
+
+    sections = []
+    for attr in ATTRIBUTES:
+        typecode = _code_type(len(vocab[attr]))
+        sections.append((attr, typecode, array(typecode, codes[attr])))
+    sections.append(("string_offsets", "I", offsets))
+    sections.append(("heap", "B", heap))
+
+    header = {
+        "vocab": {attr: list(vocab[attr]) for attr in ATTRIBUTES},
+        "sections": {},
+    }
+    # Offsets depend on the header size, so size the header with placeholder offsets first
+    sizes = [(name, typecode, len(data) * (data.itemsize if isinstance(data, array) else 1))
+             for name, typecode, data in sections]
+    header_bytes = b""
+    while True:
+        position = PREFIX.size + len(header_bytes)
+        for name, typecode, size in sizes:
+            position += -position % 8
+            header["sections"][name] = [position, size, typecode]
+            position += size
+        encoded = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        encoded += b" " * (-len(encoded) % 8)
+        if len(encoded) == len(header_bytes):
+            break
+        header_bytes = encoded
+    header_bytes = encoded
+
+    with open(path, "wb") as f:
+        f.write(PREFIX.pack(MAGIC, VERSION, count, len(header_bytes)))
+        f.write(header_bytes)
+        for name, typecode, data in sections:
+            start = header["sections"][name][0]
+            f.write(b"\0" * (start - f.tell()))
+            f.write(_little_endian(data) if isinstance(data, array) else data)
+    return count
+
+
+class SongView:
+    """Read-only list of songs that decodes each dict from the mapped file on access"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+
+    def __len__(self):
+        return self.catalog.count
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("song index out of range")
+        catalog = self.catalog
+        song = {"title": catalog.string("title", i), "artist": catalog.string("artist", i)}
+        for attr in ATTRIBUTES:
+            song[attr] = catalog.values[attr][catalog.columns[attr][i]]
+        return song
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class MappedCatalog(VectorScorer):
+    """VectorScorer over a memory-mapped binary catalog; nothing is parsed per song"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.count, header_length = PREFIX.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} bingus catalog")
+        header = json.loads(self.map[PREFIX.size:PREFIX.size + header_length])
+
+        self.values = header["vocab"]
+        self.vocab = {attr: {value: code for code, value in enumerate(self.values[attr])}
+                      for attr in ATTRIBUTES}
+        self.columns = {}
+        for name, (start, size, typecode) in header["sections"].items():
+            dtype = np.dtype(typecode).newbyteorder("<")
+            self.columns[name] = np.frombuffer(self.map, dtype=dtype, count=size // dtype.itemsize, offset=start)
+        self.heap = self.columns.pop("heap")
+        self.offsets = self.columns.pop("string_offsets")
+        self.songs = SongView(self)
+        # The binary format stores no popularity, so ties stay in catalog order
+        self.rank = None
+        self.plans = {}
+
+    def string(self, field, i):
+        """Title or artist of song i, straight from the string heap"""
+        j = 2 * i + (field == "artist")
+        return bytes(self.heap[self.offsets[j]:self.offsets[j + 1]]).decode("utf-8")
+
+    def close(self):
+        # Arrays hold views into the map, so drop them before closing it
+        self.columns = {}
+        self.heap = self.offsets = None
+        self.map.close()
+
+
+if __name__ == "__main__":
+    import time
+    import tracemalloc
+
+    from bingus_catalog import load_songs, synthetic_songs
+    from bingus_csv import iter_songs
+
+    request = {"genre": "hip-hop", "tempo": "fast", "mood": "energetic", "style": "normal"}
+
+    print(f"bingus_songs.bin: {write_catalog(load_songs(), 'bingus_songs.bin')} songs")
+    print(f"spotify_songs.bin: {write_catalog(iter_songs(), 'spotify_songs.bin')} songs")
+
+    n = 1_000_000
+    tracemalloc.start()
+    songs = synthetic_songs(n)
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    write_catalog(songs, "synthetic_songs.bin")
+    del songs
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    catalog = MappedCatalog("synthetic_songs.bin")
+    top = catalog.top_k(request)
+    cold = time.perf_counter() - start
+    mapped_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"{n} songs: open + first query {cold * 1000:.1f}ms")
+    print(f"list of dicts: {dict_bytes / 1e6:.0f}MB, mapped catalog peak: {mapped_bytes / 1e6:.0f}MB")
+    print(top[0])
+    catalog.close()
@@ -0,0 +1,109 @@
+import hashlib
+import itertools
+import json
+import os
+
+from bingus_batch import recommend_batch
+from bingus_catalog import ATTRIBUTES, load_songs, match_score
+from bingus_csv import HERE
+from bingus_numpy import VectorScorer
+
+# Next to the catalog, so every working directory shares one cache instead of keeping its own
+CACHE_FILE = os.path.join(HERE, "bingus_cache.json")
+
+
+def catalog_hash(songs, by_popularity=False):
+    """Content hash of the fields that affect recommendations"""
+    digest = hashlib.sha256()
+    for song in songs:
+        row = [song["title"], song["artist"]] + [song[attr] for attr in ATTRIBUTES]
+        if by_popularity:
+            row.append(int(song.get("popularity") or 0))
+        digest.update(json.dumps(row, ensure_ascii=False).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class RecommendationCache:
+    """Top k results for every possible request, served as a dict lookup"""
+
+    def __init__(self, songs, path=CACHE_FILE, k=10, by_popularity=False):
+        """path=None keeps the cache in memory only; by_popularity ranks ties like SongIndex(by_popularity=True)"""
+        self.songs = songs
+        self.path = path
+        self.k = k
+        self.by_popularity = by_popularity
+        self.hash = catalog_hash(songs, by_popularity)
+        self.values = {attr: {song[attr] for song in songs} for attr in ATTRIBUTES}
+        self.results = {}
+
+        if not self.load():
+            self.build()
+            self.save()
+
+    def key(self, request):
+        """Cache key for a request; values no song has all score the same, so they share None"""
+        return tuple(request.get(attr) if request.get(attr) in self.values[attr] else None
+                     for attr in ATTRIBUTES)
+
+    def build(self):
+        """Score every combination of attribute values found in the catalog"""
+        keys = list(itertools.product(*(sorted(self.values[attr]) + [None] for attr in ATTRIBUTES)))
+        requests = [dict(zip(ATTRIBUTES, key)) for key in keys]
+        positions = {id(song): i for i, song in enumerate(self.songs)}
+
+        batch = recommend_batch(requests, self.k, scorer=VectorScorer(self.songs, self.by_popularity))
+        self.results = {key: [positions[id(song)] for song, score in top] for key, top in zip(keys, batch)}
+
+    def load(self):
+        """Use the saved cache if it was built from this exact catalog"""
+        if self.path is None or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return False
+
+        if data.get("hash") != self.hash or data.get("k") != self.k:
+            return False
+        self.results = {tuple(entry[:-1]): entry[-1] for entry in data["results"]}
+        return True
+
+    def save(self):
+        """Write the cache as compact JSON: [genre, tempo, mood, style, [positions]] rows"""
+        if self.path is None:
+            return
+        data = {
+            "hash": self.hash,
+            "k": self.k,
+            "results": [list(key) + [top] for key, top in self.results.items()],
+        }
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        except OSError as e:
+            print(f"⚠️ Could not save recommendation cache: {e}")
+
+    def top_k(self, request, k=10):
+        """Best k (song, score) pairs for a request"""
+        if k > self.k:
+            return VectorScorer(self.songs, self.by_popularity).top_k(request, k)
+        top = self.results[self.key(request)][:k]
+        return [(self.songs[i], match_score(self.songs[i], request)) for i in top]
+
+
+if __name__ == "__main__":
+    import time
+
+    songs = load_songs()
+
+    start = time.perf_counter()
+    cache = RecommendationCache(songs)
+    print(f"Cache ready with {len(cache.results)} requests in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    request = {"genre": "r&b", "tempo": "slow", "mood": "calm", "style": "normal"}
+    start = time.perf_counter()
+    for _ in range(10_000):
+        cache.top_k(request)
+    print(f"Lookup: {(time.perf_counter() - start) / 10_000 * 1e6:.1f}µs per request")
@@ -0,0 +1,41 @@
+# The four attributes a request can ask for, in the order get_match_score adds them
+ATTRIBUTES = ("genre", "tempo", "mood", "style")
+
+# Points a song earns for each attribute that matches the request
+WEIGHTS = {"genre": 1.6, "tempo": 1.4, "mood": 1.3, "style": 1}
+
+# Score of a song that matches on all four attributes (summed in order, so it's exactly 5.3)
+PERFECT_SCORE = sum(WEIGHTS[attr] for attr in ATTRIBUTES)
+
+
+def load_songs():
+    """The recommender's song catalog (bingus_songs.py) as a new list"""
+    from bingus_songs import songs
+    return list(songs)
+
+
+def synthetic_songs(n, seed=0, base=None):
+    """Make n fake songs whose attribute values follow the real catalog's mix"""
+    import random
+
+    base = base if base is not None else load_songs()
+    rng = random.Random(seed)
+
+    # Sampling from the real column keeps the skew (lots of hip-hop, few folk songs)
+    columns = {attr: [song[attr] for song in base] for attr in ATTRIBUTES}
+    songs = []
+    for i in range(n):
+        song = {"title": f"Song {i}", "artist": f"Artist {i % 5000}"}
+        for attr in ATTRIBUTES:
+            song[attr] = rng.choice(columns[attr])
+        songs.append(song)
+    return songs
+
+
+def match_score(song, request):
+    """Same points as get_match_score in bingusRUNR.py; missing request fields just don't match"""
+    score = 0
+    for attr in ATTRIBUTES:
+        if song[attr] == request.get(attr):
+            score += WEIGHTS[attr]
+    return score
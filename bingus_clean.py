@@ -0,0 +1,78 @@
+import hashlib
+import re
+import unicodedata
+
+_SPACES = re.compile(r"\s+")
+_NOT_ALNUM = re.compile(r"[\W_]+")
+
+
+def normalize_text(text):
+    """NFKC (turns \\xa0 into a plain space), collapse runs of whitespace, strip the ends"""
+    return _SPACES.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def artist_key(artist):
+    """Spelling-proof key: 'the weeknd', 'Theweeknd' and 'The Weeknd' all become 'weeknd'"""
+    key = _NOT_ALNUM.sub("", artist.casefold())
+    if key.startswith("the") and len(key) > 6:
+        key = key[3:]
+    return key
+
+
+def title_key(title):
+    return _SPACES.sub(" ", title.casefold())
+
+
+def _digest(title, artist):
+    # 8-byte digests keep the seen-set small even for millions of rows
+    return hashlib.blake2b(f"{title}\0{artist}".encode("utf-8"), digest_size=8).digest()
+
+
+def clean_songs(songs, stats=None):
+    """Yield normalized songs from any iterable, dropping repeats of the same title + artist
+
+    The first copy of a song wins. Every spelling of an artist is folded to the first one
+    seen. Counts of rows in, rows kept and rows merged go into stats if a dict is passed.
+    """
+    if stats is None:
+        stats = {}
+    stats.update(rows=0, kept=0, merged=0, artists_folded=0)
+
+    artists = {}  # artist key -> display name used for every spelling
+    seen = set()
+    for song in songs:
+        stats["rows"] += 1
+        title = normalize_text(song["title"])
+        artist = normalize_text(song["artist"])
+
+        key = artist_key(artist) or artist.casefold()
+        canonical = artists.setdefault(key, artist)
+        if canonical != artist:
+            stats["artists_folded"] += 1
+
+        digest = _digest(title_key(title), key)
+        if digest in seen:
+            stats["merged"] += 1
+            continue
+        seen.add(digest)
+
+        cleaned = dict(song)
+        cleaned["title"] = title
+        cleaned["artist"] = canonical
+        for attr in ("genre", "tempo", "mood", "style"):
+            if isinstance(cleaned.get(attr), str):
+                cleaned[attr] = normalize_text(cleaned[attr]).lower()
+        stats["kept"] += 1
+        yield cleaned
+
+
+if __name__ == "__main__":
+    from bingus_catalog import load_songs
+    from bingus_csv import iter_songs
+
+    for label, songs in (("bingus_songs.py", load_songs()), ("Spotify CSVs", iter_songs())):
+        stats = {}
+        for _ in clean_songs(songs, stats):
+            pass
+        print(f"{label}: {stats['rows']} rows, kept {stats['kept']}, merged {stats['merged']} duplicates, "
+              f"folded {stats['artists_folded']} artist spellings")
@@ -0,0 +1,145 @@
+import csv
+import itertools
+import os
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TRACKS_CSV = os.path.join(HERE, "spotify_tracks.csv")
+POPULAR_CSV = os.path.join(HERE, "high_popularity_spotify_data.csv")
+
+# Value used when a file has nothing to derive an attribute from
+UNKNOWN = "unknown"
+
+# Spotify genre -> the genres the recommender already knows about
+GENRE_MAP = {
+    "r-n-b": "r&b", "gospel": "religious", "singer-songwriter": "folk", "songwriter": "folk",
+    "bluegrass": "folk", "honky-tonk": "country", "indie-pop": "indie", "afrobeats": "afrobeat",
+    "electronic": "edm", "electro": "edm", "house": "edm", "deep-house": "edm", "chicago-house": "edm",
+    "progressive-house": "edm", "techno": "edm", "minimal-techno": "edm", "detroit-techno": "edm",
+    "trance": "edm", "dubstep": "edm", "post-dubstep": "edm", "drum-and-bass": "edm", "hardstyle": "edm",
+    "dance": "edm", "club": "edm",
+    "alt-rock": "rock", "hard-rock": "rock", "psych-rock": "rock", "punk-rock": "rock", "punk": "rock",
+    "grunge": "rock", "rock-n-roll": "rock", "rockabilly": "rock", "j-rock": "rock",
+    "metal": "rock", "heavy-metal": "rock", "metal-misc": "rock", "metalcore": "rock",
+    "latino": "latin", "reggaeton": "latin", "salsa": "latin", "samba": "latin", "tango": "latin",
+    "brazilian": "latin", "brazil": "latin",
+}
+
+# Playlist-style genres in spotify_tracks.csv that are really a mood
+MOOD_HINTS = {
+    "sad": "sad", "rainy-day": "sad", "emo": "sad",
+    "happy": "happy", "summer": "happy", "road-trip": "happy", "disney": "happy", "kids": "happy",
+    "chill": "calm", "sleep": "calm", "study": "calm", "ambient": "calm", "new-age": "calm", "piano": "calm",
+    "party": "energetic", "work-out": "energetic", "hardcore": "energetic", "grindcore": "energetic",
+}
+
+# Genres whose sound maps onto one of the recommender's styles
+STYLE_HINTS = {
+    "acoustic": "acoustic", "guitar": "acoustic", "singer-songwriter": "acoustic", "folk": "acoustic",
+    "funk": "funky", "disco": "funky", "groove": "funky",
+    "blues": "vintage", "rock-n-roll": "vintage", "rockabilly": "vintage", "jazz": "vintage", "soul": "vintage",
+}
+
+
+def tempo_bucket(bpm):
+    """slow / medium / fast from beats per minute"""
+    if bpm < 90:
+        return "slow"
+    if bpm < 130:
+        return "medium"
+    return "fast"
+
+
+def mood_from(valence, energy):
+    """Pick one of the four main moods from Spotify's valence and energy"""
+    if energy >= 0.7:
+        return "energetic"
+    if valence >= 0.6:
+        return "happy"
+    if valence < 0.35:
+        return "sad"
+    return "calm"
+
+
+def style_from(acousticness, danceability, valence, release_date):
+    """acoustic / funky / vintage / normal from audio features and release year"""
+    if acousticness >= 0.6:
+        return "acoustic"
+    if danceability >= 0.75 and valence >= 0.6:
+        return "funky"
+    if release_date[:4].isdigit() and int(release_date[:4]) < 2000:
+        return "vintage"
+    return "normal"
+
+
+def map_genre(genre):
+    genre = genre.strip().lower()
+    return GENRE_MAP.get(genre, genre)
+
+
+def track_row_to_song(row):
+    """spotify_tracks.csv row -> song dict (no audio features, so lean on the genre tag)"""
+    genre = row["genre"].strip().lower()
+    return {
+        "title": row["name"].strip(),
+        "artist": row["artists"].strip(),
+        "genre": map_genre(genre),
+        "tempo": UNKNOWN,
+        "mood": MOOD_HINTS.get(genre, UNKNOWN),
+        "style": STYLE_HINTS.get(genre, "normal"),
+        "popularity": int(row["popularity"] or 0),
+    }
+
+
+def popular_row_to_song(row):
+    """high_popularity_spotify_data.csv row -> song dict"""
+    valence = float(row["valence"])
+    return {
+        "title": row["track_name"].strip(),
+        "artist": row["track_artist"].strip(),
+        "genre": map_genre(row["playlist_genre"]),
+        "tempo": tempo_bucket(float(row["tempo"])),
+        "mood": mood_from(valence, float(row["energy"])),
+        "style": style_from(float(row["acousticness"]), float(row["danceability"]), valence,
+                            row["track_album_release_date"]),
+        "popularity": int(row["track_popularity"] or 0),
+    }
+
+
+def iter_csv_songs(path):
+    """Yield song dicts from one Spotify export, one row in memory at a time"""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames or []
+        if "track_name" in fields:
+            convert = popular_row_to_song
+        elif "name" in fields and "artists" in fields:
+            convert = track_row_to_song
+        else:
+            raise ValueError(f"{path} doesn't look like a Spotify export (columns: {fields})")
+
+        for row in reader:
+            try:
+                yield convert(row)
+            except (KeyError, ValueError, AttributeError):
+                # Skip rows with missing or non-numeric columns instead of killing the whole load
+                continue
+
+
+def iter_songs(paths=(TRACKS_CSV, POPULAR_CSV)):
+    """Chain several exports into one stream of songs"""
+    return itertools.chain.from_iterable(iter_csv_songs(path) for path in paths)
+
+
+if __name__ == "__main__":
+    from collections import Counter
+
+    counts = {attr: Counter() for attr in ("genre", "tempo", "mood", "style")}
+    total = 0
+    for song in iter_songs():
+        total += 1
+        for attr, counter in counts.items():
+            counter[song[attr]] += 1
+
+    print(f"Streamed {total} songs")
+    for attr, counter in counts.items():
+        print(f"{attr}: {counter.most_common(8)}")
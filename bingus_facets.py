@@ -0,0 +1,203 @@
+import numpy as np
+
+from bingus_catalog import ATTRIBUTES
+from bingus_numpy import VectorScorer
+
+# Fields with few values get one bitmap per value; artist has too many values for that
+BITMAP_FIELDS = ATTRIBUTES
+FIELDS = ATTRIBUTES + ("artist",)
+
+
+def _pack(bools):
+    """Bool array -> bitmap of uint64 words (bit i = song i)"""
+    packed = np.packbits(bools, bitorder="little")
+    packed = np.concatenate((packed, np.zeros(-len(packed) % 8, dtype=np.uint8)))
+    return packed.view(np.uint64)
+
+
+def _unpack(words, count):
+    return np.unpackbits(words.view(np.uint8), bitorder="little", count=count).view(bool)
+
+
+if hasattr(np, "bitwise_count"):
+    def _word_counts(words):
+        return np.bitwise_count(words)
+else:
+    # numpy < 2.0 has no popcount, so count bits a byte at a time
+    _BITS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _word_counts(words):
+        return _BITS[words.view(np.uint8)].reshape(words.shape + (8,)).sum(axis=-1, dtype=np.int64)
+
+
+def _popcount(words, axis=None):
+    return _word_counts(words).sum(axis=axis, dtype=np.int64)
+
+
+def _counts_between(mask, bounds):
+    """Set bits of mask in each range [bounds[c], bounds[c + 1]): running popcounts read at
+    the bounds, so one pass over the words however many ranges there are"""
+    # before[w] = set bits in words 0..w-1; a zero word on the end for a bound at the very end
+    words = np.concatenate((mask, np.zeros(1, dtype=np.uint64)))
+    before = np.concatenate(([0], np.cumsum(_word_counts(words), dtype=np.int64)))
+    low = (np.uint64(1) << (bounds & 63).astype(np.uint64)) - np.uint64(1)
+    prefix = before[bounds >> 6] + _word_counts(words[bounds >> 6] & low)
+    return np.diff(prefix)
+
+
+class BitmapIndex:
+    """Bitmaps per attribute value for AND/OR filters and facet counts
+
+    Filters look like {"genre": "pop", "mood": ["happy", "energetic"]}: values in a list
+    are OR'd, fields are AND'd.
+
+    Bitmaps are kept in two song orders. In "combo" order the catalog is sorted by
+    (genre, tempo, mood, style), so every combination of the four is one run of bits; in
+    "artist" order each artist's songs are one run. A facet is then the filter's popcount
+    per run (_counts_between, one pass over the words) summed up by value, instead of an
+    AND + popcount per value, and an artist filter is just its run of bits.
+    """
+
+    def __init__(self, songs):
+        self.songs = songs
+        self.count = len(songs)
+        self.values = {}
+        codes = {}
+        for field in FIELDS:
+            codes[field], self.values[field] = self._encode(field)
+        self.artist_code = {artist: code for code, artist in enumerate(self.values["artist"])}
+
+        # order[layout][j] = catalog position of bit j
+        self.order = {
+            "combo": np.lexsort([codes[field] for field in reversed(BITMAP_FIELDS)]),
+            "artist": np.argsort(codes["artist"], kind="stable"),
+        }
+        # Artist c is bits [artist_bounds[c], artist_bounds[c + 1]) in artist order
+        self.artist_bounds = np.concatenate(([0], np.cumsum(np.bincount(codes["artist"],
+                                                                         minlength=len(self.values["artist"])))))
+        # Runs of one combination in combo order, and each run's code per field
+        combo = {field: codes[field][self.order["combo"]] for field in BITMAP_FIELDS}
+        changes = np.zeros(self.count, dtype=bool)
+        changes[:1] = True
+        for column in combo.values():
+            changes[1:] |= column[1:] != column[:-1]
+        run_starts = np.flatnonzero(changes)
+        self.run_bounds = np.append(run_starts, self.count)
+        self.run_codes = {field: column[run_starts] for field, column in combo.items()}
+        # Where each song's bit sits in combo order, to place an artist's songs
+        self.combo_slot = np.empty(self.count, dtype=np.intp)
+        self.combo_slot[self.order["combo"]] = np.arange(self.count)
+
+        self.bitmaps = {}
+        for layout, order in self.order.items():
+            self.bitmaps[layout] = {}
+            for field in BITMAP_FIELDS:
+                column = codes[field][order]
+                values = self.values[field]
+                # One values x words block per field; the bitmaps are its rows
+                stack = np.stack([_pack(column == code) for code in range(len(values))]) if values else ()
+                self.bitmaps[layout][field] = dict(zip(values, stack))
+
+        self.all = _pack(np.ones(self.count, dtype=bool))
+        self.none = np.zeros_like(self.all)
+
+    def _encode(self, field):
+        codes = {}
+        column = np.fromiter((codes.setdefault(song[field], len(codes)) for song in self.songs),
+                             dtype=np.int32, count=self.count)
+        return column, list(codes)
+
+    def _range(self, start, end):
+        """Bitmap with bits [start, end) set"""
+        words = np.zeros_like(self.none)
+        if start < end:
+            first, last = start >> 6, (end - 1) >> 6
+            words[first:last + 1] = ~np.uint64(0)
+            words[first] &= ~np.uint64(0) << np.uint64(start & 63)
+            words[last] &= ~np.uint64(0) >> np.uint64(63 - ((end - 1) & 63))
+        return words
+
+    def bitmap(self, field, value, layout="combo"):
+        """Bitmap of the songs whose field equals value"""
+        if field != "artist":
+            return self.bitmaps[layout][field].get(value, self.none)
+        code = self.artist_code.get(value)
+        if code is None:
+            return self.none
+        start, end = self.artist_bounds[code], self.artist_bounds[code + 1]
+        if layout == "artist":
+            return self._range(start, end)
+        # Scattered in combo order: set just this artist's bits
+        slots = self.combo_slot[self.order["artist"][start:end]]
+        words = np.zeros_like(self.none)
+        np.bitwise_or.at(words, slots >> 6, np.uint64(1) << (slots & 63).astype(np.uint64))
+        return words
+
+    def mask(self, filters, skip=None, layout="combo"):
+        """Bitmap of songs passing every filter (the one on field skip is left out)"""
+        result = self.all
+        for field, wanted in filters.items():
+            if field == skip or wanted is None:
+                continue
+            if isinstance(wanted, str):
+                wanted = [wanted]
+            either = self.none
+            for value in wanted:
+                either = either | self.bitmap(field, value, layout)
+            result = result & either
+        return result
+
+    def total(self, filters):
+        return int(_popcount(self.mask(filters)))
+
+    def positions(self, filters):
+        """Catalog positions of the songs passing the filters, in order"""
+        return np.sort(self.order["combo"][_unpack(self.mask(filters), self.count)])
+
+    def facets(self, filters, fields=FIELDS, top_artists=20):
+        """{field: {value: count}} under the filters
+
+        Each field is counted with its own filter left out, so the UI can show what picking a
+        different genre (say) would give instead of only the one already chosen.
+        """
+        result = {}
+        for field in fields:
+            if field == "artist":
+                counts = _counts_between(self.mask(filters, skip=field, layout="artist"), self.artist_bounds)
+                top = VectorScorer.top_indices(counts, top_artists)
+            else:
+                runs = _counts_between(self.mask(filters, skip=field), self.run_bounds)
+                counts = np.bincount(self.run_codes[field], weights=runs, minlength=len(self.values[field]))
+                top = np.argsort(-counts, kind="stable")
+            result[field] = {self.values[field][c]: int(counts[c]) for c in top if counts[c]}
+        return result
+
+
+if __name__ == "__main__":
+    import time
+
+    from bingus_bench import attribute_rows, realistic_songs
+
+    filters = {"genre": "hip-hop", "tempo": ["fast", "medium"], "mood": "energetic"}
+    songs = realistic_songs(1_000_000, attribute_rows())
+
+    start = time.perf_counter()
+    index = BitmapIndex(songs)
+    print(f"Built bitmaps for {len(songs)} songs in {time.perf_counter() - start:.2f}s")
+
+    expected = sum(1 for s in songs if s["genre"] == "hip-hop" and s["tempo"] in ("fast", "medium")
+                   and s["mood"] == "energetic")
+    assert index.total(filters) == expected
+
+    for label, fields in (("total", None), ("4 attribute facets", ATTRIBUTES), ("artist facet", ("artist",)),
+                          ("all facets (/facets)", FIELDS)):
+        runs = 50
+        start = time.perf_counter()
+        for _ in range(runs):
+            if fields is None:
+                index.total(filters)
+            else:
+                index.facets(filters, fields)
+        print(f"{label:<20} {(time.perf_counter() - start) / runs * 1000:.3f}ms")
+
+    print(index.facets(filters, ("genre", "tempo")))
@@ -0,0 +1,29 @@
+import statistics
+import subprocess
+import sys
+
+# Each run is a fresh interpreter so nothing is already imported. Compiled .pyc files
+# are what a deployed service sees, so run it twice (and without PYTHONDONTWRITEBYTECODE)
+# to keep bingus_songs.py's compile time out of the numbers.
+RUNS = 20
+SNIPPETS = {
+    "python startup": "pass",
+    "import bingusRUNR": "import bingusRUNR",
+    "first recommend()": "import bingusRUNR; bingusRUNR.recommend({'genre': 'pop'})",
+}
+
+
+def time_snippet(code):
+    """Median wall time in ms of running code in a new interpreter"""
+    timer = ("import time; start = time.perf_counter(); "
+             f"{code}; print((time.perf_counter() - start) * 1000)")
+    times = []
+    for _ in range(RUNS):
+        out = subprocess.run([sys.executable, "-c", timer], capture_output=True, text=True, check=True)
+        times.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(times)
+
+
+if __name__ == "__main__":
+    for label, code in SNIPPETS.items():
+        print(f"{label:<20} {time_snippet(code):7.2f}ms")
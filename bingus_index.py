@@ -0,0 +1,106 @@
+import heapq
+
+import bingus_stats
+from bingus_catalog import ATTRIBUTES, WEIGHTS
+
+
+class SongIndex:
+    """Posting lists per attribute value so a request only touches songs it can score"""
+
+    def __init__(self, songs, by_popularity=False):
+        """by_popularity breaks score ties by the songs' "popularity" before catalog order"""
+        self.songs = songs
+        # Tie-break key per position, with popularity folded in: one int compare per tie and
+        # still in position order when popularities are equal. None means catalog order.
+        self.rank = {} if by_popularity else None
+        # postings["genre"]["pop"] -> positions of every pop song, in catalog order.
+        # Dicts with None values act as ordered sets so a song can be dropped in O(1).
+        self.postings = {attr: {} for attr in ATTRIBUTES}
+        for i, song in enumerate(songs):
+            self.add(i, song)
+
+    def add(self, i, song):
+        """Register the song stored at position i"""
+        for attr in ATTRIBUTES:
+            self.postings[attr].setdefault(song[attr], {})[i] = None
+        if self.rank is not None:
+            self.rank[i] = i - (int(song.get("popularity") or 0) << 32)
+
+    def remove(self, i, song):
+        """Forget the song at position i (the caller clears its slot in songs)"""
+        for attr in ATTRIBUTES:
+            posting = self.postings[attr].get(song[attr])
+            if posting is not None:
+                posting.pop(i, None)
+                if not posting:
+                    del self.postings[attr][song[attr]]
+        if self.rank is not None:
+            self.rank.pop(i, None)
+
+    def scores(self, request):
+        """Return {position: score} for every song that matches at least one attribute"""
+        scores = {}
+        # Same attribute order as get_match_score so the float sums come out identical
+        for attr in ATTRIBUTES:
+            weight = WEIGHTS[attr]
+            for i in self.postings[attr].get(request.get(attr), ()):
+                scores[i] = scores.get(i, 0) + weight
+        return scores
+
+    def top_positions(self, request, k=10):
+        """Best k (position, score) pairs, ties broken by catalog order like songs.sort
+        (or by popularity first, for an index built with by_popularity)"""
+        with bingus_stats.timer("score"):
+            scores = self.scores(request)
+        bingus_stats.count("songs_scored", len(scores))
+
+        with bingus_stats.timer("sort"):
+            rank = self.rank
+            if rank is None:
+                best = heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))
+            else:
+                best = heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], rank[item[0]]))
+
+            if len(best) < k and rank is not None:
+                rest = heapq.nsmallest(k - len(best), (i for i in rank if i not in scores), key=rank.get)
+                best += [(i, 0) for i in rest]
+            # Not enough matches: the old sort would fill up with 0-point songs from the top
+            elif len(best) < k:
+                for i, song in enumerate(self.songs):
+                    if len(best) >= k:
+                        break
+                    if song is not None and i not in scores:
+                        best.append((i, 0))
+        return best
+
+    def top_k(self, request, k=10):
+        """Best k (song, score) pairs"""
+        return [(self.songs[i], score) for i, score in self.top_positions(request, k)]
+
+
+if __name__ == "__main__":
+    import time
+
+    from bingus_catalog import load_songs, synthetic_songs
+
+    request = {"genre": "indie", "tempo": "slow", "mood": "dreamy", "style": "acoustic"}
+
+    songs = load_songs()
+    for song, score in SongIndex(songs).top_k(request):
+        print(f"{song['title']} by {song['artist']} — {score} match points")
+
+    print("\nsongs      full sort   index")
+    for n in (10_000, 100_000, 1_000_000):
+        catalog = synthetic_songs(n, base=songs)
+
+        start = time.perf_counter()
+        ranked = sorted(catalog, key=lambda s: sum(WEIGHTS[a] for a in ATTRIBUTES if s[a] == request[a]),
+                        reverse=True)[:10]
+        sort_time = time.perf_counter() - start
+
+        index = SongIndex(catalog)
+        start = time.perf_counter()
+        index.top_k(request)
+        index_time = time.perf_counter() - start
+
+        print(f"{n:<10} {sort_time * 1000:8.1f}ms {index_time * 1000:8.1f}ms")
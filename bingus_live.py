@@ -0,0 +1,270 @@
+import numpy as np
+
+from bingus_cache import RecommendationCache
+from bingus_catalog import ATTRIBUTES, WEIGHTS
+from bingus_index import SongIndex
+from bingus_numpy import VectorScorer
+
+
+class LiveScorer(VectorScorer):
+    """VectorScorer whose columns grow in place and whose deleted rows never rank"""
+
+    def __init__(self, songs, by_popularity=False):
+        super().__init__(songs, by_popularity)
+        self.count = len(songs)
+        self.alive = np.ones(max(self.count, 16), dtype=bool)
+        self.buffers = {}
+        for attr in ATTRIBUTES:
+            buffer = np.zeros(len(self.alive), dtype=self.columns[attr].dtype)
+            buffer[:self.count] = self.columns[attr]
+            self.buffers[attr] = buffer
+        self.rank_buffer = None
+        if self.rank is not None:
+            self.rank_buffer = np.zeros(len(self.alive), dtype=np.int64)
+            self.rank_buffer[:self.count] = self.rank
+        self._sync()
+
+    def _sync(self):
+        # columns are views of the used part of each buffer, like a plain VectorScorer's
+        self.columns = {attr: self.buffers[attr][:self.count] for attr in ATTRIBUTES}
+        if self.rank_buffer is not None:
+            self.rank = self.rank_buffer[:self.count]
+
+    def add(self, song):
+        """Encode the song that was just appended to songs"""
+        if self.count == len(self.alive):
+            # Double the capacity so appends stay O(1) amortized
+            self.alive = np.concatenate((self.alive, np.ones_like(self.alive)))
+            for attr in ATTRIBUTES:
+                self.buffers[attr] = np.concatenate((self.buffers[attr], np.zeros_like(self.buffers[attr])))
+            if self.rank_buffer is not None:
+                self.rank_buffer = np.concatenate((self.rank_buffer, np.zeros_like(self.rank_buffer)))
+
+        for attr in ATTRIBUTES:
+            codes = self.vocab[attr]
+            code = codes.setdefault(song[attr], len(codes))
+            if code > np.iinfo(self.buffers[attr].dtype).max:
+                self.buffers[attr] = self.buffers[attr].astype(np.min_scalar_type(code))
+            self.buffers[attr][self.count] = code
+        if self.rank_buffer is not None:
+            self.rank_buffer[self.count] = self.count - (int(song.get("popularity") or 0) << 32)
+        self.alive[self.count] = True
+        self.count += 1
+        self._sync()
+
+    def remove(self, i):
+        self.alive[i] = False
+
+    def scores(self, request):
+        scores = super().scores(request)
+        # Below any real score (they're all >= 0) so deleted rows sort last
+        scores[~self.alive[:self.count]] = -1
+        return scores
+
+    def top_k(self, request, k=10):
+        k = min(k, int(self.alive[:self.count].sum()))
+        return super().top_k(request, k)
+
+
+class LiveCatalog:
+    """Catalog that takes appends and deletes and keeps every derived structure current
+
+    Positions never move: a deleted song leaves None in songs, so postings, encoded
+    columns and cached results can all be patched in place instead of rebuilt.
+    Cached lists are always the first entries of the true ranking, kept 2k deep so
+    most deletes just drop an entry instead of re-running the query.
+
+    A song can only move a cached list that asks for one of its values, or one that already
+    ends in 0-point songs (popularity can put a new 0-point song ahead of those). Cached keys
+    are indexed by each value they ask for, and the 0-point-tail ones kept in a set, so an
+    update visits just those lists instead of every cached request.
+    """
+
+    def __init__(self, songs, k=10, by_popularity=False):
+        """by_popularity breaks score ties by popularity, like SongIndex(by_popularity=True)"""
+        self.songs = list(songs)
+        self.k = k
+        self.depth = 2 * k
+        self.count = len(self.songs)
+        self.index = SongIndex(self.songs, by_popularity)
+        self.scorer = LiveScorer(self.songs, by_popularity)
+        self.cache = RecommendationCache(self.songs, path=None, k=self.depth, by_popularity=by_popularity)
+        # keys_by_value[j]["pop"] -> cached keys whose j-th attribute asks for "pop"
+        self.keys_by_value = [{} for _ in ATTRIBUTES]
+        # floor[key] -> (-score, rank) of the last song on the list, what a new song has to beat
+        self.floor = {}
+        self.zero_tail = set()
+        for key in self.cache.results:
+            self._track(key)
+
+    def __len__(self):
+        return self.count
+
+    def _rank(self, i):
+        """Tie-break key of position i: smaller wins"""
+        return i if self.index.rank is None else self.index.rank[i]
+
+    def _score(self, song, key):
+        score = 0
+        for attr, value in zip(ATTRIBUTES, key):
+            if song[attr] == value:
+                score += WEIGHTS[attr]
+        return score
+
+    def _track(self, key):
+        """Index a newly cached key"""
+        for j, value in enumerate(key):
+            if value is not None:
+                self.keys_by_value[j].setdefault(value, set()).add(key)
+        self._refresh(key)
+
+    def _refresh(self, key):
+        """Recompute the floor (and 0-point tail) of a list that just changed"""
+        top = self.cache.results[key]
+        if not top:
+            self.floor[key] = None
+            self.zero_tail.discard(key)
+            return
+        score = self._score(self.songs[top[-1]], key)
+        self.floor[key] = (-score, self._rank(top[-1]))
+        if score == 0:
+            self.zero_tail.add(key)
+        else:
+            self.zero_tail.discard(key)
+
+    def _affected(self, song, zero_tail=True):
+        """Cached keys the song scores on, plus (with zero_tail) the ones ending in 0-point songs"""
+        keys = set(self.zero_tail) if zero_tail else set()
+        for j, attr in enumerate(ATTRIBUTES):
+            keys.update(self.keys_by_value[j].get(song[attr], ()))
+        return keys
+
+    def add(self, song):
+        """Append a song and return its position"""
+        i = len(self.songs)
+        self.songs.append(song)
+        self.index.add(i, song)
+        self.scorer.add(song)
+
+        results = self.cache.results
+        for j, attr in enumerate(ATTRIBUTES):
+            if song[attr] not in self.cache.values[attr]:
+                # A brand new value ranks exactly like the None ("nobody has it") slot did
+                self.cache.values[attr].add(song[attr])
+                for key in [key for key in results if key[j] is None]:
+                    new_key = key[:j] + (song[attr],) + key[j + 1:]
+                    results[new_key] = list(results[key])
+                    self._track(new_key)
+
+        if self.count <= self.depth:
+            # Lists may still hold every song, and then even a 0-point song gets a spot
+            keys = list(results)
+        else:
+            # In catalog order the newest song loses every tie, so 0-point tails can't take it
+            keys = self._affected(song, zero_tail=self.index.rank is not None)
+
+        genre, tempo, mood, style = (song[attr] for attr in ATTRIBUTES)
+        rank = self._rank(i)
+        floor = self.floor
+        for key in keys:
+            top = results[key]
+            # Inlined _score: this loop runs for every affected request on every append
+            score = 0
+            if key[0] == genre:
+                score += WEIGHTS["genre"]
+            if key[1] == tempo:
+                score += WEIGHTS["tempo"]
+            if key[2] == mood:
+                score += WEIGHTS["mood"]
+            if key[3] == style:
+                score += WEIGHTS["style"]
+            complete = len(top) == self.count
+            if not complete and (-score, rank) >= floor[key]:
+                # Doesn't beat the last entry, and past the end of the list some unlisted
+                # song may outrank it
+                continue
+            spot = len(top)
+            while spot > 0 and (-self._score(self.songs[top[spot - 1]], key), self._rank(top[spot - 1])) > (-score, rank):
+                spot -= 1
+            top.insert(spot, i)
+            del top[self.depth:]
+            self._refresh(key)
+        self.count += 1
+        return i
+
+    def add_many(self, songs):
+        return [self.add(song) for song in songs]
+
+    def remove(self, i):
+        """Delete the song at position i"""
+        song = self.songs[i]
+        if song is None:
+            raise KeyError(f"no song at position {i}")
+        # Only requests that were showing this song change, and most still have k left
+        keys = self._affected(song)
+        self.index.remove(i, song)
+        self.scorer.remove(i)
+        self.songs[i] = None
+        self.count -= 1
+
+        results = self.cache.results
+        for key in keys:
+            top = results[key]
+            if i in top:
+                top.remove(i)
+                if len(top) < self.k and len(top) < self.count:
+                    request = dict(zip(ATTRIBUTES, key))
+                    results[key] = [j for j, score in self.index.top_positions(request, self.depth)]
+                self._refresh(key)
+
+    def top_k(self, request, k=10):
+        """Best k (song, score) pairs from the cache, or from the index for bigger k"""
+        if k > self.k:
+            return self.index.top_k(request, k)
+        return self.cache.top_k(request, k)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from bingus_catalog import load_songs
+
+    rng = random.Random(0)
+    songs = load_songs()
+    live = LiveCatalog(songs[:600])
+
+    # Stream in the rest of the catalog plus some brand new genres while deleting at random
+    extra = songs[600:] + [dict(song, genre="jazz", title=song["title"] + " (jazz)") for song in songs[:40]]
+    start = time.perf_counter()
+    changes = 0
+    for song in extra:
+        live.add(song)
+        changes += 1
+        if rng.random() < 0.3:
+            alive = [i for i, s in enumerate(live.songs) if s is not None]
+            live.remove(rng.choice(alive))
+            changes += 1
+    elapsed = time.perf_counter() - start
+    print(f"{changes} incremental changes in {elapsed * 1000:.0f}ms ({elapsed / changes * 1000:.2f}ms each)")
+
+    # Every request must rank exactly like a catalog rebuilt from scratch
+    remaining = [song for song in live.songs if song is not None]
+    start = time.perf_counter()
+    fresh = RecommendationCache(remaining, path=None)
+    print(f"Full rebuild of {len(remaining)} songs: {(time.perf_counter() - start) * 1000:.0f}ms")
+    fresh_index = SongIndex(remaining)
+
+    values = {attr: sorted(fresh.values[attr]) + ["nope"] for attr in ATTRIBUTES}
+    checked = 0
+    for genre in values["genre"]:
+        for tempo in values["tempo"]:
+            for mood in values["mood"]:
+                for style in values["style"]:
+                    request = {"genre": genre, "tempo": tempo, "mood": mood, "style": style}
+                    expected = fresh.top_k(request)
+                    assert live.top_k(request) == expected, request
+                    assert live.index.top_k(request) == fresh_index.top_k(request), request
+                    assert [s for s, _ in live.scorer.top_k(request)] == [s for s, _ in expected], request
+                    checked += 1
+    print(f"All {checked} requests match a full rebuild")
@@ -0,0 +1,94 @@
+import asyncio
+import random
+import subprocess
+import sys
+import time
+from urllib.parse import urlencode
+
+from bingus_server import HOST, PORT
+
+GENRES = ["pop", "hip-hop", "soul", "r&b", "indie", "rock", "edm", "latin"]
+TEMPOS = ["slow", "medium", "fast"]
+MOODS = ["calm", "sad", "happy", "energetic"]
+STYLES = ["normal", "funky", "acoustic", "vintage"]
+
+
+def random_path(rng):
+    query = {"genre": rng.choice(GENRES), "tempo": rng.choice(TEMPOS),
+             "mood": rng.choice(MOODS), "style": rng.choice(STYLES)}
+    return f"/recommend?{urlencode(query)}"
+
+
+async def client(host, port, deadline, latencies, seed):
+    """One keep-alive connection sending requests back to back until the deadline"""
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            request = f"GET {random_path(rng)} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("ascii")
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run_load(concurrency, seconds=5.0, host=HOST, port=PORT):
+    """Requests/second and latency percentiles (ms) at a given number of connections"""
+    latencies = []
+    start = time.perf_counter()
+    deadline = start + seconds
+    await asyncio.gather(*(client(host, port, deadline, latencies, seed) for seed in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {
+        "connections": concurrency,
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50": percentile(latencies, 50) * 1000,
+        "p90": percentile(latencies, 90) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+    }
+
+
+async def wait_for_server(host, port, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+if __name__ == "__main__":
+    # Starts its own server process so the numbers include real sockets
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else PORT
+    server = subprocess.Popen([sys.executable, "bingus_server.py", str(port)])
+    try:
+        asyncio.run(wait_for_server(HOST, port))
+        print("connections   requests   req/s      p50       p90       p99")
+        for concurrency in (1, 100, 1000):
+            stats = asyncio.run(run_load(concurrency, port=port))
+            print(f"{stats['connections']:<13} {stats['requests']:<10} {stats['rps']:<10.0f} "
+                  f"{stats['p50']:6.2f}ms  {stats['p90']:6.2f}ms  {stats['p99']:6.2f}ms")
+    finally:
+        server.terminate()
+        server.wait()
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import re
+
+from bingus_clean import artist_key, normalize_text, title_key
+from bingus_csv import HERE, POPULAR_CSV, TRACKS_CSV, iter_csv_songs
+
+# Next to the CSVs it is joined from, not in whatever directory the app was started from
+POPULARITY_FILE = os.path.join(HERE, "bingus_popularity.json")
+# Bump when the join rules change so saved popularity from the old rules isn't reused
+JOIN_VERSION = 2
+
+# What Spotify puts after " - " on a version of a song: "Remastered 2009", "Live at ...", "Radio Edit"
+_SUFFIXES = (
+    r"(?:\d{4}\s+)?remaster(?:ed)?(?:\s+\d{4})?", r"live(?:\s+(?:at|from|in|on|version)\b.*)?", r"ao vivo\b.*",
+    r"radio edit", r"edit", r"radio mix", r"original mix", r"single version", r"album version",
+    r"(?:\d{4}\s+)?mono(?:\s+version)?", r"(?:\d{4}\s+)?stereo(?:\s+mix)?", r"acoustic(?:\s+version)?",
+    r"instrumental", r"sped up", r"slowed(?:\s+\+\s+reverb)?", r"bonus track", r"from\s.*",
+)
+# "Song (feat. X)", "Song [Remastered]", "Song - Radio Edit" -> "Song". Only known suffixes after
+# a dash go, since plenty of real titles have one ("Migos - Stir Fry" isn't "Migos")
+_DECORATION = re.compile(r"\s*[(\[][^)\]]*[)\]]|\s+-\s+(?:" + "|".join(_SUFFIXES) + r")\s*$", re.IGNORECASE)
+
+
+def join_key(title, artist):
+    """Hash key for matching a catalog song with a Spotify row: spelling-proof title and artist"""
+    artist = normalize_text(artist)
+    return title_key(normalize_text(title)), artist_key(artist) or artist.casefold()
+
+
+def _variants(title, artist):
+    # Spotify lists every artist ("Lady Gaga, Bruno Mars") and decorates titles, the catalog doesn't
+    for a in dict.fromkeys((artist, artist.split(",")[0])):
+        for t in dict.fromkeys((title, _DECORATION.sub("", title))):
+            if t:
+                yield join_key(t, a)
+
+
+def build_table(paths=(TRACKS_CSV, POPULAR_CSV)):
+    """{join key: popularity} over the Spotify exports; a track listed twice keeps its best"""
+    table = {}
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        for song in iter_csv_songs(path):
+            for key in _variants(song["title"], song["artist"]):
+                if song["popularity"] > table.get(key, -1):
+                    table[key] = song["popularity"]
+    return table
+
+
+def join_popularity(songs, table=None, stats=None):
+    """Yield songs with "popularity" filled in from the table, 0 when Spotify has no match
+
+    Songs that already carry a popularity (e.g. straight from the CSVs) keep it.
+    stats gets rows / matched counts if a dict is passed.
+    """
+    if table is None:
+        table = build_table()
+    if stats is None:
+        stats = {}
+    stats.update(rows=0, matched=0)
+
+    for song in songs:
+        stats["rows"] += 1
+        if song.get("popularity") is not None:
+            yield song
+            continue
+        popularity = None
+        for key in _variants(song["title"], song["artist"]):
+            popularity = table.get(key)
+            if popularity is not None:
+                stats["matched"] += 1
+                break
+        yield dict(song, popularity=popularity or 0)
+
+
+def _sources(paths):
+    return [[path, os.stat(path).st_size, os.stat(path).st_mtime_ns] for path in paths if os.path.exists(path)]
+
+
+def _fingerprint(songs):
+    digest = hashlib.blake2b(digest_size=16)
+    for song in songs:
+        digest.update(f"{song['title']}\0{song['artist']}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def attach_popularity(songs, paths=(TRACKS_CSV, POPULAR_CSV), path=POPULARITY_FILE):
+    """Set "popularity" on every song in the list, in place, and return the list
+
+    Joining means parsing both CSVs, so the result (one number per song) is saved to path
+    and reused while the CSVs and the catalog's titles/artists stay the same (path=None: no file).
+    """
+    sources = _sources(paths)
+    fingerprint = _fingerprint(songs)
+    popularity = None
+    if path is not None and os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if (data.get("version") == JOIN_VERSION and data.get("sources") == sources
+                    and data.get("catalog") == fingerprint):
+                popularity = data["popularity"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    if popularity is None:
+        popularity = [song["popularity"] for song in join_popularity(songs, build_table(paths))]
+        if path is not None:
+            try:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump({"version": JOIN_VERSION, "sources": sources, "catalog": fingerprint,
+                               "popularity": popularity}, f, separators=(",", ":"))
+            except OSError as e:
+                print(f"⚠️ Could not save popularity: {e}")
+
+    for song, value in zip(songs, popularity):
+        song["popularity"] = value
+    return songs
+
+
+if __name__ == "__main__":
+    import time
+
+    from bingus_catalog import load_songs
+
+    start = time.perf_counter()
+    table = build_table()
+    print(f"Hashed {len(table)} Spotify keys in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    stats = {}
+    songs = list(join_popularity(load_songs(), table, stats))
+    print(f"Matched {stats['matched']} of {stats['rows']} catalog songs")
+    for song in sorted(songs, key=lambda s: -s["popularity"])[:5]:
+        print(f"  {song['popularity']:3d}  {song['title']} by {song['artist']}")
+
+    attach_popularity([dict(song) for song in load_songs()])  # writes the file
+    start = time.perf_counter()
+    attach_popularity([dict(song) for song in load_songs()])
+    print(f"Reused saved popularity in {(time.perf_counter() - start) * 1000:.1f}ms")
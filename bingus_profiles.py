@@ -0,0 +1,157 @@
+import numpy as np
+
+from bingus_catalog import ATTRIBUTES, WEIGHTS
+from bingus_numpy import VectorScorer
+
+# Tempos next to each other count as "close"
+TEMPO_NEIGHBOURS = {("slow", "medium"): 0.5, ("medium", "fast"): 0.5}
+
+# Moods that are near enough to earn part of the points
+MOOD_NEIGHBOURS = {
+    ("calm", "chill"): 0.6, ("calm", "dreamy"): 0.5, ("sad", "melancholy"): 0.7, ("sad", "emotional"): 0.5,
+    ("happy", "uplifting"): 0.7, ("energetic", "confident"): 0.5, ("energetic", "empowered"): 0.5,
+}
+
+
+class ScoringProfile:
+    """Per-attribute weights, partial credit for close values and an optional popularity boost
+
+    similar maps an attribute to {(value, value): fraction of the weight}, in either order.
+    popularity_boost is points per popularity point (Spotify's 0-100 scale).
+    """
+
+    def __init__(self, name, weights=None, similar=None, popularity_boost=0.0):
+        self.name = name
+        self.weights = dict(WEIGHTS, **(weights or {}))
+        self.similar = similar or {}
+        self.popularity_boost = popularity_boost
+
+    @property
+    def perfect_score(self):
+        """Points for matching all four attributes, not counting popularity"""
+        return sum(self.weights[attr] for attr in ATTRIBUTES)
+
+    def credit(self, attr, wanted, value):
+        """Points a song with value earns when the request asked for wanted"""
+        if value == wanted:
+            return self.weights[attr]
+        pairs = self.similar.get(attr, {})
+        fraction = pairs.get((wanted, value), pairs.get((value, wanted), 0.0))
+        return self.weights[attr] * fraction
+
+
+PROFILES = {
+    # Exactly what get_match_score does
+    "classic": ScoringProfile("classic"),
+    "relaxed": ScoringProfile("relaxed", similar={"tempo": TEMPO_NEIGHBOURS, "mood": MOOD_NEIGHBOURS}),
+    "popular": ScoringProfile("popular", popularity_boost=0.01),
+}
+
+
+class ScoringPlan:
+    """A profile compiled against one catalog's encoded columns
+
+    Each attribute gets a lookup table per requested value (points for every code in the
+    column), so scoring a song is a gather from the table instead of branches. A table with
+    a single non-zero entry (plain exact match) is kept as (code, points) and scored with
+    one == compare, which is cheaper than a gather. Tables are built the first time a
+    value is asked for and reused after that.
+
+    The tables cover the codes the scorer had when the plan was made, so a scorer that grows
+    (LiveScorer) needs a new plan; plan_for checks that through state.
+    """
+
+    def __init__(self, profile, scorer):
+        self.profile = profile
+        self.scorer = scorer
+        self.tables = {attr: {} for attr in ATTRIBUTES}
+        self.values = {attr: list(scorer.vocab[attr]) for attr in ATTRIBUTES}
+        self.state = self.state_of(scorer)
+
+        self.boost = None
+        if profile.popularity_boost:
+            # A LiveScorer's songs has None where a song was deleted
+            popularity = np.fromiter(((song or {}).get("popularity", 0) or 0 for song in scorer.songs),
+                                     dtype=np.float64, count=len(scorer.songs))
+            self.boost = popularity * profile.popularity_boost
+
+    @staticmethod
+    def state_of(scorer):
+        """What the plan was compiled against: vocabulary sizes and song count"""
+        return tuple(len(scorer.vocab[attr]) for attr in ATTRIBUTES) + (len(scorer.songs),)
+
+    def table(self, attr, wanted):
+        """Points per code of attr for a request asking for wanted, (code, points) for a
+        single exact match, or None if nothing scores"""
+        tables = self.tables[attr]
+        if wanted not in tables:
+            row = np.array([self.profile.credit(attr, wanted, value) for value in self.values[attr]])
+            hits = np.flatnonzero(row)
+            if len(hits) == 0:
+                tables[wanted] = None
+            elif len(hits) == 1:
+                tables[wanted] = (int(hits[0]), float(row[hits[0]]))
+            else:
+                tables[wanted] = row
+        return tables[wanted]
+
+    def scores(self, request):
+        scores = np.zeros(len(self.scorer.songs))
+        # Same attribute order as get_match_score, so the classic profile gives identical sums
+        for attr in ATTRIBUTES:
+            table = self.table(attr, request.get(attr))
+            if table is None:
+                continue
+            if isinstance(table, tuple):
+                code, points = table
+                scores += (self.scorer.columns[attr] == code) * points
+            else:
+                scores += table[self.scorer.columns[attr]]
+        if self.boost is not None:
+            scores += self.boost
+        return scores
+
+    def top_k(self, request, k=10):
+        scores = self.scores(request)
+        return [(self.scorer.songs[i], float(scores[i])) for i in VectorScorer.top_indices(scores, k, self.scorer.rank)]
+
+
+def plan_for(profile, scorer):
+    """Compiled plan for a profile (or profile name) on a scorer, built once and cached"""
+    if isinstance(profile, str):
+        profile = PROFILES[profile]
+    # Cached on the scorer so the plans go when it does, keyed by the profile object because
+    # two custom profiles may share a name. Recompiled if the scorer gained songs or values
+    plan = scorer.plans.get(profile)
+    if plan is None or plan.state != ScoringPlan.state_of(scorer):
+        plan = scorer.plans[profile] = ScoringPlan(profile, scorer)
+    return plan
+
+
+if __name__ == "__main__":
+    import time
+
+    from bingus_catalog import synthetic_songs
+
+    request = {"genre": "r&b", "tempo": "slow", "mood": "calm", "style": "normal"}
+    songs = synthetic_songs(1_000_000)
+    for i, song in enumerate(songs):
+        song["popularity"] = i % 101
+    scorer = VectorScorer(songs)
+
+    start = time.perf_counter()
+    for _ in range(20):
+        expected = scorer.top_k(request)
+    base = (time.perf_counter() - start) / 20
+    print(f"VectorScorer (== compares): {base * 1000:.1f}ms per query")
+
+    for name in PROFILES:
+        plan = plan_for(name, scorer)
+        plan.top_k(request)  # build the tables
+        start = time.perf_counter()
+        for _ in range(20):
+            got = plan.top_k(request)
+        elapsed = (time.perf_counter() - start) / 20
+        if name == "classic":
+            assert got == expected
+        print(f"{name:<8} plan: {elapsed * 1000:.1f}ms per query, top: {got[0][0]['title']} ({got[0][1]:.2f})")
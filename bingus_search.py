@@ -0,0 +1,297 @@
+import bisect
+import math
+import os
+import re
+import zipfile
+import zlib
+from array import array
+
+import numpy as np
+
+from bingus_cache import catalog_hash
+from bingus_clean import normalize_text
+from bingus_csv import HERE
+
+FIELDS = ("title", "artist")
+
+# Share of the query's trigrams a match must contain ('tayler swft' keeps 3 of 8 with 'taylor swift')
+MIN_COVERAGE = 1 / 3
+
+_NOT_ALNUM = re.compile(r"[\W_]+")
+
+
+def search_key(text):
+    """Casefolded words with punctuation dropped: 'The Weeknd!' -> 'the weeknd'"""
+    return _NOT_ALNUM.sub(" ", normalize_text(text).casefold()).strip()
+
+
+def trigrams(key):
+    """Distinct trigrams of a key with its spaces removed, so 'theweeknd' and 'the weeknd'
+    look the same; keys shorter than 3 characters are their own single gram"""
+    compact = key.replace(" ", "")
+    if len(compact) < 3:
+        return {compact} if compact else set()
+    return {compact[i:i + 3] for i in range(len(compact) - 2)}
+
+
+def index_path(catalog_path):
+    """Where the search index of a catalog file is kept: songs.bin -> songs.search.npz"""
+    return os.path.splitext(catalog_path)[0] + ".search.npz"
+
+
+# Next to the built-in catalog, not in whatever directory the app was started from
+SEARCH_FILE = index_path(os.path.join(HERE, "bingus_songs.py"))
+
+
+def _join(strings):
+    return np.frombuffer("\0".join(strings).encode("utf-8"), dtype=np.uint8)
+
+
+def _best(values, docs, limit):
+    """Positions of the limit largest values, ties to the lower document, best first"""
+    if limit is not None and len(values) > limit:
+        cut = np.partition(values, len(values) - limit)[len(values) - limit]
+        keep = np.flatnonzero(values >= cut)
+    else:
+        keep = np.arange(len(values))
+    return keep[np.lexsort((docs[keep], -values[keep]))][:limit]
+
+
+def _split(heap, count):
+    return heap.tobytes().decode("utf-8").split("\0") if count else []
+
+
+class SearchIndex:
+    """Trigram inverted index over song titles and artists, plus a sorted word list for autocomplete
+
+    Every distinct (field, search key) is one document, so the 14 songs by The Weeknd share a
+    single artist document. A document's trigrams go into posting lists (CSR arrays sorted by
+    document), and every word start of its key goes into one sorted suffix array, so a prefix
+    is two binary searches.
+    """
+
+    def __init__(self, songs=None):
+        self.hash = None
+        if songs is None:
+            return
+        songs = list(songs)
+        self.hash = catalog_hash(songs)
+
+        doc_ids = {}
+        texts, keys = [], []
+        fields = array("B")
+        song_docs = array("I")  # title doc then artist doc of every song
+        for song in songs:
+            for f, field in enumerate(FIELDS):
+                key = search_key(song[field])
+                doc = doc_ids.get((f, key))
+                if doc is None:
+                    doc = doc_ids[(f, key)] = len(texts)
+                    texts.append(song[field].replace("\0", ""))
+                    keys.append(key)
+                    fields.append(f)
+                song_docs.append(doc)
+
+        gram_ids = {}
+        gram_col, doc_col = array("I"), array("I")
+        gram_counts = array("H")
+        suffixes = []
+        for doc, key in enumerate(keys):
+            grams = trigrams(key)
+            gram_counts.append(min(len(grams), 0xFFFF))
+            for gram in grams:
+                gram_col.append(gram_ids.setdefault(gram, len(gram_ids)))
+                doc_col.append(doc)
+            if key:
+                suffixes.append((key, doc, 0))
+                suffixes += [(key[i + 1:], doc, i + 1) for i, c in enumerate(key) if c == " "]
+        suffixes.sort()
+
+        self.texts = texts
+        self.keys = keys
+        self.grams = list(gram_ids)
+        self.fields = np.frombuffer(fields, dtype=np.uint8)
+        self.gram_counts = np.frombuffer(gram_counts, dtype=np.uint16)
+
+        song_docs = np.frombuffer(song_docs, dtype=np.uint32)
+        self.doc_songs = (np.argsort(song_docs, kind="stable") // len(FIELDS)).astype(np.uint32)
+        self.doc_offsets = np.concatenate(([0], np.cumsum(np.bincount(song_docs, minlength=len(texts)))))
+
+        gram_col = np.frombuffer(gram_col, dtype=np.uint32)
+        # Stable sort keeps every posting list in document order, so searchsorted works on it
+        self.postings = np.frombuffer(doc_col, dtype=np.uint32)[np.argsort(gram_col, kind="stable")]
+        self.gram_offsets = np.concatenate(([0], np.cumsum(np.bincount(gram_col, minlength=len(self.grams)))))
+
+        self.suffix_docs = np.array([doc for _, doc, _ in suffixes], dtype=np.uint32)
+        self.suffix_starts = np.array([start for _, _, start in suffixes], dtype=np.uint16)
+        self._prepare()
+
+    def _prepare(self):
+        self.gram_ids = {gram: i for i, gram in enumerate(self.grams)}
+        self.song_counts = np.diff(self.doc_offsets)
+
+    def save(self, path):
+        np.savez(path, hash=np.array(self.hash or ""), texts=_join(self.texts), keys=_join(self.keys),
+                 grams=_join(self.grams), fields=self.fields, gram_counts=self.gram_counts,
+                 doc_songs=self.doc_songs, doc_offsets=self.doc_offsets, postings=self.postings,
+                 gram_offsets=self.gram_offsets, suffix_docs=self.suffix_docs,
+                 suffix_starts=self.suffix_starts)
+
+    @classmethod
+    def load(cls, path):
+        index = cls()
+        with np.load(path) as data:
+            index.hash = str(data["hash"]) or None
+            index.texts = _split(data["texts"], len(data["fields"]))
+            index.keys = _split(data["keys"], len(data["fields"]))
+            index.grams = _split(data["grams"], len(data["gram_offsets"]) - 1)
+            for name in ("fields", "gram_counts", "doc_songs", "doc_offsets", "postings", "gram_offsets",
+                         "suffix_docs", "suffix_starts"):
+                setattr(index, name, data[name])
+        index._prepare()
+        return index
+
+    def _posting(self, gram_id):
+        return self.postings[self.gram_offsets[gram_id]:self.gram_offsets[gram_id + 1]]
+
+    def match_docs(self, query, field=None, limit=None):
+        """Up to limit (document, similarity) pairs for a query, best first
+
+        Matches have to share at least MIN_COVERAGE of the query's trigrams. Shared grams are
+        counted over the query's posting lists in one go: a sort when the lists are short, a
+        bincount over every document when they are long. Ranked by Dice similarity
+        2 * shared / (query grams + document grams), ties in catalog order.
+        """
+        grams = trigrams(search_key(query))
+        if not grams:
+            return []
+        needed = max(1, math.ceil(len(grams) * MIN_COVERAGE))
+        lists = [self._posting(self.gram_ids[g]) for g in grams if g in self.gram_ids]
+        if len(lists) < needed:
+            return []
+
+        hits = np.concatenate(lists)
+        if len(hits) < len(self.texts) // 8:
+            candidates, shared = np.unique(hits, return_counts=True)
+        else:
+            shared = np.bincount(hits, minlength=len(self.texts))
+            candidates = np.flatnonzero(shared >= needed)
+            shared = shared[candidates]
+        if field is not None:
+            keep = self.fields[candidates] == FIELDS.index(field)
+            candidates, shared = candidates[keep], shared[keep]
+        keep = shared >= needed
+        candidates, shared = candidates[keep], shared[keep]
+
+        similarity = 2 * shared / (len(grams) + self.gram_counts[candidates].astype(np.float64))
+        order = _best(similarity, candidates, limit)
+        return [(int(candidates[i]), float(similarity[i])) for i in order]
+
+    def search(self, query, songs, k=10, field=None):
+        """Best k (song, similarity) pairs whose title or artist looks like the query"""
+        results = []
+        taken = set()
+        # Every document has at least one song, so k documents are always enough
+        for doc, similarity in self.match_docs(query, field, limit=k):
+            for i in self.doc_songs[self.doc_offsets[doc]:self.doc_offsets[doc + 1]]:
+                i = int(i)
+                # A song can match on both title and artist; its better match came first
+                if i not in taken:
+                    taken.add(i)
+                    results.append((songs[i], similarity))
+                    if len(results) == k:
+                        return results
+        return results
+
+    def complete(self, prefix, k=10, field=None):
+        """Up to k (text, field, song count) whose title or artist has a word starting with prefix,
+        the ones with the most songs first"""
+        prefix = search_key(prefix)
+        if not prefix:
+            return []
+
+        def suffix(j):
+            return self.keys[self.suffix_docs[j]][self.suffix_starts[j]:]
+
+        positions = range(len(self.suffix_docs))
+        lo = bisect.bisect_left(positions, prefix, key=suffix)
+        hi = bisect.bisect_left(positions, prefix + "\U0010FFFF", lo=lo, key=suffix)
+        docs = self.suffix_docs[lo:hi]
+        if field is not None:
+            docs = docs[self.fields[docs] == FIELDS.index(field)]
+        # A document shows up once per matching word, so ask for a few spares before dropping repeats
+        order = _best(self.song_counts[docs], docs, 4 * k)
+        best = list(dict.fromkeys(docs[order].tolist()))
+        if len(best) < k and len(order) < len(docs):
+            docs = np.unique(docs)
+            best = docs[_best(self.song_counts[docs], docs, k)].tolist()
+        return [(self.texts[d], FIELDS[self.fields[d]], int(self.song_counts[d])) for d in best[:k]]
+
+
+def open_search_index(songs, path=SEARCH_FILE):
+    """Saved index at path if it was built from these songs, otherwise build and save one
+    (a truncated or damaged file is rebuilt over)"""
+    if path is not None and os.path.exists(path):
+        try:
+            index = SearchIndex.load(path)
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile, zlib.error):
+            index = None
+        if index is not None and index.hash == catalog_hash(songs):
+            return index
+
+    index = SearchIndex(songs)
+    if path is not None:
+        try:
+            index.save(path)
+        except OSError as e:
+            print(f"⚠️ Could not save search index: {e}")
+    return index
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from bingus_catalog import load_songs
+    from bingus_csv import iter_songs
+
+    songs = load_songs()
+    index = open_search_index(songs, path=None)
+    for query in ("weeknd", "Theweeknd", "tayler swft", "blinding lights"):
+        top = index.search(query, songs, 3)
+        print(f"{query!r}: " + ", ".join(f"{s['title']} by {s['artist']} ({sim:.2f})" for s, sim in top))
+    print(f"'we' -> {index.complete('we', 5)}")
+
+    # A million songs with titles made of real title words and a mix of real and made-up artists
+    real = songs + list(iter_songs())
+    words = [w for song in real for w in song["title"].split()]
+    artists = [song["artist"] for song in real]
+    rng = random.Random(0)
+    big = []
+    for i in range(1_000_000):
+        title = " ".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+        artist = rng.choice(artists) if rng.random() < 0.7 else f"{rng.choice(words)} {rng.choice(words)}"
+        big.append({"title": title, "artist": artist, "genre": "pop", "tempo": "fast",
+                    "mood": "happy", "style": "normal"})
+
+    start = time.perf_counter()
+    index = SearchIndex(big)
+    print(f"\nBuilt index over {len(big)} songs ({len(index.texts)} documents) "
+          f"in {time.perf_counter() - start:.1f}s")
+    index.save(index_path("synthetic_songs.bin"))
+    start = time.perf_counter()
+    index = SearchIndex.load(index_path("synthetic_songs.bin"))
+    print(f"Loaded saved index in {time.perf_counter() - start:.2f}s")
+
+    queries = [rng.choice(real)[rng.choice(FIELDS)] for _ in range(200)]
+    typos = [q[:len(q) // 2] + q[len(q) // 2 + 1:] for q in queries]
+    for label, batch, run in (("search", queries, lambda q: index.search(q, big)),
+                              ("search w/ typo", typos, lambda q: index.search(q, big)),
+                              ("complete", [q[:3] for q in queries], lambda q: index.complete(q))):
+        times = []
+        for q in batch:
+            start = time.perf_counter()
+            run(q)
+            times.append(time.perf_counter() - start)
+        times.sort()
+        print(f"{label:<15} p50 {times[len(times) // 2] * 1000:6.2f}ms   p99 {times[int(len(times) * 0.99)] * 1000:6.2f}ms")
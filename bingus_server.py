@@ -0,0 +1,151 @@
+import asyncio
+import json
+import sys
+from urllib.parse import parse_qs, urlsplit
+
+import bingus_stats
+import bingusRUNR
+from bingus_catalog import ATTRIBUTES
+
+HOST = "127.0.0.1"
+PORT = 8025
+MAX_K = 100
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           500: "Internal Server Error"}
+
+
+def handle_query(path):
+    """(status, body) for a request path like /recommend?genre=pop&tempo=fast"""
+    url = urlsplit(path)
+    if url.path == "/metrics":
+        return 200, bingus_stats.prometheus_text()
+    if url.path == "/health":
+        return 200, {"status": "ok", "songs": len(bingusRUNR.get_songs())}
+    params = parse_qs(url.query)
+    if url.path == "/facets":
+        return handle_facets(params)
+    if url.path not in ("/recommend", "/search", "/complete"):
+        return 404, {"error": f"unknown path {url.path}"}
+
+    try:
+        k = int(params.get("k", ["10"])[0])
+    except ValueError:
+        return 400, {"error": "k must be a number"}
+    if not 1 <= k <= MAX_K:
+        return 400, {"error": f"k must be between 1 and {MAX_K}"}
+    if url.path != "/recommend":
+        return handle_search(url.path, params.get("q", [""])[0], k)
+
+    request = {attr: params[attr][0].strip().lower() for attr in ATTRIBUTES if attr in params}
+    results = [dict(song, score=score) for song, score in bingusRUNR.recommend(request, k)]
+    return 200, {"request": request, "results": results}
+
+
+def handle_facets(params):
+    """/facets?genre=pop&mood=happy&mood=calm: repeating a field ORs its values"""
+    from bingus_facets import FIELDS
+
+    filters = {}
+    for field in FIELDS:
+        if field in params:
+            # Artist names keep their case, attributes are stored lower case
+            values = [v.strip() for v in params[field]]
+            filters[field] = values if field == "artist" else [v.lower() for v in values]
+    facets = bingusRUNR.get_facets()
+    return 200, {"filters": filters, "total": facets.total(filters), "facets": facets.facets(filters)}
+
+
+def handle_search(path, query, k):
+    """/search?q=weeknd for songs, /complete?q=wee for titles and artists to suggest"""
+    if not query.strip():
+        return 400, {"error": "q is required"}
+    if path == "/complete":
+        suggestions = bingusRUNR.get_search().complete(query, k)
+        return 200, {"query": query, "suggestions": [{"text": text, "field": field, "songs": count}
+                                                     for text, field, count in suggestions]}
+    results = [dict(song, similarity=round(similarity, 3)) for song, similarity in bingusRUNR.search(query, k)]
+    return 200, {"query": query, "results": results}
+
+
+def render(status, body, keep_alive):
+    # Dicts go out as JSON, strings (the /metrics page) as plain text
+    if isinstance(body, str):
+        payload, content_type = body.encode("utf-8"), "text/plain; version=0.0.4"
+    else:
+        payload, content_type = json.dumps(body, ensure_ascii=False).encode("utf-8"), "application/json"
+    head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            f"Content-Type: {content_type}; charset=utf-8\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("ascii") + payload
+
+
+async def serve_client(reader, writer):
+    """One connection; keeps reading requests until the client closes or asks to"""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            try:
+                method, path, version = request_line.decode("latin-1").split()
+            except ValueError:
+                writer.write(render(400, {"error": "malformed request line"}, False))
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip().lower()
+
+            # No request bodies are used, but don't leave one in the stream either. A length
+            # we can't read means we can't find the next request, so answer and hang up
+            length = headers.get("content-length", "0") or "0"
+            if not (length.isascii() and length.isdigit()):
+                writer.write(render(400, {"error": "bad Content-Length"}, False))
+                break
+            if int(length):
+                await reader.readexactly(int(length))
+
+            keep_alive = headers.get("connection", "keep-alive" if version == "HTTP/1.1" else "close") != "close"
+            if method != "GET":
+                status, body = 405, {"error": "only GET is supported"}
+            else:
+                try:
+                    status, body = handle_query(path)
+                except Exception as error:
+                    # A bug in one handler shouldn't drop the connection without an answer
+                    print(f"⚠️ {method} {path} failed: {error!r}", file=sys.stderr, flush=True)
+                    status, body = 500, {"error": "internal error"}
+            writer.write(render(status, body, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def main(host=HOST, port=PORT):
+    # Load the catalog and build every index before taking traffic: a build inside a handler
+    # would run on the event loop and stall every other connection.
+    # Timing stays opt-in (BINGUS_STATS=1), /metrics is empty without it
+    bingusRUNR.get_index()
+    bingusRUNR.get_facets()
+    bingusRUNR.get_search()
+    server = await asyncio.start_server(serve_client, host, port, backlog=2048)
+    print(f"recommendR serving {len(bingusRUNR.get_songs())} songs on http://{host}:{port}/recommend", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main(port=int(sys.argv[1]) if len(sys.argv) > 1 else PORT))
+    except KeyboardInterrupt:
+        pass
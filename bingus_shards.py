@@ -0,0 +1,128 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from bingus_catalog import ATTRIBUTES, WEIGHTS
+from bingus_numpy import VectorScorer
+
+# Worker-side views into the shared columns, set up once per process by _attach
+_shm = None
+_columns = None
+
+
+def _attach(name, layout):
+    global _shm, _columns
+    # Pool workers share the parent's resource tracker, so the parent's unlink() cleans this up
+    _shm = shared_memory.SharedMemory(name=name)
+    _columns = {attr: np.ndarray((count,), dtype=dtype, buffer=_shm.buf, offset=offset)
+                for attr, (offset, count, dtype) in layout.items()}
+
+
+def _score_shard(codes, start, end, k):
+    """Top k (positions, scores) of one slice of the catalog"""
+    scores = np.zeros(end - start)
+    for attr, code in zip(ATTRIBUTES, codes):
+        if code >= 0:
+            scores += (_columns[attr][start:end] == code) * float(WEIGHTS[attr])
+    rank = _columns["rank"][start:end] if "rank" in _columns else None
+    top = VectorScorer.top_indices(scores, k, rank)
+    return top + start, scores[top]
+
+
+class ShardedScorer:
+    """Splits scoring across a process pool; the encoded columns live in one shared memory block"""
+
+    def __init__(self, vocab, columns, songs=None, workers=None, shards=None, rank=None):
+        """rank: VectorScorer.rank of a by_popularity scorer, shared along with the columns"""
+        self.vocab = vocab
+        self.songs = songs
+        self.rank = rank
+        self.count = len(columns[ATTRIBUTES[0]])
+        if rank is not None:
+            columns = dict(columns, rank=rank)
+        self.workers = workers or os.cpu_count() or 1
+        self.shards = shards or self.workers
+
+        layout = {}
+        size = 0
+        for attr in columns:
+            column = columns[attr]
+            size += -size % 8
+            layout[attr] = (size, len(column), column.dtype.str)
+            size += column.nbytes
+
+        # Copy the columns in once; workers attach by name instead of getting them pickled per call
+        self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for attr, (offset, count, dtype) in layout.items():
+            np.ndarray((count,), dtype=dtype, buffer=self.shm.buf, offset=offset)[:] = columns[attr]
+
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_attach, initargs=(self.shm.name, layout))
+        bounds = np.linspace(0, self.count, self.shards + 1).astype(int)
+        self.ranges = [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+    @classmethod
+    def from_scorer(cls, scorer, workers=None):
+        return cls(scorer.vocab, scorer.columns, scorer.songs, workers, rank=scorer.rank)
+
+    def top_indices(self, request, k=10):
+        """(positions, scores) of the best k songs, merged from every shard's own top k"""
+        codes = tuple(self.vocab[attr].get(request.get(attr), -1) for attr in ATTRIBUTES)
+        parts = list(self.pool.map(_score_shard, *zip(*[(codes, start, end, k) for start, end in self.ranges])))
+        if not parts:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+
+        positions = np.concatenate([p for p, _ in parts])
+        scores = np.concatenate([s for _, s in parts])
+        # Best score first, then catalog order (or rank), same as the single-process scorer
+        order = np.lexsort((positions if self.rank is None else self.rank[positions], -scores))[:k]
+        return positions[order], scores[order]
+
+    def top_k(self, request, k=10):
+        positions, scores = self.top_indices(request, k)
+        return [(self.songs[i], float(score)) for i, score in zip(positions, scores)]
+
+    def close(self):
+        self.pool.shutdown()
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import time
+
+    from bingus_catalog import load_songs
+
+    # 5M songs as encoded columns straight away; 5M dicts would need gigabytes of RAM first
+    n = 5_000_000
+    base = VectorScorer(load_songs())
+    rng = np.random.default_rng(0)
+    columns = {attr: base.columns[attr][rng.integers(0, len(base.songs), n)] for attr in ATTRIBUTES}
+    single = VectorScorer([])
+    single.vocab, single.columns, single.songs = base.vocab, columns, range(n)
+
+    requests = [{"genre": "hip-hop", "tempo": "medium", "mood": "energetic", "style": "normal"},
+                {"genre": "indie", "tempo": "slow", "mood": "dreamy", "style": "acoustic"},
+                {"genre": "r&b", "tempo": "fast", "mood": "sad", "style": "funky"}] * 5
+
+    start = time.perf_counter()
+    expected = [single.top_indices(single.scores(r)) for r in requests]
+    baseline = (time.perf_counter() - start) / len(requests)
+    print(f"{n} songs, single process: {baseline * 1000:.1f}ms per query")
+
+    print("workers   per query   speedup")
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        with ShardedScorer(base.vocab, columns, workers=workers) as sharded:
+            sharded.top_indices(requests[0])  # start the workers
+            start = time.perf_counter()
+            got = [sharded.top_indices(r)[0] for r in requests]
+            elapsed = (time.perf_counter() - start) / len(requests)
+        assert all(np.array_equal(a, b) for a, b in zip(got, expected))
+        print(f"{workers:<9} {elapsed * 1000:7.1f}ms   {baseline / elapsed:6.2f}x")
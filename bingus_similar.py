@@ -0,0 +1,168 @@
+import csv
+import heapq
+
+import numpy as np
+
+from bingus_csv import POPULAR_CSV
+
+# Audio features in high_popularity_spotify_data.csv that describe how a track sounds
+FEATURES = ("energy", "tempo", "danceability", "valence", "loudness", "acousticness")
+
+# Below this many tracks one matrix-vector product beats walking a tree
+BRUTE_FORCE_LIMIT = 20_000
+
+
+def load_features(path=POPULAR_CSV):
+    """Tracks (title/artist/id dicts) and their raw feature matrix, one row per unique track"""
+    tracks = []
+    rows = []
+    seen = set()
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            # The same track shows up once per playlist it's on
+            if row["track_id"] in seen:
+                continue
+            try:
+                values = [float(row[name]) for name in FEATURES]
+            except (KeyError, ValueError):
+                continue
+            seen.add(row["track_id"])
+            tracks.append({"title": row["track_name"], "artist": row["track_artist"], "id": row["track_id"]})
+            rows.append(values)
+    return tracks, np.array(rows, dtype=np.float32).reshape(-1, len(FEATURES))
+
+
+class KDTree:
+    """Plain NumPy k-d tree: nodes split on the widest dimension, leaves scanned as arrays"""
+
+    def __init__(self, points, leaf_size=32):
+        self.points = points
+        self.leaf_size = leaf_size
+        self.order = np.arange(len(points))
+        # Each node is (split dim or -1 for a leaf, split value, left, right, start, end)
+        self.nodes = []
+        self.root = self._build(0, len(points))
+
+    def _build(self, start, end):
+        node = len(self.nodes)
+        self.nodes.append(None)
+        if end - start <= self.leaf_size:
+            self.nodes[node] = (-1, 0.0, -1, -1, start, end)
+            return node
+
+        idx = self.order[start:end]
+        points = self.points[idx]
+        dim = int(np.argmax(points.max(axis=0) - points.min(axis=0)))
+        mid = (end - start) // 2
+        self.order[start:end] = idx[np.argpartition(points[:, dim], mid)]
+        value = float(self.points[self.order[start + mid], dim])
+
+        left = self._build(start, start + mid)
+        right = self._build(start + mid, end)
+        self.nodes[node] = (dim, value, left, right, start, end)
+        return node
+
+    def query(self, q, k):
+        """(squared distance, row) of the k rows closest to q, nearest first"""
+        best = []  # max-heap on distance via negated values
+        stack = [(0.0, self.root)]
+        while stack:
+            bound, node = stack.pop()
+            if len(best) == k and bound >= -best[0][0]:
+                continue
+            dim, value, left, right, start, end = self.nodes[node]
+
+            if dim < 0:
+                idx = self.order[start:end]
+                dists = ((self.points[idx] - q) ** 2).sum(axis=1)
+                for dist, i in zip(dists.tolist(), idx.tolist()):
+                    if len(best) < k:
+                        heapq.heappush(best, (-dist, i))
+                    elif dist < -best[0][0]:
+                        heapq.heapreplace(best, (-dist, i))
+                continue
+
+            # Visit the side q falls on first; the other side only if the split plane is close enough
+            diff = float(q[dim]) - value
+            near, far = (left, right) if diff < 0 else (right, left)
+            stack.append((max(bound, diff * diff), far))
+            stack.append((bound, near))
+        return sorted((-dist, i) for dist, i in best)
+
+
+class SimilarTracks:
+    """'More like this track' search over standardized audio features"""
+
+    def __init__(self, tracks, features, use_tree=None, leaf_size=32):
+        self.tracks = tracks
+        self.mean = features.mean(axis=0)
+        self.std = features.std(axis=0)
+        self.std[self.std == 0] = 1
+        # z-scores so tempo (~120) doesn't drown out valence (0-1)
+        self.matrix = ((features - self.mean) / self.std).astype(np.float32)
+        self.sq_norms = (self.matrix ** 2).sum(axis=1)
+
+        if use_tree is None:
+            use_tree = len(tracks) > BRUTE_FORCE_LIMIT
+        self.tree = KDTree(self.matrix, leaf_size) if use_tree else None
+
+    def find(self, title):
+        """Row of the first track whose title matches (case insensitive), or None"""
+        title = title.strip().lower()
+        for i, track in enumerate(self.tracks):
+            if track["title"].lower() == title:
+                return i
+        return None
+
+    def brute_force(self, q, k):
+        """(squared distance, row) pairs from one BLAS matrix-vector product"""
+        dists = self.sq_norms - 2 * (self.matrix @ q) + float(q @ q)
+        k = min(k, len(dists))
+        top = np.argpartition(dists, k - 1)[:k]
+        top = top[np.argsort(dists[top], kind="stable")]
+        return [(max(float(dists[i]), 0.0), int(i)) for i in top]
+
+    def nearest(self, q, k=10):
+        q = np.asarray(q, dtype=np.float32)
+        return self.tree.query(q, k) if self.tree is not None else self.brute_force(q, k)
+
+    def more_like(self, row, k=10):
+        """k most similar (track, distance) pairs to the track at row, itself excluded"""
+        hits = self.nearest(self.matrix[row], k + 1)
+        return [(self.tracks[i], dist ** 0.5) for dist, i in hits if i != row][:k]
+
+
+if __name__ == "__main__":
+    import time
+
+    tracks, features = load_features()
+    similar = SimilarTracks(tracks, features)
+    row = similar.find("BIRDS OF A FEATHER")
+    print(f"More like {tracks[row]['title']} by {tracks[row]['artist']}:")
+    for track, dist in similar.more_like(row):
+        print(f"  {track['title']} by {track['artist']} ({dist:.2f})")
+
+    # Bigger catalogs: resample real tracks with a little noise so the shape of the data stays realistic
+    rng = np.random.default_rng(0)
+    queries = 200
+    print("\ntracks     build     brute force   kd-tree   (per query)")
+    for n in (len(tracks), 20_000, 200_000, 1_000_000):
+        fake = features[rng.integers(0, len(features), n)]
+        fake = fake + rng.normal(0, 0.05, fake.shape).astype(np.float32) * features.std(axis=0)
+
+        start = time.perf_counter()
+        catalog = SimilarTracks(tracks, fake, use_tree=True)
+        build = time.perf_counter() - start
+        picks = rng.integers(0, n, queries)
+
+        start = time.perf_counter()
+        brute = [catalog.brute_force(catalog.matrix[i], 10) for i in picks]
+        brute_time = (time.perf_counter() - start) / queries
+
+        start = time.perf_counter()
+        tree = [catalog.tree.query(catalog.matrix[i], 10) for i in picks]
+        tree_time = (time.perf_counter() - start) / queries
+
+        agree = np.mean([np.allclose([d for d, _ in a], [d for d, _ in b], atol=1e-3) for a, b in zip(brute, tree)])
+        print(f"{n:<10} {build:6.2f}s {brute_time * 1000:10.2f}ms {tree_time * 1000:8.2f}ms   "
+              f"{agree:.0%} same distances")
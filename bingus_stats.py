@@ -0,0 +1,120 @@
+import os
+import time
+
+# Off unless asked for; when off, timer() hands back one shared do-nothing object
+enabled = os.environ.get("BINGUS_STATS") == "1"
+
+# Latency buckets in seconds (upper bounds), Prometheus style
+BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+_counters = {}
+_timers = {}
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def reset():
+    _counters.clear()
+    _timers.clear()
+
+
+def count(name, n=1):
+    """Add n to a counter"""
+    if enabled:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def observe(name, seconds):
+    """Record one duration in a timer's histogram"""
+    timer_stats = _timers.get(name)
+    if timer_stats is None:
+        timer_stats = _timers[name] = {"count": 0, "sum": 0.0, "min": seconds, "max": seconds,
+                                       "buckets": [0] * (len(BUCKETS) + 1)}
+    timer_stats["count"] += 1
+    timer_stats["sum"] += seconds
+    timer_stats["min"] = min(timer_stats["min"], seconds)
+    timer_stats["max"] = max(timer_stats["max"], seconds)
+    for slot, bound in enumerate(BUCKETS):
+        if seconds <= bound:
+            break
+    else:
+        slot = len(BUCKETS)
+    timer_stats["buckets"][slot] += 1
+
+
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NoTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_TIMER = _NoTimer()
+
+
+def timer(name):
+    """with timer("score"): ... records how long the block took"""
+    return _Timer(name) if enabled else _NO_TIMER
+
+
+def stats():
+    """Snapshot of every counter and timer"""
+    return {
+        "counters": dict(_counters),
+        "timers": {name: dict(t, buckets=list(t["buckets"])) for name, t in _timers.items()},
+    }
+
+
+def prometheus_text(prefix="bingus"):
+    """Counters and timer histograms in the Prometheus text exposition format"""
+    lines = []
+    for name, value in sorted(_counters.items()):
+        lines.append(f"# TYPE {prefix}_{name}_total counter")
+        lines.append(f"{prefix}_{name}_total {value}")
+    for name, t in sorted(_timers.items()):
+        metric = f"{prefix}_{name}_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        running = 0
+        for bound, hits in zip(BUCKETS + ("+Inf",), t["buckets"]):
+            running += hits
+            lines.append(f'{metric}_bucket{{le="{bound}"}} {running}')
+        lines.append(f"{metric}_sum {t['sum']:.9f}")
+        lines.append(f"{metric}_count {t['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def summary():
+    """Human readable table of the timers"""
+    lines = [f"{'stage':<12} {'calls':>7} {'total':>10} {'mean':>10} {'max':>10}"]
+    for name, t in _timers.items():
+        lines.append(f"{name:<12} {t['count']:>7} {t['sum'] * 1000:>8.2f}ms "
+                     f"{t['sum'] / t['count'] * 1000:>8.3f}ms {t['max'] * 1000:>8.3f}ms")
+    for name, value in _counters.items():
+        lines.append(f"{name:<12} {value:>7}")
+    return "\n".join(lines)
@@ -0,0 +1,119 @@
+import heapq
+
+from bingus_catalog import ATTRIBUTES, WEIGHTS, match_score
+
+
+def threshold_top_k(index, request, k=10, stats=None):
+    """Fagin's threshold algorithm over a SongIndex's posting lists
+
+    Each requested value's posting list is a sorted list for that attribute: every song
+    on it scores the attribute's weight, every song off it scores 0. Lists are read
+    round robin and each new song is scored in full (random access). Reading stops once
+    no unseen song can beat the current k-th result: its best possible score is the sum
+    of the weights of the lists not yet used up. Returns (song, score) pairs ranked like
+    SongIndex.top_k, popularity tie-break included for a by_popularity index;
+    if stats is a dict, stats["touched"] counts the songs looked at.
+    """
+    rank = index.rank
+    # Each entry: [iterator over positions, weight, last position read]
+    lists = []
+    for attr in ATTRIBUTES:
+        posting = index.postings[attr].get(request.get(attr))
+        if posting:
+            lists.append([iter(posting), WEIGHTS[attr], -1])
+
+    seen = set()
+    best = []  # min-heap of (score, -rank, position): best[0] is the current k-th result
+    active = lists
+    while active:
+        still_active = []
+        for entry in active:
+            pos = next(entry[0], None)
+            if pos is None:
+                continue
+            entry[2] = pos
+            still_active.append(entry)
+            if pos in seen:
+                continue
+            seen.add(pos)
+            # Ranks are unique, so the position at the end never gets compared
+            item = (match_score(index.songs[pos], request), -(pos if rank is None else rank[pos]), pos)
+            if len(best) < k:
+                heapq.heappush(best, item)
+            elif item > best[0]:
+                heapq.heapreplace(best, item)
+        active = still_active
+
+        if len(best) == k and active:
+            # Summed in attribute order, so it compares exactly with real scores
+            threshold = 0
+            for entry in active:
+                threshold += entry[1]
+            kth_score, kth_rank = best[0][0], -best[0][1]
+            if kth_score > threshold:
+                break
+            # An unseen song can only tie by being on every active list past where we've read,
+            # so it sits later in the catalog than all of those and loses the tie. Popularity
+            # isn't in list order, so with ranks a tie could still win and reading goes on.
+            if rank is None and kth_score == threshold and max(entry[2] for entry in active) >= kth_rank:
+                break
+
+    if stats is not None:
+        stats["touched"] = len(seen)
+
+    results = [(index.songs[pos], score) for score, _, pos in sorted(best, reverse=True)]
+    # Fewer than k songs matched anything: fill up with 0-point songs like songs.sort would
+    if len(results) < k and rank is not None:
+        rest = heapq.nsmallest(k - len(results), (i for i in rank if i not in seen), key=rank.get)
+        results += [(index.songs[i], 0) for i in rest]
+    elif len(results) < k:
+        for i, song in enumerate(index.songs):
+            if len(results) >= k:
+                break
+            if song is not None and i not in seen:
+                results.append((song, 0))
+    return results
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from bingus_bench import attribute_rows, realistic_requests, realistic_songs
+    from bingus_index import SongIndex
+
+    rows = attribute_rows()
+    requests = realistic_requests(300, rows)
+    rng = random.Random(0)
+
+    print("songs       avg touched   median    % of catalog   TA time   full postings time")
+    for n in (10_000, 100_000, 1_000_000):
+        index = SongIndex(realistic_songs(n, rows))
+        touched = []
+
+        start = time.perf_counter()
+        for request in requests:
+            stats = {}
+            threshold_top_k(index, request, 10, stats)
+            touched.append(stats["touched"])
+        ta_time = (time.perf_counter() - start) / len(requests)
+
+        start = time.perf_counter()
+        for request in requests:
+            index.top_k(request)
+        full_time = (time.perf_counter() - start) / len(requests)
+
+        for request in rng.sample(requests, 50):
+            assert threshold_top_k(index, request) == index.top_k(request), request
+
+        touched.sort()
+        avg = sum(touched) / len(touched)
+        print(f"{n:<11} {avg:11.0f}   {touched[len(touched) // 2]:7d}   {avg / n:11.3%}   "
+              f"{ta_time * 1000:6.2f}ms   {full_time * 1000:8.2f}ms")
+
+    # With popularity breaking ties the answers must still match the index exactly
+    popular = [dict(song, popularity=rng.randint(0, 100)) for song in realistic_songs(100_000, rows)]
+    index = SongIndex(popular, by_popularity=True)
+    for request in requests:
+        assert threshold_top_k(index, request) == index.top_k(request), request
+    print(f"All {len(requests)} requests rank like SongIndex(by_popularity=True)")
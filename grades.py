@@ -1,17 +1,36 @@
 import json
 import os
 
-import match
 import matplotlib.pyplot as plt
 from datetime import datetime
-import statistics
+
+from grades_analytics import flat_grades, percentiles
+from grades_index import StudentIndex
+from grades_journal import GradeJournal
+from grades_sqlite import SQLiteGradebook, db_path_for, migrate_json
+from grades_stats import LETTERS, RunningStats
 
 
 class GradeTracker:
-    def __init__(self, data_file="grades.json"):
+    def __init__(self, data_file="grades.json", storage="journal"):
+        """storage: "journal" logs every change as it happens, "json" rewrites the file on save,
+        "sqlite" keeps the gradebook in a database next to data_file (grades.json -> grades.db)"""
         self.data_file = data_file
+        self.storage = storage
+        self.db_file = db_path_for(data_file)
+        self.journal = GradeJournal(data_file) if storage == "journal" else None
         self.grades = {}
+        self._stats = None
         self.load_grades()
+        # Name / list-number lookups for the in-memory storages (SQLite has its own indexes)
+        self.students = StudentIndex(self.grades) if storage != "sqlite" else None
+
+    @property
+    def stats(self):
+        """Running per-student and class aggregates, built the first time a view needs them"""
+        if self._stats is None:
+            self._stats = RunningStats(self.grades.items())
+        return self._stats
 
     def print_banner(self):
         """Display welcome banner with version and date"""
@@ -23,6 +42,22 @@ class GradeTracker:
 
     def save_grades(self):
         """Save grades to JSON file with backup"""
+        if self.storage == "sqlite":
+            # Every change was committed as it was made
+            print(f"💾 Grades saved to {self.db_file}")
+            return True
+        if self.journal is not None:
+            # Changes are already in the log; make them durable and fold the log in when it's big
+            try:
+                self.journal.sync()
+                if self.journal.needs_compaction():
+                    self.journal.compact(self.grades)
+                print(f"💾 Grades saved to {self.data_file}")
+                return True
+            except OSError as e:
+                print(f"❌ Error saving grades: {e}")
+                return False
+
         # Create backup of existing file
         if os.path.exists(self.data_file):
             backup_file = f"{self.data_file}.bak"
@@ -44,8 +79,22 @@ class GradeTracker:
 
     def load_grades(self):
         """Load grades from file or use empty dict if not found"""
+        if self.storage == "sqlite":
+            # A journaled gradebook may have no grades.json yet, only grades.json.log
+            if not os.path.exists(self.db_file) and (os.path.exists(self.data_file)
+                                                     or os.path.exists(f"{self.data_file}.log")):
+                print(f"📦 Moved {migrate_json(self.data_file, self.db_file)} students from {self.data_file} "
+                      f"into {self.db_file}")
+            self.grades = SQLiteGradebook(self.db_file)
+            print(f"✅ Opened {len(self.grades)} student records in {self.db_file}.")
+            return
+
         try:
-            if os.path.exists(self.data_file):
+            if self.journal is not None and (os.path.exists(self.data_file) or os.path.exists(self.journal.log_file)):
+                # Snapshot plus every change logged since it
+                self.grades = self.journal.load()
+                print(f"✅ Loaded {len(self.grades)} student records from file.")
+            elif self.journal is None and os.path.exists(self.data_file):
                 with open(self.data_file, "r") as f:
                     self.grades = json.load(f)
                 print(f"✅ Loaded {len(self.grades)} student records from file.")
@@ -78,9 +127,48 @@ class GradeTracker:
             print(f"⚠️ Student '{name}' already exists.")
             return
 
-        self.grades[name] = []
+        self._new_student(name)
         print(f"✅ Added student: {name}")
 
+    def _new_student(self, name):
+        self.grades[name] = []
+        if self.students is not None:
+            self.students.add(name)
+        if self.journal is not None:
+            self.journal.add_student(name)
+        if self._stats is not None:
+            self._stats.add_student(name)
+
+    def _record_grade(self, student, grade):
+        if self.storage == "sqlite":
+            self.grades.add_grade(student, grade)
+        else:
+            self.grades[student].append(grade)
+            if self.journal is not None:
+                self.journal.add_grade(student, grade)
+        # Stats last, so a write that fails can't leave them counting a grade that isn't stored
+        if self._stats is not None:
+            self._stats.add_grade(student, grade)
+
+    def _delete_student(self, student):
+        grades_list = self.grades[student]
+        del self.grades[student]
+        if self.students is not None:
+            self.students.remove(student)
+        if self.journal is not None:
+            self.journal.remove_student(student)
+        if self._stats is not None:
+            self._stats.remove_student(student, grades_list)
+
+    def _find_student(self, name):
+        """Stored name for what the user typed (a name in any case, or a list number), or None"""
+        # The in-memory storages answer from StudentIndex. SQLite finds names through its name_key
+        # index, but a list number is an OFFSET walk (see SQLiteGradebook.at)
+        lookup = self.grades if self.storage == "sqlite" else self.students
+        if name.isdigit() and 1 <= int(name) <= len(self.grades):
+            return lookup.at(int(name))
+        return lookup.find(name)
+
     def add_grade(self):
         """Add a grade for an existing student"""
         if not self.grades:
@@ -92,19 +180,7 @@ class GradeTracker:
 
         name = input("👤 Enter student name or number: ").strip()
 
-        # Handle numeric selection
-        try:
-            if name.isdigit() and 1 <= int(name) <= len(self.grades):
-                name = list(self.grades.keys())[int(name) - 1]
-        except (ValueError, IndexError):
-            pass
-
-        # Find student (case insensitive)
-        student_found = None
-        for student in self.grades:
-            if student.lower() == name.lower():
-                student_found = student
-                break
+        student_found = self._find_student(name)
 
         if student_found:
             try:
@@ -112,7 +188,7 @@ class GradeTracker:
                 grade = float(grade_input)
 
                 if 0 <= grade <= 100:
-                    self.grades[student_found].append(grade)
+                    self._record_grade(student_found, grade)
                     print(f"✅ Added grade {grade} for {student_found}")
 
                     # Ask if user wants to add more grades for this student
@@ -127,7 +203,7 @@ class GradeTracker:
             print(f"🚫 Student '{name}' not found.")
             create = input("Would you like to add this student? (y/n): ").lower()
             if create == 'y':
-                self.grades[name.title()] = []
+                self._new_student(name.title())
                 print(f"✅ Added student: {name.title()}")
                 more = input("Add grades for this student now? (y/n): ").lower()
                 if more == 'y':
@@ -146,7 +222,7 @@ class GradeTracker:
 
                 grade = float(grade_input)
                 if 0 <= grade <= 100:
-                    self.grades[student].append(grade)
+                    self._record_grade(student, grade)
                     count += 1
                 else:
                     print("⚠️ Grade must be between 0 and 100.")
@@ -178,12 +254,13 @@ class GradeTracker:
         print(f"{'Student':<20} | {'Grades':<25} | {'Avg':<5} | {'Min':<4} | {'Max':<4}")
         print("-" * 60)
 
+        stats = self.stats
         for student, grades_list in self.grades.items():
             if grades_list:
-                avg = statistics.mean(grades_list)
-                min_grade = min(grades_list)
-                max_grade = max(grades_list)
-                grades_display = ', '.join(f"{g:.1f}" for g in grades_list)
+                student_stats = stats.students[student]
+                avg, min_grade, max_grade = student_stats.mean, student_stats.min, student_stats.max
+                # Six grades are already more than the column shows
+                grades_display = ', '.join(f"{g:.1f}" for g in grades_list[:6])
 
                 # Truncate long grade lists for display
                 if len(grades_display) > 25:
@@ -195,19 +272,10 @@ class GradeTracker:
         print("=" * 60)
 
         # Show class statistics
-        all_grades = [g for grades in self.grades.values() for g in grades]
-        if all_grades:
-            class_avg = statistics.mean(all_grades)
-            print(f"\n📈 Class average: {class_avg:.1f}")
-
-            # Count grade distribution
-            a_count = sum(1 for g in all_grades if g >= 90)
-            b_count = sum(1 for g in all_grades if 80 <= g < 90)
-            c_count = sum(1 for g in all_grades if 70 <= g < 80)
-            d_count = sum(1 for g in all_grades if 60 <= g < 70)
-            f_count = sum(1 for g in all_grades if g < 60)
-
-            print(f"📊 Grade distribution: A: {a_count}, B: {b_count}, C: {c_count}, D: {d_count}, F: {f_count}")
+        if stats.overall.count:
+            print(f"\n📈 Class average: {stats.overall.mean:.1f}")
+            distribution = ", ".join(f"{grade}: {stats.letters[grade]}" for grade in LETTERS)
+            print(f"📊 Grade distribution: {distribution}")
 
     def visualize_grades(self):
         """Create visualization options"""
@@ -242,10 +310,10 @@ class GradeTracker:
         students = []
         averages = []
 
-        for student, grades_list in self.grades.items():
-            if grades_list:  # Only include students with grades
+        for student, student_stats in self.stats.students.items():
+            if student_stats.count:  # Only include students with grades
                 students.append(student)
-                averages.append(statistics.mean(grades_list))
+                averages.append(student_stats.mean)
 
         if not students:
             print("⚠️ No student grades to plot.")
@@ -276,23 +344,14 @@ class GradeTracker:
 
     def plot_distribution(self):
         """Plot grade distribution as pie chart"""
-        # Get all grades
-        all_grades = [g for grades in self.grades.values() for g in grades]
-
-        if not all_grades:
+        stats = self.stats
+        if not stats.overall.count:
             print("⚠️ No grades to plot.")
             return
 
-        # Count grade distribution
-        a_count = sum(1 for g in all_grades if g >= 90)
-        b_count = sum(1 for g in all_grades if 80 <= g < 90)
-        c_count = sum(1 for g in all_grades if 70 <= g < 80)
-        d_count = sum(1 for g in all_grades if 60 <= g < 70)
-        f_count = sum(1 for g in all_grades if g < 60)
-
         # Create pie chart
         labels = ['A (90-100)', 'B (80-89)', 'C (70-79)', 'D (60-69)', 'F (0-59)']
-        sizes = [a_count, b_count, c_count, d_count, f_count]
+        sizes = [stats.letters[grade] for grade in LETTERS]
         colors = ['green', 'lightgreen', 'yellow', 'orange', 'red']
         explode = (0.1, 0, 0, 0, 0)  # explode the 'A' slice
 
@@ -313,19 +372,7 @@ class GradeTracker:
 
         name = input("👤 Enter student name or number: ").strip()
 
-        # Handle numeric selection
-        try:
-            if name.isdigit() and 1 <= int(name) <= len(self.grades):
-                name = list(self.grades.keys())[int(name) - 1]
-        except (ValueError, IndexError):
-            pass
-
-        # Find student (case insensitive)
-        student_found = None
-        for student in self.grades:
-            if student.lower() == name.lower():
-                student_found = student
-                break
+        student_found = self._find_student(name)
 
         if not student_found:
             print(f"🚫 Student '{name}' not found.")
@@ -361,28 +408,14 @@ class GradeTracker:
 
     def plot_class_performance(self):
         """Plot class performance over time (average per assignment)"""
-        # Get maximum number of assignments for any student
-        max_assignments = max((len(grades) for grades in self.grades.values()), default=0)
+        # Average of every student's first grade, second grade, ... kept as running sums
+        assignment_avgs = self.stats.assignment_means()
+        max_assignments = len(assignment_avgs)
 
         if max_assignments == 0:
             print("⚠️ No grades to plot.")
             return
 
-        # Initialize lists to store averages
-        assignment_avgs = []
-
-        # Calculate average for each assignment number
-        for i in range(max_assignments):
-            grades_for_assignment = [
-                grades[i] for student, grades in self.grades.items()
-                if i < len(grades)
-            ]
-
-            if grades_for_assignment:
-                assignment_avgs.append(statistics.mean(grades_for_assignment))
-            else:
-                assignment_avgs.append(0)
-
         # Plot
         plt.figure(figsize=(10, 6))
         plt.plot(range(1, max_assignments + 1), assignment_avgs, 'o-',
@@ -417,24 +450,12 @@ class GradeTracker:
 
         name = input("👤 Enter student name or number to remove: ").strip()
 
-        # Handle numeric selection
-        try:
-            if name.isdigit() and 1 <= int(name) <= len(self.grades):
-                name = list(self.grades.keys())[int(name) - 1]
-        except (ValueError, IndexError):
-            pass
-
-        # Find student (case insensitive)
-        student_found = None
-        for student in self.grades:
-            if student.lower() == name.lower():
-                student_found = student
-                break
+        student_found = self._find_student(name)
 
         if student_found:
             confirm = input(f"❗ Are you sure you want to remove {student_found}? (y/n): ").lower()
             if confirm == 'y':
-                del self.grades[student_found]
+                self._delete_student(student_found)
                 print(f"✅ Removed student: {student_found}")
         else:
             print(f"🚫 Student '{name}' not found.")
@@ -455,14 +476,14 @@ class GradeTracker:
                 f.write("=" * 60 + "\n\n")
 
                 # Write student data
+                stats = self.stats
                 for student, grades_list in self.grades.items():
                     f.write(f"Student: {student}\n")
                     f.write("-" * 30 + "\n")
 
                     if grades_list:
-                        avg = statistics.mean(grades_list)
-                        min_grade = min(grades_list)
-                        max_grade = max(grades_list)
+                        student_stats = stats.students[student]
+                        avg, min_grade, max_grade = student_stats.mean, student_stats.min, student_stats.max
 
                         f.write(f"Grades: {', '.join(str(g) for g in grades_list)}\n")
                         f.write(f"Average: {avg:.2f}\n")
@@ -478,27 +499,23 @@ class GradeTracker:
                     f.write("\n")
 
                 # Write class summary
-                all_grades = [g for grades in self.grades.values() for g in grades]
-                if all_grades:
+                overall = stats.overall
+                if overall.count:
                     f.write("\nCLASS SUMMARY\n")
                     f.write("-" * 30 + "\n")
-                    f.write(f"Class Average: {statistics.mean(all_grades):.2f}\n")
-                    f.write(f"Highest Grade: {max(all_grades):.2f}\n")
-                    f.write(f"Lowest Grade: {min(all_grades):.2f}\n")
-
-                    # Count grade distribution
-                    a_count = sum(1 for g in all_grades if g >= 90)
-                    b_count = sum(1 for g in all_grades if 80 <= g < 90)
-                    c_count = sum(1 for g in all_grades if 70 <= g < 80)
-                    d_count = sum(1 for g in all_grades if 60 <= g < 70)
-                    f_count = sum(1 for g in all_grades if g < 60)
+                    f.write(f"Class Average: {overall.mean:.2f}\n")
+                    f.write(f"Highest Grade: {overall.max:.2f}\n")
+                    f.write(f"Lowest Grade: {overall.min:.2f}\n")
+                    # A flat array of the grades, not the padded matrix one long student list would blow up
+                    class_percentiles = percentiles(flat_grades(self.grades))
+                    f.write("Percentiles: " + ", ".join(f"{q}th {grade:.2f}" for q, grade in class_percentiles.items()) + "\n")
 
                     f.write("\nGrade Distribution:\n")
-                    f.write(f"A (90-100): {a_count}\n")
-                    f.write(f"B (80-89): {b_count}\n")
-                    f.write(f"C (70-79): {c_count}\n")
-                    f.write(f"D (60-69): {d_count}\n")
-                    f.write(f"F (0-59): {f_count}\n")
+                    f.write(f"A (90-100): {stats.letters['A']}\n")
+                    f.write(f"B (80-89): {stats.letters['B']}\n")
+                    f.write(f"C (70-79): {stats.letters['C']}\n")
+                    f.write(f"D (60-69): {stats.letters['D']}\n")
+                    f.write(f"F (0-59): {stats.letters['F']}\n")
 
             print(f"✅ Report saved as '{filename}'")
         except IOError as e:
@@ -548,14 +565,3 @@ class GradeTracker:
 if __name__ == "__main__":
     app = GradeTracker()
     app.run()
-
-
-
-
-
-
-name = input("Enter name: ")
-
-match name:
-    case "jared" | "john":
-        print("Hello")
\ No newline at end of file
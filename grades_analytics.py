@@ -0,0 +1,140 @@
+import itertools
+
+import numpy as np
+
+from grades_stats import LETTERS
+
+# np.digitize bins for F | D | C | B | A, same cut-offs as grades_stats.letter
+CUTOFFS = np.array([60.0, 70.0, 80.0, 90.0])
+
+
+def flat_grades(grades):
+    """Every grade in the gradebook as one float64 array, 8 bytes a grade with no padding
+    (a SQLiteGradebook is streamed straight into it)"""
+    return np.fromiter(itertools.chain.from_iterable(grades.values()), dtype=np.float64)
+
+
+def percentiles(values, q=(25, 50, 75, 90)):
+    """{q: grade} over an array of grades, {} if there are none"""
+    if not len(values):
+        return {}
+    return dict(zip(q, np.percentile(values, q).tolist()))
+
+
+def grade_matrix(grades):
+    """(names, students x assignments float64 matrix) with NaN where a student has fewer grades"""
+    names = list(grades)
+    lengths = np.fromiter((len(g) for g in grades.values()), dtype=np.intp, count=len(names))
+    flat = np.fromiter((g for grades_list in grades.values() for g in grades_list), dtype=np.float64,
+                       count=int(lengths.sum()))
+    width = int(lengths.max()) if len(names) else 0
+    matrix = np.full((len(names), width), np.nan)
+    # Row-major boolean assignment fills each row left to right, in the order flat was read
+    matrix[np.arange(width) < lengths[:, None]] = flat
+    return names, matrix
+
+
+class ClassAnalytics:
+    """Whole-class numbers from one padded matrix of the gradebook
+
+    Everything is a column or row reduction over the matrix (or over its non-NaN values), so
+    each statistic is one vectorized pass instead of a Python loop per student or assignment.
+    The matrix is as wide as the longest student's list, so for whole-class numbers alone
+    (percentiles) use flat_grades instead. Take a fresh one after the gradebook changes; for
+    numbers kept current edit by edit use grades_stats.RunningStats.
+    """
+
+    def __init__(self, grades):
+        self.names, self.matrix = grade_matrix(grades)
+        self.present = ~np.isnan(self.matrix)
+        self.values = self.matrix[self.present]
+        # NaN-free copies for the sums, cheaper than the nan* reductions and no empty-slice warnings
+        self.filled = np.where(self.present, self.matrix, 0.0)
+        self.counts = self.present.sum(axis=1)
+
+    def student_means(self):
+        """Mean of every student in list order, NaN for students without grades"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.filled.sum(axis=1) / self.counts
+
+    def student_extremes(self):
+        """(mins, maxs) per student, NaN for students without grades"""
+        mins = np.where(self.present, self.matrix, np.inf).min(axis=1, initial=np.inf)
+        maxs = np.where(self.present, self.matrix, -np.inf).max(axis=1, initial=-np.inf)
+        empty = self.counts == 0
+        mins[empty] = np.nan
+        maxs[empty] = np.nan
+        return mins, maxs
+
+    def assignment_means(self):
+        """Average of every student's first grade, second grade, ... (what plot_class_performance shows)"""
+        counts = self.present.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.filled.sum(axis=0) / counts
+
+    def class_mean(self):
+        return float(self.values.mean()) if self.values.size else None
+
+    def percentiles(self, q=(25, 50, 75, 90)):
+        """{q: grade} over every grade in the class"""
+        return percentiles(self.values, q)
+
+    def letter_counts(self):
+        """{"A": n, ..., "F": n}; one digitize + bincount instead of a scan per letter"""
+        bins = np.bincount(np.digitize(self.values, CUTOFFS), minlength=len(LETTERS))
+        # digitize numbers the bins F=0 .. A=4, LETTERS runs A .. F
+        return dict(zip(LETTERS, bins[::-1].tolist()))
+
+
+if __name__ == "__main__":
+    import random
+    import statistics
+    import time
+
+    rng = random.Random(0)
+    gradebook = {}
+    total = 0
+    while total < 1_000_000:
+        grades_list = [float(rng.randint(30, 100)) for _ in range(rng.randint(0, 20))]
+        gradebook[f"Student {len(gradebook)}"] = grades_list
+        total += len(grades_list)
+    print(f"{len(gradebook)} students / {total} grades")
+
+    def old_analytics():
+        # The loops view_grades, plot_class_performance and export_report ran before
+        means = [statistics.mean(g) for g in gradebook.values() if g]
+        all_grades = [g for grades in gradebook.values() for g in grades]
+        counts = [sum(1 for g in all_grades if g >= 90), sum(1 for g in all_grades if 80 <= g < 90),
+                  sum(1 for g in all_grades if 70 <= g < 80), sum(1 for g in all_grades if 60 <= g < 70),
+                  sum(1 for g in all_grades if g < 60)]
+        max_assignments = max((len(g) for g in gradebook.values()), default=0)
+        per_assignment = [statistics.mean([g[i] for g in gradebook.values() if i < len(g)])
+                          for i in range(max_assignments)]
+        return means, statistics.mean(all_grades), counts, per_assignment
+
+    start = time.perf_counter()
+    old = old_analytics()
+    old_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    analytics = ClassAnalytics(gradebook)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    means = analytics.student_means()
+    mins, maxs = analytics.student_extremes()
+    new = (means[analytics.counts > 0], analytics.class_mean(), list(analytics.letter_counts().values()),
+           analytics.assignment_means())
+    quartiles = analytics.percentiles()
+    new_time = time.perf_counter() - start
+
+    print(f"Python loops: {old_time * 1000:.0f}ms")
+    print(f"NumPy: {(build_time + new_time) * 1000:.0f}ms ({build_time * 1000:.0f}ms building the matrix, "
+          f"{new_time * 1000:.0f}ms for means, extremes, percentiles, letters and assignments)")
+    print(f"Percentiles: {quartiles}")
+
+    assert np.allclose(old[0], new[0]) and abs(old[1] - new[1]) < 1e-9
+    assert old[2] == new[2] and np.allclose(old[3], new[3])
+    assert percentiles(flat_grades(gradebook)) == quartiles
+    for row in np.flatnonzero(analytics.counts)[:1000]:
+        grades_list = gradebook[analytics.names[row]]
+        assert mins[row] == min(grades_list) and maxs[row] == max(grades_list)
@@ -0,0 +1,147 @@
+class StudentIndex:
+    """Case-insensitive name lookup and list-number lookup for a gradebook
+
+    by_key maps a casefolded name to every stored spelling of it (first added first), and
+    order is the list the menu numbers from. A removed student leaves a None hole in order,
+    and a Fenwick tree over the live slots turns a list number into its slot in O(log n),
+    so numbers stay right without shifting the list. Holes are squeezed out once they
+    outnumber the students, which keeps that O(n) pass amortized O(1) per removal.
+    """
+
+    def __init__(self, names=()):
+        self.by_key = {}
+        self.order = []
+        self.slot = {}  # name -> its position in order
+        self.holes = 0
+        self.tree = [0]  # Fenwick tree over order: 1 per live slot, 1-based
+        for name in names:
+            self.by_key.setdefault(name.casefold(), []).append(name)
+            self.slot[name] = len(self.order)
+            self.order.append(name)
+        self._rebuild()
+
+    def __len__(self):
+        return len(self.slot)
+
+    def _rebuild(self, capacity=0):
+        """Fresh tree sized for at least capacity slots, O(n)"""
+        size = 1
+        while size < max(capacity, len(self.order), 1):
+            size *= 2
+        tree = [0] * (size + 1)
+        for i, name in enumerate(self.order, 1):
+            if name is not None:
+                tree[i] = 1
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def _update(self, i, delta):
+        i += 1
+        tree = self.tree
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def add(self, name):
+        self.by_key.setdefault(name.casefold(), []).append(name)
+        self.slot[name] = len(self.order)
+        self.order.append(name)
+        if len(self.order) >= len(self.tree):
+            # Out of room: double the tree, amortized O(1) per add
+            self._rebuild(2 * len(self.order))
+        else:
+            self._update(len(self.order) - 1, 1)
+
+    def remove(self, name):
+        spellings = self.by_key[name.casefold()]
+        spellings.remove(name)
+        if not spellings:
+            del self.by_key[name.casefold()]
+        i = self.slot.pop(name)
+        self.order[i] = None
+        self._update(i, -1)
+        self.holes += 1
+        if self.holes > len(self.slot):
+            self.order = [name for name in self.order if name is not None]
+            self.slot = {name: i for i, name in enumerate(self.order)}
+            self.holes = 0
+            self._rebuild()
+
+    def find(self, name):
+        """Stored spelling of name in any case, or None"""
+        spellings = self.by_key.get(name.casefold())
+        return spellings[0] if spellings else None
+
+    def at(self, number):
+        """Student number (1-based, as list_students shows them), or None"""
+        if not 1 <= number <= len(self.slot):
+            return None
+        # Walk down the tree for the first slot with number live slots up to it
+        tree = self.tree
+        i = 0
+        step = len(tree) - 1  # a power of two
+        while step:
+            if i + step < len(tree) and tree[i + step] < number:
+                i += step
+                number -= tree[i]
+            step >>= 1
+        return self.order[i]
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    n = 100_000
+    grades = {f"Student {i}": [] for i in range(n)}
+    rng = random.Random(0)
+    picks = [rng.randrange(n) for _ in range(200)]
+
+    def old_find(name):
+        # What add_grade / plot_student_performance / remove_student used to do
+        if name.isdigit() and 1 <= int(name) <= len(grades):
+            name = list(grades.keys())[int(name) - 1]
+        for student in grades:
+            if student.lower() == name.lower():
+                return student
+        return None
+
+    start = time.perf_counter()
+    index = StudentIndex(grades)
+    print(f"Indexed {n} students in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    for label, queries in (("by name", [f"student {i}" for i in picks]), ("by number", [str(i + 1) for i in picks])):
+        start = time.perf_counter()
+        expected = [old_find(q) for q in queries]
+        old = (time.perf_counter() - start) / len(queries)
+
+        start = time.perf_counter()
+        got = [index.at(int(q)) if q.isdigit() else index.find(q) for q in queries]
+        new = (time.perf_counter() - start) / len(queries)
+        assert got == expected
+        print(f"{label:<10} scan {old * 1000:7.2f}ms   index {new * 1e6:6.2f}µs")
+
+    # Keeping it in sync: adds and removes are a dict operation and a tree update, the numbers stay right
+    start = time.perf_counter()
+    for i in picks:
+        name = f"Student {i}"
+        if name in grades:
+            del grades[name]
+            index.remove(name)
+        grades[f"New {i}"] = []
+        index.add(f"New {i}")
+    print(f"{2 * len(picks)} adds/removes: {(time.perf_counter() - start) / (2 * len(picks)) * 1e6:.2f}µs each")
+    assert [index.at(k) for k in range(1, len(grades) + 1, 997)] == list(grades)[::997]
+
+    # Remove a student, then pick one by number: no O(n) pass in between
+    start = time.perf_counter()
+    for _ in range(200):
+        name = index.at(rng.randint(1, len(index)))
+        del grades[name]
+        index.remove(name)
+        index.at(rng.randint(1, len(index)))
+    print(f"remove + numbered lookup: {(time.perf_counter() - start) / 200 * 1e6:.2f}µs")
+
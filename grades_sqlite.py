@@ -0,0 +1,230 @@
+import itertools
+import os
+import sqlite3
+from collections.abc import MutableMapping
+
+from grades_journal import GradeJournal
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    name_key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS students_name_key ON students (name_key);
+CREATE TABLE IF NOT EXISTS grades (
+    student_id INTEGER NOT NULL REFERENCES students (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    grade REAL NOT NULL,
+    PRIMARY KEY (student_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS grades_position ON grades (position);
+"""
+
+# Students per batch in bulk_insert; stays under the 999 variables older SQLite builds allow
+CHUNK = 900
+
+
+def name_key(name):
+    """Case-insensitive lookup key; casefold in Python because SQLite's lower() is ASCII-only"""
+    return name.casefold()
+
+
+class SQLiteGradebook(MutableMapping):
+    """{student: [grades]} stored in SQLite, read on demand instead of held in memory
+
+    Behaves like the dict GradeTracker used to keep (insertion order, grades[name] -> list),
+    but iterating streams rows from the database. Grades are appended with add_grade rather
+    than grades[name].append, since the list handed out is a copy.
+    """
+
+    def __init__(self, path="grades.db"):
+        self.path = path
+        # Autocommit: every single edit is its own transaction, the bulk paths open their own
+        self.db = sqlite3.connect(path, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        # With WAL, NORMAL only risks the last commits on power loss, never corruption
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("PRAGMA foreign_keys=ON")
+        self.db.executescript(SCHEMA)
+        self.count = self.db.execute("SELECT count(*) FROM students").fetchone()[0]
+
+    def _id(self, name):
+        row = self.db.execute("SELECT id FROM students WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise KeyError(name)
+        return row[0]
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for (name,) in self.db.execute("SELECT name FROM students ORDER BY id"):
+            yield name
+
+    def __contains__(self, name):
+        return self.db.execute("SELECT 1 FROM students WHERE name = ?", (name,)).fetchone() is not None
+
+    def __getitem__(self, name):
+        student_id = self._id(name)
+        return [grade for (grade,) in self.db.execute(
+            "SELECT grade FROM grades WHERE student_id = ? ORDER BY position", (student_id,))]
+
+    def __setitem__(self, name, grades):
+        """Add a student, or replace every grade of an existing one"""
+        self.db.execute("BEGIN")
+        try:
+            row = self.db.execute("SELECT id FROM students WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                student_id = self.db.execute("INSERT INTO students (name, name_key) VALUES (?, ?)",
+                                             (name, name_key(name))).lastrowid
+                self.count += 1
+            else:
+                student_id = row[0]
+                self.db.execute("DELETE FROM grades WHERE student_id = ?", (student_id,))
+            self.db.executemany("INSERT INTO grades VALUES (?, ?, ?)",
+                                ((student_id, i, grade) for i, grade in enumerate(grades)))
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+
+    def __delitem__(self, name):
+        # Grades go with the student (ON DELETE CASCADE)
+        if self.db.execute("DELETE FROM students WHERE name = ?", (name,)).rowcount == 0:
+            raise KeyError(name)
+        self.count -= 1
+
+    def items(self):
+        """(name, [grades]) in student order, streamed as one ordered join"""
+        rows = self.db.execute("SELECT s.name, g.grade FROM students s LEFT JOIN grades g ON g.student_id = s.id "
+                               "ORDER BY s.id, g.position")
+        for name, group in itertools.groupby(rows, key=lambda row: row[0]):
+            yield name, [grade for _, grade in group if grade is not None]
+
+    def values(self):
+        for _, grades in self.items():
+            yield grades
+
+    def add_grade(self, name, grade):
+        student_id = self._id(name)
+        self.db.execute("INSERT INTO grades SELECT ?, coalesce(max(position) + 1, 0), ? FROM grades "
+                        "WHERE student_id = ?", (student_id, grade, student_id))
+
+    def find(self, name):
+        """Stored spelling of a student, matched case-insensitively through the name_key index"""
+        row = self.db.execute("SELECT name FROM students WHERE name_key = ? ORDER BY id LIMIT 1",
+                              (name_key(name),)).fetchone()
+        return row[0] if row else None
+
+    def at(self, number):
+        """Name of the number-th student (1-based) in list order
+
+        O(number): OFFSET steps through the id index, about 1.8ms per 100k students skipped.
+        A dense position column would make this a lookup, but then every removal would have
+        to renumber all the students after it, so the cost stays with numbered picks.
+        """
+        row = self.db.execute("SELECT name FROM students ORDER BY id LIMIT 1 OFFSET ?", (number - 1,)).fetchone()
+        return row[0] if row else None
+
+    def bulk_insert(self, items):
+        """Add many (name, [grades]) pairs in one transaction, return how many students were new
+
+        Grades for a student that already exists (or shows up twice) go after the ones stored.
+        """
+        added = 0
+        self.db.execute("BEGIN")
+        try:
+            items = iter(items)
+            while True:
+                chunk = list(itertools.islice(items, CHUNK))
+                if not chunk:
+                    break
+                before = self.db.total_changes
+                self.db.executemany("INSERT OR IGNORE INTO students (name, name_key) VALUES (?, ?)",
+                                    ((name, name_key(name)) for name, _ in chunk))
+                added += self.db.total_changes - before
+                marks = ",".join("?" * len(chunk))
+                ids = dict(self.db.execute(f"SELECT name, id FROM students WHERE name IN ({marks})",
+                                           [name for name, _ in chunk]))
+                positions = dict(self.db.execute(f"SELECT student_id, max(position) + 1 FROM grades "
+                                                 f"WHERE student_id IN ({marks}) GROUP BY student_id",
+                                                 [ids[name] for name, _ in chunk]))
+                rows = []
+                for name, grades in chunk:
+                    student_id = ids[name]
+                    start = positions.get(student_id, 0)
+                    rows += [(student_id, start + i, grade) for i, grade in enumerate(grades)]
+                    positions[student_id] = start + len(grades)
+                self.db.executemany("INSERT INTO grades VALUES (?, ?, ?)", rows)
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        self.count += added
+        return added
+
+    def close(self):
+        self.db.close()
+
+
+def db_path_for(data_file):
+    """Database kept next to a gradebook file: grades.json -> grades.db, anything else gets .db added"""
+    if data_file.endswith(".json"):
+        return os.path.splitext(data_file)[0] + ".db"
+    return data_file + ".db"
+
+
+def migrate_json(json_path, db_path):
+    """Copy a grades.json gradebook into a SQLite database, return the number of students added
+
+    Reads it the way the journal storage does, snapshot plus grades.json.log, so changes that
+    were never compacted into grades.json come along too.
+    """
+    grades = GradeJournal(json_path).load()
+    gradebook = SQLiteGradebook(db_path)
+    try:
+        return gradebook.bulk_insert(grades.items())
+    finally:
+        gradebook.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    import random
+    import tempfile
+    import time
+
+    parser = argparse.ArgumentParser(description="Move a grades.json gradebook into SQLite")
+    parser.add_argument("json_file", nargs="?", help="gradebook to migrate, e.g. grades.json")
+    parser.add_argument("db_file", nargs="?", help="database to write (default: same name, .db)")
+    parser.add_argument("--benchmark", type=int, metavar="STUDENTS", help="time a synthetic gradebook instead")
+    args = parser.parse_args()
+
+    if args.json_file:
+        db_file = args.db_file or db_path_for(args.json_file)
+        print(f"✅ Migrated {migrate_json(args.json_file, db_file)} students from {args.json_file} to {db_file}")
+    else:
+        n = args.benchmark or 200_000
+        rng = random.Random(0)
+        path = os.path.join(tempfile.mkdtemp(), "grades.db")
+        gradebook = SQLiteGradebook(path)
+
+        start = time.perf_counter()
+        gradebook.bulk_insert((f"Student {i}", [float(rng.randint(40, 100)) for _ in range(5)]) for i in range(n))
+        print(f"Bulk-inserted {n} students x 5 grades in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        for i in range(0, n, n // 1000):
+            assert gradebook.find(f"sTUDENT {i}") == f"Student {i}"
+        print(f"Case-insensitive lookup: {(time.perf_counter() - start) / 1000 * 1e6:.0f}µs")
+
+        start = time.perf_counter()
+        for i in range(1000):
+            gradebook.add_grade(f"Student {i}", 77.0)
+        print(f"add_grade: {(time.perf_counter() - start) / 1000 * 1e6:.0f}µs")
+
+        start = time.perf_counter()
+        total = sum(len(grades) for _, grades in gradebook.items())
+        print(f"Streamed {total} grades in {time.perf_counter() - start:.1f}s")
+        gradebook.close()
@@ -0,0 +1,196 @@
+import heapq
+from collections import Counter
+
+LETTERS = ("A", "B", "C", "D", "F")
+
+
+def letter(score):
+    """A/B/C/D/F with the tracker's 90/80/70/60 cut-offs"""
+    return "A" if score >= 90 else "B" if score >= 80 else "C" if score >= 70 else "D" if score >= 60 else "F"
+
+
+class Aggregate:
+    """Count, sum, sum of squares, min and max of a stream of grades"""
+
+    __slots__ = ("count", "total", "squares", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.squares = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, grade):
+        self.count += 1
+        self.total += grade
+        self.squares += grade * grade
+        if self.min is None or grade < self.min:
+            self.min = grade
+        if self.max is None or grade > self.max:
+            self.max = grade
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    @property
+    def variance(self):
+        """Population variance"""
+        if not self.count:
+            return None
+        mean = self.total / self.count
+        return max(self.squares / self.count - mean * mean, 0.0)
+
+
+class RunningStats:
+    """Per-student and class-wide aggregates kept current as grades come and go
+
+    Adding a grade is O(1), or O(log v) the first time a value shows up (v distinct values).
+    Removing a student subtracts their grades from the class totals. The class min/max come
+    back from a min-heap and a max-heap of the values seen: entries whose value is gone are
+    only popped once they reach the top, so a removal costs O(log v) per stale entry and
+    never rescans the gradebook. Views read these instead of recomputing from every grade.
+    """
+
+    def __init__(self, grades=()):
+        """grades: (student, [grades]) pairs to start from, e.g. gradebook.items()"""
+        self.students = {}
+        self.overall = Aggregate()
+        self.letters = dict.fromkeys(LETTERS, 0)
+        self.values = Counter()
+        # Every distinct value since the last rebuild; values gone from self.values are stale
+        self.low = []
+        self.high = []  # negated, so heapq gives the largest
+        # Sum and count of the i-th grade of every student, for "class performance by assignment"
+        self.assignment_sums = []
+        self.assignment_counts = []
+        for student, grades_list in grades:
+            self.add_student(student)
+            for grade in grades_list:
+                self.add_grade(student, grade)
+
+    def add_student(self, student):
+        self.students[student] = Aggregate()
+
+    def add_grade(self, student, grade):
+        stats = self.students[student]
+        i = stats.count
+        stats.add(grade)
+        self.overall.add(grade)
+        self.letters[letter(grade)] += 1
+        self.values[grade] += 1
+        if self.values[grade] == 1:
+            heapq.heappush(self.low, grade)
+            heapq.heappush(self.high, -grade)
+        if i == len(self.assignment_sums):
+            self.assignment_sums.append(0.0)
+            self.assignment_counts.append(0)
+        self.assignment_sums[i] += grade
+        self.assignment_counts[i] += 1
+
+    def remove_student(self, student, grades_list):
+        """Take a student and their grades (as stored) out of every aggregate"""
+        del self.students[student]
+        overall = self.overall
+        for i, grade in enumerate(grades_list):
+            overall.count -= 1
+            overall.total -= grade
+            overall.squares -= grade * grade
+            self.letters[letter(grade)] -= 1
+            self.values[grade] -= 1
+            if not self.values[grade]:
+                del self.values[grade]
+            self.assignment_sums[i] -= grade
+            self.assignment_counts[i] -= 1
+
+        while self.assignment_counts and not self.assignment_counts[-1]:
+            self.assignment_counts.pop()
+            self.assignment_sums.pop()
+        if not overall.count:
+            # Exact zeros instead of whatever rounding the subtractions left behind
+            self.overall = Aggregate()
+            self.low, self.high = [], []
+            return
+        if max(len(self.low), len(self.high)) > 2 * len(self.values):
+            # Mostly stale: rebuild so the heaps stay O(distinct values) in size
+            self.low = list(self.values)
+            heapq.heapify(self.low)
+            self.high = [-value for value in self.values]
+            heapq.heapify(self.high)
+        if overall.min not in self.values or overall.max not in self.values:
+            while self.low[0] not in self.values:
+                heapq.heappop(self.low)
+            while -self.high[0] not in self.values:
+                heapq.heappop(self.high)
+            overall.min = self.low[0]
+            overall.max = -self.high[0]
+
+    def assignment_means(self):
+        return [total / count if count else 0 for total, count in zip(self.assignment_sums, self.assignment_counts)]
+
+
+if __name__ == "__main__":
+    import random
+    import statistics
+    import time
+
+    rng = random.Random(0)
+    gradebook = {f"Student {i}": [float(rng.randint(30, 100)) for _ in range(rng.randint(0, 20))]
+                 for i in range(100_000)}
+
+    def old_summary():
+        # What view_grades / export_report / plot_distribution computed on every call
+        per_student = {s: (statistics.mean(g), min(g), max(g)) for s, g in gradebook.items() if g}
+        all_grades = [g for grades in gradebook.values() for g in grades]
+        counts = [sum(1 for g in all_grades if g >= 90), sum(1 for g in all_grades if 80 <= g < 90),
+                  sum(1 for g in all_grades if 70 <= g < 80), sum(1 for g in all_grades if 60 <= g < 70),
+                  sum(1 for g in all_grades if g < 60)]
+        return per_student, statistics.mean(all_grades), counts
+
+    def new_summary():
+        per_student = {s: (a.mean, a.min, a.max) for s, a in stats.students.items() if a.count}
+        return per_student, stats.overall.mean, [stats.letters[k] for k in LETTERS]
+
+    start = time.perf_counter()
+    stats = RunningStats(gradebook.items())
+    total = stats.overall.count
+    print(f"Built stats for {len(gradebook)} students / {total} grades in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    old = old_summary()
+    old_time = time.perf_counter() - start
+    start = time.perf_counter()
+    new = new_summary()
+    new_time = time.perf_counter() - start
+    print(f"Summary: recomputed {old_time * 1000:.0f}ms, running {new_time * 1000:.0f}ms")
+    assert old[2] == new[2] and abs(old[1] - new[1]) < 1e-9
+    assert all(abs(old[0][s][0] - new[0][s][0]) < 1e-9 and old[0][s][1:] == new[0][s][1:] for s in old[0])
+
+    start = time.perf_counter()
+    for i in range(1000):
+        name = f"Student {i}"
+        stats.remove_student(name, gradebook.pop(name))
+        gradebook[f"New {i}"] = []
+        stats.add_student(f"New {i}")
+        for _ in range(10):
+            grade = float(rng.randint(30, 100))
+            gradebook[f"New {i}"].append(grade)
+            stats.add_grade(f"New {i}", grade)
+    print(f"1000 students swapped (10k grades): {(time.perf_counter() - start) * 1000:.0f}ms")
+    old = old_summary()
+    assert old[2] == [stats.letters[k] for k in LETTERS] and abs(old[1] - stats.overall.mean) < 1e-9
+
+    # Remove students lowest grade first, so the class min keeps moving: the heaps must follow
+    for student, grades_list in gradebook.items():
+        grades_list.append(rng.uniform(0, 100))
+        stats.add_grade(student, grades_list[-1])
+    order = sorted(gradebook, key=lambda s: min(gradebook[s]))
+    start = time.perf_counter()
+    for name in order[:-1000]:
+        stats.remove_student(name, gradebook.pop(name))
+    elapsed = time.perf_counter() - start
+    print(f"{len(order) - 1000} removals, lowest first: {elapsed / (len(order) - 1000) * 1e6:.1f}µs each")
+    all_grades = [g for grades in gradebook.values() for g in grades]
+    assert (stats.overall.min, stats.overall.max) == (min(all_grades), max(all_grades))
+    assert len(stats.low) <= 2 * len(stats.values)
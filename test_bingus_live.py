@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from bingus_catalog import ATTRIBUTES, load_songs
+from bingus_index import SongIndex
+from bingus_live import LiveCatalog
+from bingus_numpy import VectorScorer
+
+
+def requests_for(songs, rng, count=200):
+    """Random requests over the catalog's values, plus values nobody has"""
+    values = {attr: sorted({song[attr] for song in songs}) + ["nope"] for attr in ATTRIBUTES}
+    return [{attr: rng.choice(values[attr]) for attr in ATTRIBUTES} for _ in range(count)]
+
+
+def check_against_rebuild(live, rng, by_popularity):
+    remaining = [song for song in live.songs if song is not None]
+    index = SongIndex(remaining, by_popularity)
+    scorer = VectorScorer(remaining, by_popularity)
+    for request in requests_for(remaining, rng):
+        expected = index.top_k(request)
+        assert live.top_k(request) == expected, request
+        assert live.index.top_k(request) == expected, request
+        assert scorer.top_k(request) == [(song, float(score)) for song, score in expected], request
+        assert [song for song, _ in live.scorer.top_k(request)] == [song for song, _ in expected], request
+
+
+@pytest.fixture(scope="module")
+def songs():
+    rng = random.Random(7)
+    # Popularity on every song so by_popularity has ties to break, and a new genre mid-stream
+    catalog = [dict(song, popularity=rng.randint(0, 100)) for song in load_songs()]
+    return catalog + [dict(song, genre="jazz", title=song["title"] + " (jazz)") for song in catalog[:30]]
+
+
+@pytest.mark.parametrize("by_popularity", [False, True])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_random_adds_and_removes_match_a_rebuild(songs, by_popularity, seed):
+    rng = random.Random(seed)
+    start = rng.randint(100, 300)
+    live = LiveCatalog(songs[:start], by_popularity=by_popularity)
+    for song in rng.sample(songs[start:], 200):
+        live.add(dict(song))
+        if rng.random() < 0.4:
+            live.remove(rng.choice([i for i, s in enumerate(live.songs) if s is not None]))
+    check_against_rebuild(live, rng, by_popularity)
+
+
+@pytest.mark.parametrize("by_popularity", [False, True])
+def test_small_catalog_grows_and_shrinks(songs, by_popularity):
+    # Fewer songs than the cache depth: every list holds the whole catalog, 0-point songs included
+    rng = random.Random(3)
+    live = LiveCatalog(songs[:5], by_popularity=by_popularity)
+    for song in songs[5:40]:
+        live.add(dict(song))
+    check_against_rebuild(live, rng, by_popularity)
+
+    alive = [i for i, s in enumerate(live.songs) if s is not None]
+    rng.shuffle(alive)
+    for i in alive[:-3]:
+        live.remove(i)
+    check_against_rebuild(live, rng, by_popularity)
+    assert len(live) == 3
+
+
+def test_removing_twice_raises(songs):
+    live = LiveCatalog(songs[:50])
+    live.remove(0)
+    with pytest.raises(KeyError):
+        live.remove(0)
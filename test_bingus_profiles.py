@@ -0,0 +1,44 @@
+import gc
+import weakref
+
+from bingus_catalog import load_songs
+from bingus_live import LiveScorer
+from bingus_numpy import VectorScorer
+from bingus_profiles import ScoringProfile, plan_for
+
+REQUEST = {"genre": "jazz", "tempo": "fast", "mood": "happy", "style": "normal"}
+
+
+def test_plans_are_per_profile_object():
+    scorer = VectorScorer(load_songs())
+    heavy = ScoringProfile("mine", weights={"genre": 5})
+    light = ScoringProfile("mine", weights={"genre": 0.1})
+    assert plan_for(heavy, scorer) is plan_for(heavy, scorer)
+    assert plan_for(heavy, scorer) is not plan_for(light, scorer)
+    assert plan_for("classic", scorer) is plan_for("classic", scorer)
+
+
+def test_plans_go_with_their_scorer():
+    scorer = VectorScorer(load_songs())
+    plan_for("relaxed", scorer).top_k(REQUEST)
+    ref = weakref.ref(scorer)
+    del scorer
+    gc.collect()
+    assert ref() is None
+
+
+def test_plan_follows_a_growing_scorer():
+    songs = [dict(song, popularity=i % 50) for i, song in enumerate(load_songs())]
+    live = LiveScorer(songs[:100])
+    first = plan_for("popular", live)
+    first.top_k(REQUEST)
+
+    # A genre the plan has never seen, on the most popular song
+    jazz = dict(songs[0], genre="jazz", popularity=100)
+    for song in songs[100:200] + [jazz]:
+        live.songs.append(song)
+        live.add(song)
+    plan = plan_for("popular", live)
+    assert plan is not first
+    assert plan.top_k(REQUEST)[0][0] is jazz
+    assert plan_for("popular", live) is plan
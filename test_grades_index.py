@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from grades_index import StudentIndex
+
+
+def check_against_list(index, names):
+    """Every list number and every name must resolve like a plain list would"""
+    assert len(index) == len(names)
+    assert [index.at(k) for k in range(1, len(names) + 1)] == names
+    assert index.at(0) is None and index.at(len(names) + 1) is None
+    for name in names:
+        assert index.find(name.upper()) is not None
+        assert index.find(name.swapcase()).casefold() == name.casefold()
+
+
+@pytest.mark.parametrize("remove_rate", [0.2, 0.45, 0.6])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_random_adds_and_removes_match_a_list(remove_rate, seed):
+    rng = random.Random(seed)
+    start = [f"Student {i}" for i in range(rng.randint(0, 50))]
+    index, names = StudentIndex(start), list(start)
+    for step in range(3000):
+        if names and rng.random() < remove_rate:
+            index.remove(names.pop(rng.randrange(len(names))))
+        else:
+            names.append(f"S{step}")
+            index.add(names[-1])
+        if names:
+            k = rng.randint(1, len(names))
+            assert index.at(k) == names[k - 1]
+        if step % 500 == 0:
+            check_against_list(index, names)
+    check_against_list(index, names)
+
+
+def test_empty_out_and_refill():
+    names = [f"Student {i}" for i in range(100)]
+    index = StudentIndex(names)
+    for name in names:
+        index.remove(name)
+    check_against_list(index, [])
+    index.add("Back Again")
+    check_against_list(index, ["Back Again"])
+
+
+def test_spellings_of_one_name():
+    index = StudentIndex(["Ana", "ANA", "Bo"])
+    assert index.find("ana") == "Ana"
+    index.remove("Ana")
+    assert index.find("ana") == "ANA"
+    index.remove("ANA")
+    assert index.find("ana") is None
+    check_against_list(index, ["Bo"])
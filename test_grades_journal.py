@@ -0,0 +1,141 @@
+import json
+import os
+import random
+
+import pytest
+
+from grades_journal import GradeJournal
+
+
+def random_edits(journal, grades, rng, count=300):
+    """Random adds, grades and removes, applied to both the journal and a plain dict"""
+    for _ in range(count):
+        roll = rng.random()
+        if grades and roll < 0.1:
+            name = rng.choice(list(grades))
+            del grades[name]
+            journal.remove_student(name)
+        elif grades and roll < 0.7:
+            name = rng.choice(list(grades))
+            grade = float(rng.randint(0, 100))
+            grades[name].append(grade)
+            journal.add_grade(name, grade)
+        else:
+            # New names only: the tracker never adds a student that already exists
+            name = f"Student {len(grades)}-{rng.randrange(10 ** 9)}"
+            grades[name] = []
+            journal.add_student(name)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "grades.json")
+
+
+@pytest.fixture
+def journaled(path):
+    """A snapshot with a log on top of it, and the gradebook they add up to"""
+    rng = random.Random(0)
+    grades = {}
+    journal = GradeJournal(path)
+    random_edits(journal, grades, rng)
+    journal.compact(grades)
+    random_edits(journal, grades, rng)
+    journal.close()
+    return grades
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_replay_matches_the_edits(path, seed):
+    rng = random.Random(seed)
+    grades = {}
+    journal = GradeJournal(path, sync_every=7)
+    random_edits(journal, grades, rng)
+    if seed:
+        journal.compact(grades)
+        random_edits(journal, grades, rng)
+    journal.close()
+    assert GradeJournal(path).load() == grades
+
+
+def test_records_are_readable_before_any_fsync(path):
+    journal = GradeJournal(path, sync_every=1000, sync_interval=1000)
+    journal.add_student("Late Student")
+    journal.add_grade("Late Student", 88.0)
+    assert journal.pending == 2
+    assert GradeJournal(path).load() == {"Late Student": [88.0]}
+    journal.close()
+
+
+@pytest.mark.parametrize("tail", ['["g","Student 0",9', '["g","Student 0",9]x\n'])
+def test_torn_last_line_is_cut(path, journaled, tail):
+    journal = GradeJournal(path)
+    with open(journal.log_file, "a") as f:
+        f.write(tail)
+    size = os.path.getsize(journal.log_file) - len(tail)
+    assert journal.load() == journaled
+    assert os.path.getsize(journal.log_file) == size
+    assert GradeJournal(path).load() == journaled
+
+
+def test_bad_middle_line_is_skipped_with_a_warning(path, journaled, capsys):
+    journal = GradeJournal(path)
+    journal.load()
+    name = next(iter(journaled))
+    journal.add_grade(name, 50.0)
+    journal._open().write("not json\n\n")
+    journal.add_grade(name, 60.0)
+    journal.close()
+    journaled[name] += [50.0, 60.0]
+
+    size = os.path.getsize(journal.log_file)
+    assert GradeJournal(path).load() == journaled
+    assert "Skipped 1 unreadable record" in capsys.readouterr().out
+    # Left in the file, the records after it are still needed
+    assert os.path.getsize(journal.log_file) == size
+    assert GradeJournal(path).load() == journaled
+
+
+def test_crash_while_writing_the_new_snapshot(path, journaled):
+    journal = GradeJournal(path)
+    with open(journal.tmp_file, "w") as f:
+        f.write('{"half a')
+    assert GradeJournal(path).load() == journaled
+    assert not os.path.exists(journal.tmp_file)
+
+
+def test_crash_after_moving_the_log_aside(path, journaled):
+    # Snapshot written to .tmp and the log renamed to .log.old, but the swap never happened
+    journal = GradeJournal(path)
+    with open(journal.tmp_file, "w") as f:
+        json.dump(journaled, f)
+    os.replace(journal.log_file, journal.old_log_file)
+
+    assert journal.load() == journaled
+    assert os.path.exists(journal.log_file)
+    assert not os.path.exists(journal.old_log_file) and not os.path.exists(journal.tmp_file)
+    assert GradeJournal(path).load() == journaled
+
+
+def test_crash_after_the_snapshot_swap(path, journaled):
+    # New snapshot in place, only the old log is left to delete
+    journal = GradeJournal(path)
+    with open(journal.tmp_file, "w") as f:
+        json.dump(journaled, f)
+    os.replace(journal.log_file, journal.old_log_file)
+    os.replace(journal.tmp_file, path)
+
+    assert journal.load() == journaled
+    assert journal.records == 0
+    assert not os.path.exists(journal.old_log_file)
+    assert GradeJournal(path).load() == journaled
+
+
+def test_compaction_folds_the_log_in(path, journaled):
+    journal = GradeJournal(path, compact_every=10)
+    assert journal.load() == journaled
+    assert journal.needs_compaction()
+    journal.compact(journaled)
+    assert not os.path.exists(journal.log_file) and journal.records == 0
+    with open(path) as f:
+        assert json.load(f) == journaled
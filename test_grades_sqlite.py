@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from grades_journal import GradeJournal
+from grades_sqlite import SQLiteGradebook, db_path_for, migrate_json
+
+
+def journaled_gradebook(path, students=50):
+    """Students added through the journal only, so there's a .log but no snapshot yet"""
+    journal = GradeJournal(str(path))
+    grades = {}
+    for i in range(students):
+        name = f"Student {i}"
+        grades[name] = []
+        journal.add_student(name)
+        for grade in range(i % 4):
+            grades[name].append(float(60 + grade))
+            journal.add_grade(name, float(60 + grade))
+    journal.remove_student("Student 0")
+    del grades["Student 0"]
+    journal.close()
+    return grades
+
+
+def test_migrate_replays_the_journal(tmp_path):
+    path = tmp_path / "grades.json"
+    grades = journaled_gradebook(path)
+    assert not path.exists() and os.path.exists(f"{path}.log")
+
+    db_path = db_path_for(str(path))
+    assert migrate_json(str(path), db_path) == len(grades)
+    gradebook = SQLiteGradebook(db_path)
+    assert dict(gradebook.items()) == grades
+    gradebook.close()
+
+
+def test_migrate_reads_snapshot_and_log(tmp_path):
+    path = tmp_path / "grades.json"
+    grades = journaled_gradebook(path)
+    journal = GradeJournal(str(path))
+    journal.load()
+    journal.compact(grades)
+    journal.add_student("Late Student")
+    journal.add_grade("Late Student", 88.0)
+    journal.close()
+    grades["Late Student"] = [88.0]
+
+    db_path = db_path_for(str(path))
+    migrate_json(str(path), db_path)
+    gradebook = SQLiteGradebook(db_path)
+    assert dict(gradebook.items()) == grades
+    gradebook.close()
+
+
+def test_tracker_switching_to_sqlite_keeps_journaled_students(tmp_path):
+    pytest.importorskip("matplotlib")
+    from grades import GradeTracker
+
+    path = tmp_path / "grades.json"
+    tracker = GradeTracker(str(path))
+    for i in range(20):
+        tracker._new_student(f"Student {i}")
+        tracker._record_grade(f"Student {i}", float(50 + i))
+    tracker.journal.close()
+
+    tracker = GradeTracker(str(path), storage="sqlite")
+    assert len(tracker.grades) == 20
+    assert tracker.grades["Student 7"] == [57.0]
+
+
+def test_db_path_never_reuses_the_data_file():
+    assert db_path_for("grades.json") == "grades.db"
+    assert db_path_for("grades") == "grades.db"
+    assert db_path_for("grades.db") == "grades.db.db"
+    assert db_path_for("marks.txt") == "marks.txt.db"
@@ -0,0 +1,83 @@
+import random
+import statistics
+
+import pytest
+
+from grades_stats import LETTERS, RunningStats, letter
+
+
+def check_against_recompute(stats, gradebook):
+    """Every aggregate must equal what a fresh pass over the gradebook gives"""
+    all_grades = [g for grades in gradebook.values() for g in grades]
+    overall = stats.overall
+    assert overall.count == len(all_grades)
+    if all_grades:
+        assert (overall.min, overall.max) == (min(all_grades), max(all_grades))
+        assert overall.mean == pytest.approx(statistics.fmean(all_grades))
+        assert overall.variance == pytest.approx(statistics.pvariance(all_grades), abs=1e-6)
+    else:
+        assert (overall.min, overall.max, overall.mean) == (None, None, None)
+    assert [stats.letters[k] for k in LETTERS] == [sum(letter(g) == k for g in all_grades) for k in LETTERS]
+
+    assert stats.students.keys() == gradebook.keys()
+    for student, grades in gradebook.items():
+        aggregate = stats.students[student]
+        assert aggregate.count == len(grades)
+        if grades:
+            assert (aggregate.min, aggregate.max) == (min(grades), max(grades))
+            assert aggregate.mean == pytest.approx(statistics.fmean(grades))
+
+    columns = max((len(g) for g in gradebook.values()), default=0)
+    expected = [statistics.fmean([g[i] for g in gradebook.values() if len(g) > i]) for i in range(columns)]
+    assert stats.assignment_means() == pytest.approx(expected)
+    # Stale heap entries never pile up past the rebuild point
+    assert len(stats.low) <= 2 * len(stats.values) and len(stats.high) <= 2 * len(stats.values)
+
+
+def grade_source(rng, kind):
+    if kind == "whole":
+        # Few distinct values: the same value keeps leaving and coming back
+        return lambda: float(rng.randint(30, 100))
+    return lambda: round(rng.uniform(0, 100), 2)
+
+
+@pytest.mark.parametrize("kind", ["whole", "fractional"])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_random_changes_match_a_recompute(kind, seed):
+    rng = random.Random(seed)
+    grade = grade_source(rng, kind)
+    gradebook = {f"Student {i}": [grade() for _ in range(rng.randint(0, 8))] for i in range(50)}
+    stats = RunningStats(gradebook.items())
+    check_against_recompute(stats, gradebook)
+
+    for step in range(2000):
+        roll = rng.random()
+        if gradebook and roll < 0.3:
+            name = rng.choice(list(gradebook))
+            stats.remove_student(name, gradebook.pop(name))
+        elif gradebook and roll < 0.8:
+            name = rng.choice(list(gradebook))
+            gradebook[name].append(grade())
+            stats.add_grade(name, gradebook[name][-1])
+        else:
+            name = f"New {step}"
+            gradebook[name] = []
+            stats.add_student(name)
+        if step % 100 == 0:
+            check_against_recompute(stats, gradebook)
+    check_against_recompute(stats, gradebook)
+
+
+@pytest.mark.parametrize("extreme", ["lowest", "highest"])
+def test_removing_the_extremes_first(extreme):
+    # Every removal takes out the current min (or max), so each one has stale entries to pop
+    rng = random.Random(5)
+    gradebook = {f"Student {i}": [round(rng.uniform(0, 100), 2) for _ in range(3)] for i in range(300)}
+    stats = RunningStats(gradebook.items())
+    order = sorted(gradebook, key=lambda s: min(gradebook[s]) if extreme == "lowest" else -max(gradebook[s]))
+    for i, name in enumerate(order):
+        stats.remove_student(name, gradebook.pop(name))
+        if i % 25 == 0:
+            check_against_recompute(stats, gradebook)
+    check_against_recompute(stats, gradebook)
+    assert stats.low == [] and stats.high == []